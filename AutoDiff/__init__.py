@@ -2,7 +2,12 @@ from .node import Node
 from .forward import Forward
 from .rnode import RNode
 from .reverse import Reverse
+from .hessian import Hessian
+from .tape import Tape, TNode
+from .compiled import compile, Compiled
+from .sparse import SparseForward, IndexSet, SparseTangent
+from .tangent import SmallTangent
 from . import optim
 from . import graphvis
 
-__all__ = [Node, Forward, Reverse, RNode, optim, graphvis]
+__all__ = [Node, Forward, Reverse, RNode, Hessian, Tape, TNode, compile, Compiled, SparseForward, IndexSet, SparseTangent, SmallTangent, optim, graphvis]
@@ -0,0 +1,148 @@
+import numpy as np
+from .tape import Tape, TNode
+from .reverse import Reverse
+
+class Compiled:
+    r"""
+    A function traced once on a :py:class:`AutoDiff.tape.Tape` and replayed at new inputs.
+    The first evaluation runs ``f`` on :py:class:`AutoDiff.tape.TNode` objects and records its
+    operations. Later evaluations replay the recorded operations with
+    :py:meth:`AutoDiff.tape.Tape.replay`, which builds no node objects and does not call ``f``.
+    Comparisons between TNodes are recorded on the tape; when one of them gives a different
+    result at the new inputs, ``f`` would take another branch, so it is traced again.
+    Branches on anything else than TNode comparisons (e.g. on :code:`x.val`) cannot be detected.
+
+    :param f: A callable function object, the :math:`f: \mathbb{R}^m \mapsto \mathbb{R}^n` function
+    :type f: function object
+
+    :param n_inputs: The number of inputs :math:`m` of ``f``
+    :type n_inputs: integer
+
+    :ivar n_traces: The number of times ``f`` has been traced
+    :vartype n_traces: integer
+
+    >>> from AutoDiff import compile
+    >>> def f(x, y):
+    >>>     return x * y + np.sin(x)
+    >>> g = compile(f, 2)
+    >>> g(1, 2)
+    2.8414709848078967
+    >>> g.grad(1, 2)
+    (2.8414709848078967, array([2.54030231, 1.        ]))
+    >>> g.grad(2, 3)
+    (6.909297426825682, array([2.58385316, 2.        ]))
+    >>> g.n_traces
+    1
+    """
+
+    def __init__(self, f: callable, n_inputs):
+        self.f = f
+        self.n_inputs = n_inputs
+        self.n_traces = 0
+        self.tape = None
+        self.outputs = None
+        self.vector = False
+        self.variables = None
+
+    def __str__(self):
+        """Print useful information for users.
+
+        :return: A string containing useful information of the Compiled object.
+        :rtype: string
+        """
+        return f'Compiled: {self.n_inputs} input(s), traced {self.n_traces} time(s).'
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing useful information of the Compiled object.
+        :rtype: string
+        """
+        return f'A Compiled object with {self.n_inputs} input(s), traced {self.n_traces} time(s), and tape of ({self.tape}).'
+
+    def trace(self, *variables):
+        """Run ``f`` at ``variables`` and record its operations on a new tape.
+
+        :param variables: The input for variables of function ``f``
+        :type variables: integer or float or list of integers or floats
+
+        :return: The values of the outputs
+        :rtype: list of integers or floats
+        """
+        tape = Tape()
+        nodes = [tape.variable(var) for var in variables]
+        output = self.f(*nodes)
+        self.vector = isinstance(output, list)
+        outputs = output if self.vector else [output]
+        outputs = [o if isinstance(o, TNode) else tape.constant(o) for o in outputs]
+        self.tape = tape
+        self.variables = [var.index for var in nodes]
+        self.outputs = [o.index for o in outputs]
+        self.n_traces += 1
+        return [o.val for o in outputs]
+
+    def _evaluate(self, variables):
+        """Helper function that replays the tape at ``variables``, tracing ``f`` again when there is
+        no tape yet or when a recorded comparison changes its result.
+
+        :return: The values of the outputs
+        :rtype: list of integers or floats
+        """
+        if len(variables) != self.n_inputs:
+            raise ValueError(f'Expected {self.n_inputs} inputs, got {len(variables)}')
+        if self.tape is not None:
+            values = self.tape.replay(variables)
+            if values is not None:
+                return [values[i] for i in self.outputs]
+        return self.trace(*variables)
+
+    def __call__(self, *variables):
+        """Evaluate ``f`` at ``variables``.
+
+        :param variables: The input for variables of function ``f``
+        :type variables: integer or float or list of integers or floats
+        :raises ValueError: The number of inputs is not ``n_inputs``.
+
+        :return: function evaluation at ``variables``, shaped as :py:attr:`AutoDiff.reverse.Reverse.val`
+        :rtype: integer or float or numpy array
+        """
+        values = self._evaluate(variables)
+        return np.array(values) if self.vector else values[0]
+
+    def grad(self, *variables):
+        r"""Evaluate ``f`` and its Jacobian at ``variables`` with a reverse sweep over the replayed tape.
+
+        :param variables: The input for variables of function ``f``
+        :type variables: integer or float or list of integers or floats
+        :raises ValueError: The number of inputs is not ``n_inputs``.
+
+        :return: function evaluation at ``variables`` and Jacobian
+            i.e. :math:`\frac{\partial f(\text{variables})}{\partial \text{variables}}`,
+            shaped as in :py:class:`AutoDiff.reverse.Reverse`
+        :rtype: tuple
+        """
+        values = self._evaluate(variables)
+        ders = np.zeros((len(self.outputs), self.n_inputs))
+        # map each distinct output entry to the Jacobian rows it fills
+        output_rows = {}
+        for k, o in enumerate(self.outputs):
+            output_rows.setdefault(o, []).append(k)
+        for o, rows in output_rows.items():
+            adjoint = self.tape.backward(o)
+            ders[rows] = [adjoint[i] if i <= o else 0. for i in self.variables]
+        return Reverse._stack(values, ders, self.vector)
+
+
+def compile(f: callable, n_inputs):
+    r"""
+    Trace ``f`` once and replay it at new inputs, see :py:class:`AutoDiff.compiled.Compiled`.
+
+    :param f: A callable function object, the :math:`f: \mathbb{R}^m \mapsto \mathbb{R}^n` function
+    :type f: function object
+    :param n_inputs: The number of inputs :math:`m` of ``f``
+    :type n_inputs: integer
+
+    :return: The compiled function
+    :rtype: Compiled
+    """
+    return Compiled(f, n_inputs)
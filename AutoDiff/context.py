@@ -0,0 +1,87 @@
+import contextvars
+from contextlib import contextmanager
+
+class TraceContext:
+    """The state of one trace: the counter that labels new Nodes, whether new Nodes record the graph,
+    and the tape that new RNodes are appended to. Each call of :py:class:`AutoDiff.forward.Forward`
+    or :py:class:`AutoDiff.reverse.Reverse` works in its own TraceContext, see :py:func:`AutoDiff.context.trace`.
+
+    :param counter: The creation index of the last Node, defaults to 0
+    :type counter: integer
+    :param record: Whether new Nodes keep their parents and operations, defaults to True
+    :type record: bool
+    :param tape: When not None, every new RNode is appended to this list, defaults to None
+    :type tape: list or None
+
+    :ivar counter: The creation index of the last Node
+    :vartype counter: integer
+    :ivar record: Whether new Nodes keep their parents and operations
+    :vartype record: bool
+    :ivar tape: The list new RNodes are appended to, in topological order
+    :vartype tape: list or None
+    """
+
+    __slots__ = ('counter', 'record', 'tape')
+
+    def __init__(self, counter=0, record=True, tape=None):
+        self.counter = counter
+        self.record = record
+        self.tape = tape
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing useful information of the TraceContext object.
+        :rtype: string
+        """
+        tape = None if self.tape is None else f'{len(self.tape)} RNode(s)'
+        return f'A TraceContext object with counter of {self.counter}, record of {self.record}, and tape of {tape}.'
+
+
+# The TraceContext of the running trace, None until the first Node of a thread (or asyncio task) is created
+# outside of any trace, see current()
+_current = contextvars.ContextVar('AutoDiff_trace', default=None)
+
+def current():
+    """Return the TraceContext of the running trace. Outside of any trace, each thread (or asyncio task)
+    gets its own default TraceContext, created on first use, so the counters of Nodes created directly in
+    different threads do not interfere.
+
+    :return: The innermost TraceContext entered with :py:func:`AutoDiff.context.trace` in this thread
+        (or asyncio task), or the default one
+    :rtype: TraceContext
+    """
+    context = _current.get()
+    if context is None:
+        context = TraceContext()
+        _current.set(context)
+    return context
+
+@contextmanager
+def trace(counter=0, record=True, tape=None):
+    """Run a block in a new :py:class:`AutoDiff.context.TraceContext`. The context is held in a
+    :py:class:`contextvars.ContextVar`, so each thread (or asyncio task) sees its own, and nested traces,
+    e.g. a Forward call inside the function differentiated by another, restore the outer one on exit.
+
+    :param counter: The creation index of the last Node, defaults to 0
+    :type counter: integer
+    :param record: Whether new Nodes keep their parents and operations, defaults to True
+    :type record: bool
+    :param tape: When not None, every new RNode is appended to this list, defaults to None
+    :type tape: list or None
+
+    :return: The new TraceContext
+    :rtype: TraceContext
+
+    >>> with trace(tape=[]) as context:
+    >>>     x = RNode(2)
+    >>>     y = x * 3
+    >>> len(context.tape)
+    2
+    """
+    context = TraceContext(counter, record, tape)
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
@@ -1,5 +1,8 @@
 import numpy as np
 from .node import Node
+from .context import trace, current
+from .sparse import SparseTangent
+from .tangent import SmallTangent
 
 class Forward:
     r"""
@@ -11,6 +14,22 @@ class Forward:
     :param variables: The input for :code:`f`
     :type variables: integer or float or numpy array
 
+    :param batch: If True, each variable is an array of :math:`N` sample points and ``f`` is differentiated
+        at all of them in one pass, see :py:meth:`AutoDiff.forward.Forward.grad`. Defaults to False
+    :type batch: bool
+
+    :param chunk_size: If given, the Jacobian is built in :math:`\lceil m/k \rceil` passes that each seed
+        only :math:`k` = ``chunk_size`` directions, see :py:meth:`AutoDiff.forward.Forward.grad`. Defaults to None
+    :type chunk_size: integer
+
+    :param sparse: If True, each Node carries a :py:class:`AutoDiff.sparse.SparseTangent` with only the entries
+        of the variables it depends on, see :py:meth:`AutoDiff.forward.Forward.grad`. Defaults to False
+    :type sparse: bool
+
+    :param keep_graph: If True, the Nodes keep their parents and operations so that the computation graph
+        can be drawn from :py:attr:`output`. Defaults to False, see :py:meth:`AutoDiff.forward.Forward.grad`
+    :type keep_graph: bool
+
     :ivar val: The output of function ``f(*variables)``
     :vartype val: integer or float or numpy array
 
@@ -21,6 +40,13 @@ class Forward:
     :ivar output: :py:meth:`AutoDiff.node.Node`; a single node for scalar function or a list of output nodes for vector function.
     :vartype output: Node class object or list of Node class objects
 
+    :ivar f: The function ``f``, kept so that :py:func:`AutoDiff.graphvis.generate_graph` can trace it
+        again with the graph when ``keep_graph`` is False
+    :vartype f: function object
+
+    :ivar keep_graph: Whether the output Nodes hold the computation graph
+    :vartype keep_graph: bool
+
     >>> from AutoDiff import Forward
     >>> import numpy as np
     >>> # Example 1: univariate scalar function
@@ -66,8 +92,12 @@ class Forward:
         [1.00000000e+00, 4.90000000e+01, 0.00000000e+00],
         [7.50555350e+00, 3.46410162e+00, 0.00000000e+00]])
     """
-    def __init__(self, f: callable, *variables):
-        self.val, self.der, self.output = self.grad(f, *variables)
+    def __init__(self, f: callable, *variables, batch=False, chunk_size=None, sparse=False, keep_graph=False):
+        self.f = f
+        self.keep_graph = keep_graph
+        self.val, self.der, self.output = self.grad(
+            f, *variables, batch=batch, chunk_size=chunk_size, sparse=sparse, keep_graph=keep_graph
+        )
 
     def __str__(self):
         """Print useful information for users.
@@ -100,41 +130,300 @@ class Forward:
         return f'A Forward object with value of {self.val}, derivative of {self.der}, and output of ({self.output}).'
 
     @staticmethod
-    def grad(f: callable, *variables):
+    def grad(f: callable, *variables, batch=False, chunk_size=None, sparse=False, keep_graph=False):
         r"""
         Evaluate the full Jacobian in forward mode. This is the method that is used internally
         by :py:meth:`AutoDiff.forward.Forward.__init__`.
         For each (scalar or multivariate) function ``f``,
         use :math:`m` passes with different seed vector :math:`\mathbf{e}`,
         where each natural basis :math:`\mathbf{e} \in \mathbb{R}^{m}`, and :math:`m` is the number in ``variables``.
+        The seeds are views of a single buffer, see :py:meth:`AutoDiff.forward.Forward._seeds`.
+        With few variables, arrays of length :math:`m` cost more in numpy's per-call overhead than in arithmetic,
+        so a single variable is seeded with the float 1 and two to four variables with
+        :py:class:`AutoDiff.tangent.SmallTangent` objects. The output Nodes get their derivatives as arrays either way.
 
         :param f: A callable function object to perform differentiation on
         :type f: function object
         :param variables: The input for variables of function ``f``
         :type variables: integer or float or numpy array or list of intergers or floats
 
+        :param batch: If True, each variable is an array of sample points (scalars are broadcast),
+            the value of each Node is an array over the samples and its derivative has the shape
+            :math:`(m, N)`, with the :math:`m` seed directions first so that the derivative rules
+            broadcast against the value. Then ``val`` has the shape :math:`(N,)` and ``der`` the
+            shape :math:`(N, m)` for a scalar function, or :math:`(N, n)` and :math:`(N, n, m)` for
+            a vector function with :math:`n` outputs. Defaults to False
+        :type batch: bool
+
+        :param chunk_size: If given, seed at most ``chunk_size`` directions per pass, so each Node carries
+            a derivative of length ``chunk_size`` instead of :math:`m`. ``f`` is evaluated
+            :math:`\lceil m/\text{chunk_size} \rceil` times and each pass fills a block of Jacobian columns.
+            Defaults to None, which seeds all :math:`m` directions in one pass
+        :type chunk_size: integer
+
+        :param sparse: If True, variable :math:`i` is seeded with the :py:class:`AutoDiff.sparse.SparseTangent`
+            holding the single entry :math:`1` at index :math:`i`, and the derivatives of the intermediate Nodes
+            only hold the variables they depend on. The Jacobian is returned as a dense array, while the
+            output Nodes keep their sparse derivatives. Defaults to False
+        :type sparse: bool
+
+        :param keep_graph: If True, every Node keeps its parents and operations, as needed to draw the
+            computation graph. Defaults to False: dual numbers need no history, so the Nodes do not
+            reference each other and each intermediate Node is freed as soon as it is used
+        :type keep_graph: bool
+        :raises ValueError: ``chunk_size`` is not positive, or ``batch``, ``chunk_size`` and ``sparse``
+            are combined.
+
         :return: function evaluation at variable x, Jacobian, a single output node (scalar function) or a list of output nodes (multivariate) function)
             i.e. :math:`\frac{\partial f(\text{variables})}{\partial \text{variables}}`.
             Stack the gradient rows into the full Jacobian.
         :rtype: Node class object or list of Node class objects        
         """
+        # each call traces in its own context, so that concurrent or nested calls do not share the labels
+        with trace(counter=-len(variables), record=keep_graph):
+            return Forward._grad(f, variables, batch, chunk_size, sparse)
+
+    @staticmethod
+    def _grad(f: callable, variables, batch, chunk_size, sparse):
+        """Helper function of :py:meth:`AutoDiff.forward.Forward.grad` that picks the seeding and runs
+        the forward pass, with the arguments of :py:meth:`AutoDiff.forward.Forward.grad`.
+
+        :return: function evaluation, Jacobian, a single output node (scalar function) or a list of output nodes (vector function)
+        :rtype: tuple
+        """
         # Helper function when Forward class is initialized, see usage in init.
         num_variables = len(variables)
-        # initialize the intermediate result index
-        Node.v_index = -num_variables
+        if sparse:
+            if batch or chunk_size is not None:
+                raise ValueError('sparse is not supported with batch evaluation or chunk_size')
+            return Forward._grad_sparse(f, variables)
+        if chunk_size is not None:
+            if chunk_size < 1:
+                raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+            if batch:
+                raise ValueError('chunk_size is not supported with batch evaluation')
+            if chunk_size < num_variables:
+                return Forward._grad_chunked(f, variables, chunk_size)
+        if batch:
+            return Forward._grad_batch(f, variables)
         # Convert variables into Nodes and store in a list
+        seeds = Forward._fast_seeds(num_variables)
         variables = [
-            Node(var, derivative = np.eye(num_variables)[i])
+            Node(var, derivative = seeds[i])
             for i, var in enumerate(variables)
         ]
         # Perform the forward mode
         output = f(*variables)
         if isinstance(output, list): # for vector functions (a list of outputs)
             output = [o if isinstance(o, Node) else Node(o, np.zeros(num_variables)) for o in output]
+            for o in output:
+                o.der = Forward._dense(o.der)
             values = np.array([o.val for o in output])
             ders = np.stack([o.der if len(o.der) > 1 else o.der[0] for o in output])
             return values, ders, output
         else: # for scalar functions (a single output)
             if not isinstance(output, Node):
                 output = Node(output, np.zeros(num_variables))
-            return output.val, output.der if len(output.der) > 1 else output.der[0], output
\ No newline at end of file
+            output.der = Forward._dense(output.der)
+            return output.val, output.der if len(output.der) > 1 else output.der[0], output
+
+    @staticmethod
+    def _dense(der):
+        """Helper function that turns the derivative of an output Node into an array with the tangent axis first,
+        as the seeds of :py:meth:`AutoDiff.forward.Forward._seeds` give it.
+
+        :param der: The derivative, a float for a single variable or a SmallTangent for two to four variables
+        :type der: integer or float or SmallTangent or numpy array
+
+        :return: The derivative as an array
+        :rtype: numpy array
+        """
+        if isinstance(der, SmallTangent):
+            return der.toarray()
+        if isinstance(der, np.ndarray):
+            return der
+        return np.array([der], dtype=float)
+
+    @staticmethod
+    def _fast_seeds(num_variables):
+        """Helper function that returns the seeds used when all the directions are seeded in one pass:
+        the float 1 for a single variable, :py:class:`AutoDiff.tangent.SmallTangent` objects for two to four
+        variables, and the arrays of :py:meth:`AutoDiff.forward.Forward._seeds` otherwise.
+        Use :py:meth:`AutoDiff.forward.Forward._dense` to turn the resulting derivatives into arrays.
+
+        :param num_variables: The number of variables :math:`m`
+        :type num_variables: integer
+
+        :return: The :math:`m` seeds, seed :math:`i` is the :math:`i`-th natural basis vector
+        :rtype: list of floats or SmallTangent objects or numpy arrays
+
+        >>> Forward._fast_seeds(2)
+        [SmallTangent(1.0, 0.0), SmallTangent(0.0, 1.0)]
+        """
+        if num_variables == 1:
+            return [1.]
+        if num_variables <= SmallTangent.max_size:
+            return SmallTangent.seeds(num_variables)
+        return Forward._seeds(num_variables)
+
+    @staticmethod
+    def _seeds(num_variables):
+        """Helper function that returns the natural basis vectors used as seeds, without building
+        the identity matrix. All the seeds are read-only views of one buffer of length :math:`2m - 1`
+        that holds a single 1, so their setup takes :math:`O(m)` time and memory instead of :math:`O(m^2)`.
+
+        :param num_variables: The number of variables :math:`m`
+        :type num_variables: integer
+
+        :return: The :math:`m` seeds, seed :math:`i` has a 1 at index :math:`i`
+        :rtype: list of numpy arrays
+
+        >>> Forward._seeds(3)
+        [array([1., 0., 0.]), array([0., 1., 0.]), array([0., 0., 1.])]
+        """
+        if num_variables == 0:
+            return []
+        buffer = np.zeros(2 * num_variables - 1)
+        buffer[num_variables - 1] = 1.
+        buffer.flags.writeable = False
+        return [buffer[num_variables - 1 - i: 2 * num_variables - 1 - i] for i in range(num_variables)]
+
+    @staticmethod
+    def jvp(f: callable, x, v):
+        r"""
+        Evaluate the Jacobian-vector product :math:`J_f(\mathbf{x})\mathbf{v}` in a single forward pass.
+        Each variable is seeded with its scalar component of the direction :math:`\mathbf{v}`
+        instead of a natural basis vector, so every Node carries one scalar tangent. The cost
+        and memory do not depend on the number of variables :math:`m`, and the Jacobian is never formed.
+        No graph is kept, as in :py:meth:`AutoDiff.forward.Forward.grad` with ``keep_graph=False``.
+
+        :param f: A callable function object, the :math:`f: \mathbb{R}^m \mapsto \mathbb{R}^n` function
+        :type f: function object
+        :param x: The input for variables of function ``f``, i.e. ``f(*x)`` is evaluated
+        :type x: integer or float or numpy array or list of integers or floats
+        :param v: The direction :math:`\mathbf{v}`, with one entry per variable
+        :type v: integer or float or numpy array or list of integers or floats
+        :raises ValueError: ``x`` and ``v`` have different lengths.
+
+        :return: function evaluation at ``x`` and the Jacobian-vector product
+        :rtype: tuple
+
+        >>> def f(x1, x2):
+        >>>     return [x1 * x2, np.sin(x1)]
+        >>> Forward.jvp(f, [1, 2], [1, 0])
+        (array([2.        , 0.84147098]), array([2.        , 0.54030231]))
+        """
+        x = np.atleast_1d(x)
+        v = np.atleast_1d(v)
+        if len(x) != len(v):
+            raise ValueError(f'The direction has {len(v)} entries for {len(x)} variables')
+        with trace(counter=-len(x), record=False):
+            variables = [Node(var, derivative = float(tangent)) for var, tangent in zip(x, v)]
+            output = f(*variables)
+        if isinstance(output, list): # for vector functions (a list of outputs)
+            values = np.array([o.val if isinstance(o, Node) else o for o in output])
+            tangents = np.array([o.der if isinstance(o, Node) else 0. for o in output], dtype=float)
+            return values, tangents
+        if not isinstance(output, Node):
+            return output, 0.
+        return output.val, output.der
+
+    @staticmethod
+    def _grad_batch(f: callable, variables):
+        """Helper function of :py:meth:`AutoDiff.forward.Forward.grad` for ``batch=True``.
+
+        :param f: A callable function object to perform differentiation on
+        :type f: function object
+        :param variables: The sample points for variables of function ``f``
+        :type variables: list of numpy arrays or integers or floats
+
+        :return: function evaluations, Jacobians, a single output node (scalar function) or a list of output nodes (vector function)
+        :rtype: tuple
+        """
+        num_variables = len(variables)
+        variables = np.broadcast_arrays(*[np.asarray(var, dtype=float) for var in variables])
+        shape = variables[0].shape
+        # seed i is the i-th natural basis vector, repeated (as a read-only view) over the samples
+        seeds = np.eye(num_variables).reshape((num_variables, num_variables) + (1,) * len(shape))
+        variables = [
+            Node(var, derivative = np.broadcast_to(seeds[i], (num_variables,) + shape))
+            for i, var in enumerate(variables)
+        ]
+        output = f(*variables)
+        outputs = output if isinstance(output, list) else [output]
+        outputs = [o if isinstance(o, Node) else Node(o, 0.) for o in outputs]
+        values = np.stack([np.broadcast_to(o.val, shape) for o in outputs], axis=-1)
+        ders = np.stack([np.broadcast_to(o.der, (num_variables,) + shape) for o in outputs], axis=-1)
+        ders = np.moveaxis(ders, 0, -1)
+        if isinstance(output, list):
+            return values, ders, outputs
+        return values[..., 0], ders[..., 0, :], outputs[0]
+
+    @staticmethod
+    def _grad_chunked(f: callable, variables, chunk_size):
+        """Helper function of :py:meth:`AutoDiff.forward.Forward.grad` when ``chunk_size`` is given.
+        Each pass seeds the natural basis vectors of one block of at most ``chunk_size`` variables,
+        the other variables get a zero derivative, and the pass fills that block of Jacobian columns.
+
+        :param f: A callable function object to perform differentiation on
+        :type f: function object
+        :param variables: The input for variables of function ``f``
+        :type variables: list of integers or floats
+        :param chunk_size: The number of directions seeded per pass, less than the number of variables
+        :type chunk_size: integer
+
+        :return: function evaluation, Jacobian, a single output node (scalar function) or a list of output nodes (vector function)
+        :rtype: tuple
+        """
+        num_variables = len(variables)
+        ders = None
+        for start in range(0, num_variables, chunk_size):
+            stop = min(start + chunk_size, num_variables)
+            seeds = Forward._seeds(stop - start)
+            zero = np.zeros(stop - start)
+            current().counter = -num_variables
+            nodes = [
+                Node(var, derivative = seeds[i - start] if start <= i < stop else zero)
+                for i, var in enumerate(variables)
+            ]
+            output = f(*nodes)
+            outputs = output if isinstance(output, list) else [output]
+            outputs = [o if isinstance(o, Node) else Node(o, zero) for o in outputs]
+            if ders is None:
+                ders = np.zeros((len(outputs), num_variables))
+            ders[:, start:stop] = [o.der for o in outputs]
+        # the output nodes of the last pass carry their full Jacobian rows
+        for o, der in zip(outputs, ders):
+            o.der = der
+        if isinstance(output, list):
+            return np.array([o.val for o in outputs]), ders, outputs
+        return outputs[0].val, ders[0], outputs[0]
+
+    @staticmethod
+    def _grad_sparse(f: callable, variables):
+        """Helper function of :py:meth:`AutoDiff.forward.Forward.grad` for ``sparse=True``.
+
+        :param f: A callable function object to perform differentiation on
+        :type f: function object
+        :param variables: The input for variables of function ``f``
+        :type variables: list of integers or floats
+
+        :return: function evaluation, Jacobian, a single output node (scalar function) or a list of output nodes (vector function)
+        :rtype: tuple
+        """
+        num_variables = len(variables)
+        variables = [
+            Node(var, derivative = SparseTangent([i], [1.]))
+            for i, var in enumerate(variables)
+        ]
+        output = f(*variables)
+        outputs = output if isinstance(output, list) else [output]
+        outputs = [o if isinstance(o, Node) else Node(o, SparseTangent()) for o in outputs]
+        ders = np.zeros((len(outputs), num_variables))
+        for k, o in enumerate(outputs):
+            ders[k, o.der.indices] = o.der.values
+        if num_variables == 1:
+            ders = ders[..., 0]
+        if isinstance(output, list):
+            return np.array([o.val for o in outputs]), ders, outputs
+        return outputs[0].val, ders[0], outputs[0]
@@ -1,30 +1,34 @@
+from ..forward import Forward
 
 def build_graph(g, output):
-    """Recursively add key graph elements to the Graph object based on output from Forward mode. 
-    This is a helper function for generate_graph function.
+    """Add key graph elements to the Graph object based on output from Forward mode. 
+    This is a helper function for generate_graph function. The graph is walked with an explicit
+    stack, so deep computations do not hit the recursion limit, and each Node is expanded once.
 
     :param g: The graph object from graphviz used to make computation graph
     :type g: graphviz.graphs.Graph
     """
-    # Base case: the node has no parent
-    if output.parent == []:
-        return
-    # Recursive case
-    for i, p in enumerate(output.parent):
-        if len(output.op) == 1: # the operation has only one element (e.g., [sin()])
-            g.node(output.v_index)
-            g.node(p.v_index)
-            if i == 0: # add operation sign only if it is the first time the parent appears
+    stack = [output]
+    visited = {id(output)}
+    while stack:
+        output = stack.pop()
+        for i, p in enumerate(output.parent):
+            if len(output.op) == 1: # the operation has only one element (e.g., [sin()])
+                g.node(output.v_index)
+                g.node(p.v_index)
+                if i == 0: # add operation sign only if it is the first time the parent appears
+                    g.edge(p.v_index, output.v_index, output.op[0])
+                else:
+                    g.edge(p.v_index, output.v_index)
+            else: # the operation has only one element (e.g., ['*', 3])
+                g.node(output.v_index)
+                g.node(p.v_index)
+                g.node(str(output.op[1])) # add node for scalar (e.g., 3)
                 g.edge(p.v_index, output.v_index, output.op[0])
-            else:
-                g.edge(p.v_index, output.v_index)
-        else: # the operation has only one element (e.g., ['*', 3])
-            g.node(output.v_index)
-            g.node(p.v_index)
-            g.node(str(output.op[1])) # add node for scalar (e.g., 3)
-            g.edge(p.v_index, output.v_index, output.op[0])
-            g.edge(str(output.op[1]), output.v_index) # add edge for the scalar node
-        build_graph(g, p)
+                g.edge(str(output.op[1]), output.v_index) # add edge for the scalar node
+            if id(p) not in visited:
+                visited.add(id(p))
+                stack.append(p)
 
 def generate_graph(x, g):
     """Generates the computation graph (in .png format) given input variables, 
@@ -32,7 +36,8 @@ def generate_graph(x, g):
 
     :param x: The input variable values
     :type x: A list of input variable values
-    :param g: A Forward object
+    :param g: A Forward object. When it was built without ``keep_graph``, the function is traced
+        again at ``x`` with the graph kept
     :type g: A Forward object
     >>> x = [3, 4, 5]
     >>> def f2(x1, x2, x3):
@@ -41,6 +46,8 @@ def generate_graph(x, g):
     >>> generate_graph(x, g2)
     """
     import graphviz as gv
+    if not g.keep_graph:
+        g = Forward(g.f, *x, keep_graph=True)
     # Initialize a Graph object in graphviz and set the style of the Graph object
     graph = gv.Graph(format='png')
     graph.attr(rankdir="LR", size="30, 30")
@@ -0,0 +1,235 @@
+import numpy as np
+from .node import Node
+from .rnode import RNode
+from .forward import Forward
+from .reverse import Reverse
+from .context import trace
+
+class Hessian:
+    r"""
+    Initialize Hessian. For detailed implementation see :py:meth:`AutoDiff.hessian.Hessian.hessian`.
+    The structure is similar to :py:class:`AutoDiff.forward.Forward` and :py:class:`AutoDiff.reverse.Reverse`.
+
+    :param f: Function that is callable to perform differentiation on, a scalar function
+    :type f: function object
+
+    :param variables: inputs
+    :type variables: integer or floats or list of integers or floats
+
+    :param mode: How the engines are nested, ``'reverse'`` for forward-over-reverse or ``'forward'`` for
+        forward-over-forward, see :py:meth:`AutoDiff.hessian.Hessian.hessian`. Defaults to ``'reverse'``
+    :type mode: string
+
+    :ivar val: Output of function ``f(*variables)``
+    :vartype val: integer or float
+
+    :ivar der: gradient of ``f(*variables)`` wrt. ``variables``
+    :vartype der: float or numpy array
+
+    :ivar hess: Hessian of ``f(*variables)`` wrt. ``variables``
+            i.e. :math:`\frac{\partial^2 f(\text{variables})}{\partial \text{variables}^2}`
+    :vartype hess: float or numpy array
+
+    >>> from AutoDiff import Hessian
+    >>> def f(x1, x2):
+    >>>     return x1 ** 2 * x2 + np.sin(x2)
+    >>> h = Hessian(f, 1, 0)
+    >>> h.val
+    0.0
+    >>> h.der
+    array([0., 2.])
+    >>> h.hess
+    array([[0., 2.],
+           [2., 0.]])
+    """
+
+    def __init__(self, f: callable, *variables, mode='reverse'):
+        self.val, self.der, self.hess = self.hessian(f, *variables, mode=mode)
+
+    def __str__(self):
+        """Print useful information for users.
+
+        :return: A string containing useful information of the Hessian class object.
+        :rtype: string
+
+        >>> print(Hessian(lambda x: x ** 3, 2))
+        Hessian: val=8, der=12.0, and hess=12.0.
+        """
+        return f'Hessian: val={self.val}, der={self.der}, and hess={self.hess}.'
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing useful information of the Hessian class object.
+        :rtype: string
+
+        >>> Hessian(lambda x: x ** 3, 2)
+        A Hessian object with value of 8, derivative of 12.0, and Hessian of 12.0.
+        """
+        return f'A Hessian object with value of {self.val}, derivative of {self.der}, and Hessian of {self.hess}.'
+
+    @staticmethod
+    def hessian(f: callable, *variables, mode='reverse'):
+        r"""
+        Evaluate the gradient and the Hessian of a scalar function by nesting the engines, so that the
+        second derivatives are exact. This is the method that is used internally by
+        :py:meth:`AutoDiff.hessian.Hessian.__init__`.
+
+        With ``mode='reverse'`` (forward-over-reverse), the values of the RNodes are Nodes seeded with the
+        natural basis vectors. The reverse sweep of :py:meth:`AutoDiff.reverse.Reverse.backward` then runs on
+        Nodes, so the adjoint of each variable is a Node whose value is a gradient entry and whose derivative is
+        a row of the Hessian. A single forward pass and a single reverse sweep give the full Hessian, at about
+        :math:`m` times the cost of the gradient.
+
+        With ``mode='forward'`` (forward-over-forward), the values and derivatives of the Nodes are Nodes
+        (hyper-dual numbers). Pass :math:`i` seeds the outer direction :math:`\mathbf{e}_i` and the inner directions
+        of the variables :math:`j \ge i` only, which gives row :math:`i` of the upper triangle. The lower triangle
+        follows by symmetry, so the :math:`m` passes carry :math:`m(m+1)/2` second derivatives instead of :math:`m^2`.
+        This mode needs no tape, so it suits functions of few variables with long computations.
+
+        :param f: A callable function to perform differentiation on, it must return a single output
+        :type f: function object
+
+        :param variables: The input for variables of function ``f``
+        :type variables: integer or float or list of integers or floats
+
+        :param mode: ``'reverse'`` or ``'forward'``, defaults to ``'reverse'``
+        :type mode: string
+        :raises ValueError: ``mode`` is neither ``'reverse'`` nor ``'forward'``.
+        :raises TypeError: ``f`` returns a list, the Hessian is only defined for scalar functions.
+
+        :return: function evaluation, gradient and Hessian. For a single variable the gradient and the
+            Hessian are floats, otherwise arrays of shape :math:`(m,)` and :math:`(m, m)`
+        :rtype: tuple
+        """
+        if mode == 'reverse':
+            val, der, hess = Hessian._forward_over_reverse(f, variables)
+            # H[i, j] and H[j, i] are accumulated along different paths of the graph, average out their rounding
+            hess = (hess + hess.T) / 2
+        elif mode == 'forward':
+            val, der, hess = Hessian._forward_over_forward(f, variables)
+        else:
+            raise ValueError(f"mode must be 'reverse' or 'forward', got {mode!r}")
+        if len(variables) == 1:
+            return val, der[0], hess[0, 0]
+        return val, der, hess
+
+    @staticmethod
+    def hvp(f: callable, x, v):
+        r"""
+        Evaluate the gradient and the Hessian-vector product :math:`\nabla^2 f(\mathbf{x})\mathbf{v}` of a scalar
+        function without forming the Hessian. This is forward-over-reverse with a single direction: the values of
+        the RNodes are Nodes seeded with the scalar components of :math:`\mathbf{v}`, as in
+        :py:meth:`AutoDiff.forward.Forward.jvp`, so every Node carries one scalar tangent and the cost is a small
+        multiple of one gradient evaluation, whatever the number of variables :math:`m`.
+
+        :param f: A callable function object, the :math:`f: \mathbb{R}^m \mapsto \mathbb{R}` function
+        :type f: function object
+        :param x: The input for variables of function ``f``, i.e. ``f(*x)`` is evaluated
+        :type x: integer or float or numpy array or list of integers or floats
+        :param v: The direction :math:`\mathbf{v}`, with one entry per variable
+        :type v: integer or float or numpy array or list of integers or floats
+        :raises ValueError: ``x`` and ``v`` have different lengths.
+        :raises TypeError: ``f`` returns a list.
+
+        :return: function evaluation, gradient and Hessian-vector product, arrays of shape :math:`(m,)`
+        :rtype: tuple
+
+        >>> def f(x1, x2):
+        >>>     return x1 ** 2 * x2
+        >>> Hessian.hvp(f, [1, 3], [1, 0])
+        (3, array([6., 1.]), array([6., 2.]))
+        """
+        x = np.atleast_1d(x)
+        v = np.atleast_1d(v)
+        if len(x) != len(v):
+            raise ValueError(f'The direction has {len(v)} entries for {len(x)} variables')
+        return Hessian._forward_over_reverse(f, x, [float(tangent) for tangent in v], dense=False)
+
+    @staticmethod
+    def _forward_over_reverse(f: callable, variables, seeds=None, dense=True):
+        """Helper function that runs ``f`` on RNodes whose values are Nodes and sweeps back over the tape,
+        see :py:meth:`AutoDiff.hessian.Hessian.hessian` and :py:meth:`AutoDiff.hessian.Hessian.hvp`.
+
+        :param f: A callable function object to perform differentiation on
+        :type f: function object
+        :param variables: The input for variables of function ``f``
+        :type variables: list of integers or floats
+        :param seeds: The derivatives of the inner Nodes, defaults to None for the natural basis vectors
+        :type seeds: list of floats or SmallTangent objects or numpy arrays
+        :param dense: If True, the derivatives of the adjoints are Hessian rows stacked into a matrix,
+            otherwise they are the scalar entries of a Hessian-vector product
+        :type dense: bool
+
+        :return: function evaluation, gradient, and Hessian or Hessian-vector product
+        :rtype: tuple
+        """
+        num_variables = len(variables)
+        if seeds is None:
+            seeds = Forward._fast_seeds(num_variables)
+        with trace(counter=-num_variables, record=False, tape=[]) as context:
+            variables = [RNode(Node(var, derivative = seed)) for var, seed in zip(variables, seeds)]
+            output = f(*variables)
+            Hessian._check_scalar(output)
+            if not isinstance(output, RNode):
+                output = RNode(output)
+            Reverse.backward(context.tape, output)
+        val = output.val.val if isinstance(output.val, Node) else output.val
+        # a variable that the output does not depend on has the adjoint 0
+        adjoints = [var.der if isinstance(var.der, Node) else Node(var.der, 0.) for var in variables]
+        der = np.array([adjoint.val for adjoint in adjoints], dtype=float)
+        if not dense:
+            return val, der, np.array([adjoint.der for adjoint in adjoints], dtype=float)
+        hess = np.zeros((num_variables, num_variables))
+        for i, adjoint in enumerate(adjoints):
+            hess[i] = Forward._dense(adjoint.der)
+        return val, der, hess
+
+    @staticmethod
+    def _forward_over_forward(f: callable, variables):
+        """Helper function of :py:meth:`AutoDiff.hessian.Hessian.hessian` for ``mode='forward'``, which fills
+        the upper triangle of the Hessian one row per pass and mirrors it.
+
+        :param f: A callable function object to perform differentiation on
+        :type f: function object
+        :param variables: The input for variables of function ``f``
+        :type variables: list of integers or floats
+
+        :return: function evaluation, gradient, and Hessian
+        :rtype: tuple
+        """
+        num_variables = len(variables)
+        der = np.zeros(num_variables)
+        hess = np.zeros((num_variables, num_variables))
+        val = None
+        for i in range(num_variables):
+            # the inner directions of pass i are the variables i, ..., m - 1
+            seeds = [0.] * i + Forward._fast_seeds(num_variables - i)
+            with trace(counter=-num_variables, record=False):
+                nodes = [
+                    Node(Node(var, derivative = seed), derivative = float(i == j))
+                    for j, (var, seed) in enumerate(zip(variables, seeds))
+                ]
+                output = f(*nodes)
+            Hessian._check_scalar(output)
+            if not isinstance(output, Node):
+                return output, der, hess
+            val = output.val.val if isinstance(output.val, Node) else output.val
+            if isinstance(output.der, Node):
+                der[i] = output.der.val
+                hess[i, i:] = Forward._dense(output.der.der)
+            else: # the output does not depend on variable i
+                der[i] = output.der
+        hess = np.triu(hess) + np.triu(hess, 1).T
+        return val, der, hess
+
+    @staticmethod
+    def _check_scalar(output):
+        """Helper function that rejects the outputs of vector functions.
+
+        :param output: The output of ``f``
+        :type output: any
+        :raises TypeError: ``output`` is a list.
+        """
+        if isinstance(output, list):
+            raise TypeError('The Hessian is only defined for scalar functions, f returned a list')
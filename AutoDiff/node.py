@@ -1,4 +1,180 @@
+import operator
 import numpy as np
+from .context import _current, current
+
+def _any(condition):
+    """Helper function for the domain checks: whether a scalar or elementwise (numpy array)
+    condition holds anywhere. Plain Python scalars skip the comparatively slow :code:`np.any`.
+
+    :param condition: The result of a comparison
+    :type condition: bool or numpy array
+
+    :return: Whether the condition holds for any element
+    :rtype: bool
+    """
+    if isinstance(condition, np.ndarray):
+        return condition.any()
+    return bool(condition)
+
+def _innermost(value):
+    """Helper function for the domain checks that compare values with numpy: the value of a Node or RNode,
+    unwrapped until it is a number or numeric array. Under nesting, e.g. in :py:class:`AutoDiff.hessian.Hessian`,
+    the value of a node is itself a node.
+
+    :param value: The value of a node
+    :type value: integer or float or numpy array or Node or RNode
+
+    :return: The innermost value
+    :rtype: integer or float or numpy array
+    """
+    while hasattr(value, 'val'):
+        value = value.val
+    return value
+
+def _is_object_array(other):
+    """Helper function for the operators: whether ``other`` is a numpy array of objects, e.g. of nodes.
+    Only numeric arrays are constants of a derivative rule. The operators return :code:`NotImplemented`
+    for an object array, so numpy applies the operation to each of its elements instead.
+
+    :param other: The other operand
+    :type other: any
+
+    :return: Whether ``other`` is an object array
+    :rtype: bool
+    """
+    return isinstance(other, np.ndarray) and other.dtype == object
+
+# numpy ufuncs with a derivative rule in Node and RNode: a unary ufunc calls a method,
+# a binary ufunc calls a method of its first operand or the reflected method of its second
+_UNARY_UFUNCS = {
+    np.negative: operator.methodcaller('__neg__'),
+    np.sqrt: operator.methodcaller('sqrt'),
+    np.exp: operator.methodcaller('exp'),
+    np.log: operator.methodcaller('log'),
+    np.log2: operator.methodcaller('log', 2),
+    np.log10: operator.methodcaller('log', 10),
+    np.sin: operator.methodcaller('sin'),
+    np.cos: operator.methodcaller('cos'),
+    np.tan: operator.methodcaller('tan'),
+    np.arcsin: operator.methodcaller('arcsin'),
+    np.arccos: operator.methodcaller('arccos'),
+    np.arctan: operator.methodcaller('arctan'),
+    np.sinh: operator.methodcaller('sinh'),
+    np.cosh: operator.methodcaller('cosh'),
+    np.tanh: operator.methodcaller('tanh'),
+}
+_BINARY_UFUNCS = {
+    np.add: ('__add__', '__radd__'),
+    np.subtract: ('__sub__', '__rsub__'),
+    np.multiply: ('__mul__', '__rmul__'),
+    np.true_divide: ('__truediv__', '__rtruediv__'),
+    np.power: ('__pow__', '__rpow__'),
+    np.matmul: ('__matmul__', '__rmatmul__'),
+    np.maximum: ('maximum', 'maximum'),
+    np.minimum: ('minimum', 'minimum'),
+    np.less: ('__lt__', '__gt__'),
+    np.greater: ('__gt__', '__lt__'),
+    np.less_equal: ('__le__', '__ge__'),
+    np.greater_equal: ('__ge__', '__le__'),
+    np.equal: ('__eq__', '__eq__'),
+    np.not_equal: ('__ne__', '__ne__'),
+}
+
+def _as_object(x):
+    """Helper function that wraps a node in a 0-d object array, so that numpy applies its object
+    loops to it instead of dispatching back to the node.
+    """
+    wrapped = np.empty((), dtype=object)
+    wrapped[()] = x
+    return wrapped
+
+def _array_ufunc(cls, ufunc, method, inputs, kwargs):
+    """Shared implementation of :code:`__array_ufunc__` for Node and RNode. The ufuncs with a
+    derivative rule go straight to the rule. Anything else (another ufunc, a method such as
+    :code:`reduce`, keyword arguments, or an operand that is an object array) falls back to numpy's
+    object loops, as if the nodes were elements of object arrays. A numeric numpy array operand is
+    a constant of the rule, so the result is a single node with an array value.
+
+    :param cls: Node or RNode
+    :type cls: class
+    :return: The result of the ufunc
+    """
+    if method == '__call__' and not kwargs:
+        if len(inputs) == 1:
+            rule = _UNARY_UFUNCS.get(ufunc)
+            if rule is not None:
+                return rule(inputs[0])
+        elif len(inputs) == 2 and ufunc in _BINARY_UFUNCS:
+            name, reflected = _BINARY_UFUNCS[ufunc]
+            node, other = inputs if isinstance(inputs[0], cls) else (inputs[1], inputs[0])
+            # numpy scalars become Python scalars, so the rules see the types they support
+            if isinstance(other, np.generic):
+                other = other.item()
+            if not _is_object_array(other):
+                return getattr(node, name if node is inputs[0] else reflected)(other)
+    inputs = tuple(_as_object(x) if isinstance(x, cls) else x for x in inputs)
+    return getattr(ufunc, method)(*inputs, **kwargs)
+
+def _object_dot(node, other, reflected):
+    """Helper function for the dot product of a node with an object array, e.g. of nodes, computed by numpy's
+    object loops with the node as an element. ``reflected`` puts the node on the right.
+    """
+    if np.ndim(node.val) != 0:
+        raise TypeError('The dot product of an array-valued node with an object array is not supported')
+    node = _as_object(node)
+    return np.dot(other, node) if reflected else np.dot(node, other)
+
+def _array_function(cls, functions, func, args, kwargs):
+    """Shared implementation of :code:`__array_function__` for Node and RNode. The numpy functions
+    in ``functions`` go to their derivative rule, which returns :code:`NotImplemented` for arguments it
+    does not take (e.g. ``out``). Other functions, and those arguments, fall back to numpy's object loops
+    as in :code:`__array_ufunc__`: the function is called again with every node wrapped in a 0-d object
+    array, so the nodes are elements of object arrays. This needs the nodes to have scalar values.
+
+    :param cls: Node or RNode
+    :type cls: class
+    :param functions: The derivative rules, keyed by numpy function
+    :type functions: dict
+    :raises TypeError: The fallback is needed for a node with an array value.
+    :return: The result of the function
+    """
+    if func in functions:
+        result = functions[func](*args, **kwargs)
+        if result is not NotImplemented:
+            return result
+
+    def wrap(x):
+        if isinstance(x, cls):
+            if np.ndim(x.val) != 0:
+                raise TypeError(f'numpy.{func.__name__} is not supported with these arguments '
+                                f'for a {cls.__name__} with an array value')
+            return _as_object(x)
+        if isinstance(x, (list, tuple)):
+            # e.g. the arrays of np.stack
+            return type(x)(wrap(item) for item in x)
+        return x
+
+    return func(*(wrap(x) for x in args), **{key: wrap(value) for key, value in kwargs.items()})
+
+def _kept_shape(shape, axis):
+    """Helper function for the shape of a reduction over ``axis`` with :code:`keepdims=True`, where the
+    reduced axes have length 1.
+    """
+    ndim = len(shape)
+    axes = range(ndim) if axis is None else [a % ndim for a in np.atleast_1d(axis)]
+    return tuple(1 if i in axes else n for i, n in enumerate(shape))
+
+def _select(condition, x, y):
+    """Helper function for the values of :code:`where`, keeping Python scalars for a scalar condition.
+    """
+    if isinstance(condition, np.ndarray):
+        return np.where(condition, x, y)
+    return x if condition else y
+
+def _pad(der, t, k):
+    """Helper function that inserts ``k`` axes of length 1 after the ``t`` leading tangent axes of a derivative.
+    """
+    return der.reshape(der.shape[:t] + (1,) * k + der.shape[t:])
 
 class Node:
     """This is a class that implements the Dual numbers and dunder methods to overload 
@@ -13,6 +189,12 @@ class Node:
     :param derivative: The derivative of the Node, defaults to 1. It can be an interger or float or a 1D numpy array for 1D problem, or a multi-dimensional numpy array for multi-dimensional problem
     :type derivative: integer or float or numpy array
 
+    :param parent: A list of parent Nodes of the new Node, defaults to an empty list
+    :type parent: list
+
+    :param op: A list of strings representing operations, defaults to an empty list
+    :type op: list
+
     :ivar val: The value of the Node, it can be an interger or float or a 1D numpy array for 1D problem, or a multi-dimensional numpy array for multi-dimensional problem
     :vartype val: integer or float or numpy array
 
@@ -25,8 +207,15 @@ class Node:
     :ivar op: A list of strings representing operations
     :vartype op: list
 
-    :ivar v_index: An integer used to track variable index in visualization
-    :vartype v_index: integer
+    :ivar v_index: The label of the Node in visualization, built from its creation index only when it is read
+    :vartype v_index: string
+
+    The creation index and whether the Node keeps its parents and operations come from the
+    running :py:class:`AutoDiff.context.TraceContext`. :py:class:`AutoDiff.forward.Forward` starts each trace
+    with the counter set so that the variables are labeled up to v0, and with recording off unless the graph
+    is kept for visualization: forward mode does not need the graph, and without it the intermediate Nodes can
+    be garbage collected as soon as they are used. Nodes created while recording is off have an empty tuple
+    as parents and operations.
 
     >>> x1 = Node(5)
     >>> x1.val
@@ -41,16 +230,34 @@ class Node:
     'v1'
     """
     
-    _supported_types = (int, float)
-    v_index = 0
+    __slots__ = ('val', 'der', 'parent', 'op', '_index')
+    _supported_types = (int, float, np.ndarray)
 
-    def __init__(self, value, derivative = 1): 
+    def __init__(self, value, derivative = 1, parent = None, op = None):
         self.val = value
         self.der = derivative
-        self.parent = []
-        self.op = []
-        type(self).v_index += 1
-        self.v_index = f'v{type(self).v_index}'
+        # the default TraceContext of the thread is created by current() on first use
+        context = _current.get() or current()
+        if parent is None:
+            self.parent = []
+            self.op = []
+        elif context.record:
+            self.parent = parent
+            self.op = op
+        else:
+            self.parent = self.op = ()
+        context.counter += 1
+        self._index = context.counter
+
+    @property
+    def v_index(self):
+        """The label of the Node in visualization. It is formatted on demand, so creating a Node only
+        stores its integer creation index.
+
+        :return: The label, e.g. 'v1'
+        :rtype: string
+        """
+        return f'v{self._index}'
 
     def __str__(self):
         """Print useful information for users.
@@ -114,7 +321,7 @@ class Node:
         """
         value = -self.val
         derivative = -1. * self.der
-        return Node(value, derivative).update_node([self], ['-1*'])
+        return Node(value, derivative, [self], ['-1*'])
 
     def __add__(self, other):
         """Overloads the built-in addition operator for handling Dual numbers in the Node class
@@ -122,8 +329,8 @@ class Node:
         with integers or floats is also supported.
 
         :param other: The item to be added to the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
         
         :return: A Node object after addition, with value and derivative updated.
         :rtype: Node
@@ -136,14 +343,16 @@ class Node:
         """
         if isinstance(other, Node):
             value = self.val + other.val
-            derivative = self.der + other.der
-            return Node(value, derivative).update_node([self, other], ['+'])
+            derivative = self._spread(value) + other._spread(value)
+            return Node(value, derivative, [self, other], ['+'])
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for addition")
         else:
             value = self.val + other
-            derivative = self.der
-            return Node(value, derivative).update_node([self], ['+', other])
+            derivative = self._spread(value)
+            return Node(value, derivative, [self], ['+', other])
 
     def __sub__(self, other):
         """Overloads the built-in subtraction operator for handling Dual numbers in the Node class 
@@ -151,8 +360,8 @@ class Node:
         with integers or floats is also supported.
 
         :param other: The item to be subtracted from the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
         
         :return: A Node object after subtraction, with value and derivative updated.
         :rtype: Node
@@ -165,14 +374,16 @@ class Node:
         """
         if isinstance(other, Node):
             value = self.val - other.val
-            derivative = self.der - other.der
-            return Node(value, derivative).update_node([self, other], ['-'])
+            derivative = self._spread(value) - other._spread(value)
+            return Node(value, derivative, [self, other], ['-'])
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for subtraction")
         else:
             value = self.val - other
-            derivative = self.der
-            return Node(value, derivative).update_node([self], ['-', other])
+            derivative = self._spread(value)
+            return Node(value, derivative, [self], ['-', other])
 
     def __mul__(self, other):
         """Overloads the built-in multiplication operator for handling Dual numbers in the Node class 
@@ -180,8 +391,8 @@ class Node:
         with integers or floats is also supported.
 
         :param other: The item to multiply the current Node object by.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
        
         :return: A Node object after multiplication, with value and derivative updated.
         :rtype: Node
@@ -194,14 +405,16 @@ class Node:
         """
         if isinstance(other, Node):
             value = self.val * other.val
-            derivative = self.der * other.val + other.der * self.val
-            return Node(value, derivative).update_node([self, other], ['*'])
+            derivative = self._lift(value) * other.val + other._lift(value) * self.val
+            return Node(value, derivative, [self, other], ['*'])
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for multiplication")
         else:
             value = self.val * other
-            derivative = self.der * other
-            return Node(value, derivative).update_node([self], ['*', other])
+            derivative = self._lift(value) * other
+            return Node(value, derivative, [self], ['*', other])
     
     def __truediv__(self, other):
         """Overloads the built-in division operator for handling Dual numbers in the Node class 
@@ -209,8 +422,8 @@ class Node:
         with integers or floats is also supported.
 
         :param other: The item to divide the current Node object by.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
         :raises ZeroDivisionError: Division by zero.
         
         :return: A Node object after subtraction, with value and derivative updated.
@@ -223,19 +436,21 @@ class Node:
         Node: vindex=v38, val=2.0, der=-0.4, parent=[A Node object with index of v36, value of 5, derivative of 1, parent of [], and operator of []., A Node object with index of v37, value of 2.5, derivative of 1, parent of [], and operator of [].], and op=['/'].
         """
         if isinstance(other, Node):
-            if other.val == 0:
+            if _any(other.val == 0):
                 raise ZeroDivisionError('Division by zero')
             value = self.val / other.val
-            derivative = (self.der * other.val - other.der * self.val) / other.val**2
-            return Node(value, derivative).update_node([self, other], ['/'])
+            derivative = (self._lift(value) * other.val - other._lift(value) * self.val) / other.val**2
+            return Node(value, derivative, [self, other], ['/'])
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for division")
         else:
-            if other == 0:
+            if _any(other == 0):
                 raise ZeroDivisionError('Division by zero')
             value = self.val / other
-            derivative = self.der / other
-            return Node(value, derivative).update_node([self], ['/', other])
+            derivative = self._lift(value) / other
+            return Node(value, derivative, [self], ['/', other])
 
     def sqrt(self):
         """Overloads the numpy square root operator for handling Dual numbers in the Node class
@@ -250,11 +465,11 @@ class Node:
         >>> print(x2)
         Node: vindex=v40, val=4.0, der=0.125, parent=[A Node object with index of v39, value of 16, derivative of 1, parent of [], and operator of [].], and op=['sqrt()'].
         """
-        if self.val < 0:
+        if _any(self.val < 0):
             raise ValueError('Cannot take square root of negative number.')
         value = np.sqrt(self.val)
         derivative = 0.5/np.sqrt(self.val) * self.der
-        return Node(value, derivative).update_node([self], ['sqrt()'])
+        return Node(value, derivative, [self], ['sqrt()'])
     
     def logistic(self):
         """Implements the standard logistic operator for handling Nodes in the forward pass
@@ -270,7 +485,7 @@ class Node:
         """
         value = 1 / (1 + np.exp(-self.val))
         derivative = np.exp(-self.val) / ((np.exp(-self.val) + 1) ** 2) * self.der
-        return Node(value, derivative).update_node([self], ['logistic()'])
+        return Node(value, derivative, [self], ['logistic()'])
 
     def log(self, base=np.e):
         """Overloads the numpy logarithm operator for handling Dual numbers in the Node class 
@@ -288,16 +503,16 @@ class Node:
         >>> print(x3)
         Node: vindex=v45, val=1.4426950408889634, der=0.530737845423043, parent=[A Node object with index of v43, value of 2.718281828459045, derivative of 1, parent of [], and operator of [].], and op=['log2()'].
         """
-        if self.val <= 0:
+        if _any(self.val <= 0):
             raise ValueError('Cannot take the log of a negative number.')
         if base == np.e:
             value = np.log(self.val)
             derivative = 1 / self.val * self.der
-            return Node(value, derivative).update_node([self], ['log()'])
+            return Node(value, derivative, [self], ['log()'])
         else:
             value = np.log(self.val) / np.log(base)
             derivative = 1 / (self.val * np.log(base)) * self.der
-            return Node(value, derivative).update_node([self], [f'log{base}()'])
+            return Node(value, derivative, [self], [f'log{base}()'])
 
     def __pow__(self, other):
         """Overloads the built-in power operator for handling Dual numbers in the Node class 
@@ -305,8 +520,8 @@ class Node:
         to the power of some integer or float is also supported.
 
         :param other: The item to raise the power of the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
         
         :return: A Node object after take the power, with value and derivative updated.
         :rtype: Node
@@ -317,16 +532,17 @@ class Node:
         Node: vindex=v47, val=9.0, der=6.0, parent=[A Node object with index of v46, value of 3, derivative of 1, parent of [], and operator of [].], and op=['pow', 2.0].
         """
         if isinstance(other, Node):
-            print('here!!')
             value = self.val ** other.val
-            derivative = other.val * (self.val ** (other.val - 1)) * self.der + np.log(self.val) * (self.val ** other.val) * other.der
-            return Node(value, derivative).update_node([self, other], ['pow'])
+            derivative = other.val * (self.val ** (other.val - 1)) * self._lift(value) + np.log(self.val) * (self.val ** other.val) * other._lift(value)
+            return Node(value, derivative, [self, other], ['pow'])
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for power")
         else:
             value = self.val ** other
-            derivative = other * (self.val ** (other - 1)) * self.der
-            return Node(value, derivative).update_node([self], ['pow', other])
+            derivative = other * (self.val ** (other - 1)) * self._lift(value)
+            return Node(value, derivative, [self], ['pow', other])
 
     def exp(self):
         """Overloads the numpy exponential operator for handling Dual numbers in the Node class 
@@ -342,7 +558,7 @@ class Node:
         """
         value = np.exp(self.val)
         derivative = np.exp(self.val) * self.der
-        return Node(value, derivative).update_node([self], ['exp()'])
+        return Node(value, derivative, [self], ['exp()'])
 
     def sin(self):
         """Overloads the numpy sine operator for handling Dual numbers in the Node class 
@@ -358,7 +574,7 @@ class Node:
         """
         value = np.sin(self.val)
         derivative = np.cos(self.val) * self.der
-        return Node(value, derivative).update_node([self], ['sin()'])
+        return Node(value, derivative, [self], ['sin()'])
 
     def cos(self):
         """Overloads the numpy cosine operator for handling Dual numbers in the Node class 
@@ -374,7 +590,7 @@ class Node:
         """
         value = np.cos(self.val)
         derivative = -np.sin(self.val) * self.der
-        return Node(value, derivative).update_node([self], ['cos()'])
+        return Node(value, derivative, [self], ['cos()'])
         
     def tan(self):
         r"""Overloads the numpy tangent operator for handling Dual numbers in the Node class
@@ -390,11 +606,11 @@ class Node:
         >>> print(x2)
         Node: vindex=v55, val=-3.380515006246585, der=12.427881707458349, parent=[A Node object with index of v54, value of 5, derivative of 1, parent of [], and operator of [].], and op=['tan()'].
         """
-        if np.isclose((self.val - np.pi/2) / np.pi, 0):
+        if _any(np.isclose((_innermost(self.val) - np.pi/2) / np.pi, 0)):
             raise ValueError('Cannot take tangent of pi/2 + n * pi, with n being some integer')
         value = np.tan(self.val)
         derivative = 1 / (np.cos(self.val)) ** 2 * self.der
-        return Node(value, derivative).update_node([self], ['tan()'])
+        return Node(value, derivative, [self], ['tan()'])
     
     def arcsin(self):
         """Overloads the numpy arcsine operator for handling Dual numbers in the Node class 
@@ -410,11 +626,11 @@ class Node:
         >>> print(x2)
         Node: vindex=v57, val=0.5235987755982988, der=1.1547005383792517, parent=[A Node object with index of v56, value of 0.5, derivative of 1, parent of [], and operator of [].], and op=['arcsin()'].
         """
-        if self.val < -1 or self.val > 1:
+        if _any((self.val < -1) | (self.val > 1)):
             raise ValueError(f"The value `{self.val}` is not in the domain")
         value = np.arcsin(self.val)
         derivative = 1. / (np.sqrt(1 - self.val ** 2)) * self.der
-        return Node(value, derivative).update_node([self], ['arcsin()'])
+        return Node(value, derivative, [self], ['arcsin()'])
     
     def arccos(self):
         """Overloads the numpy arccosine operator for handling Dual numbers in the Node class 
@@ -430,11 +646,11 @@ class Node:
         >>> print(x2)
         Node: vindex=v59, val=1.0471975511965976, der=-1.1547005383792517, parent=[A Node object with index of v58, value of 0.5, derivative of 1, parent of [], and operator of [].], and op=['arccos()'].
         """
-        if self.val < -1 or self.val > 1:
+        if _any((self.val < -1) | (self.val > 1)):
             raise ValueError(f"The value `{self.val}` is not in the domain")
         value = np.arccos(self.val)
         derivative = -1. / (np.sqrt(1 - self.val**2)) * self.der
-        return Node(value, derivative).update_node([self], ['arccos()'])
+        return Node(value, derivative, [self], ['arccos()'])
     
     def arctan(self):
         """Overloads the numpy arctangent operator for handling Dual numbers in the Node class 
@@ -450,7 +666,7 @@ class Node:
         """
         value = np.arctan(self.val)
         derivative = 1. / (1. + self.val ** 2) * self.der
-        return Node(value, derivative).update_node([self], ['arctan()'])
+        return Node(value, derivative, [self], ['arctan()'])
 
     def sinh(self):
         """Overloads the numpy sinh operator for handling Dual numbers in the Node class 
@@ -466,7 +682,7 @@ class Node:
         """
         value = np.sinh(self.val)
         derivative = np.cosh(self.val) * self.der
-        return Node(value, derivative).update_node([self], ['sinh()'])
+        return Node(value, derivative, [self], ['sinh()'])
     
     def cosh(self):
         """Overloads the numpy cosh operator for handling Dual numbers in the Node class 
@@ -482,7 +698,7 @@ class Node:
         """
         value = np.cosh(self.val)
         derivative = np.sinh(self.val) * self.der
-        return Node(value, derivative).update_node([self], ['cosh()'])
+        return Node(value, derivative, [self], ['cosh()'])
     
     def tanh(self):
         """Overloads the numpy tanh operator for handling Dual numbers in the Node class 
@@ -498,15 +714,376 @@ class Node:
         """
         value = np.tanh(self.val)
         derivative = 1. / (np.cosh(self.val) ** 2) * self.der
-        return Node(value, derivative).update_node([self], ['tanh()'])
+        return Node(value, derivative, [self], ['tanh()'])
+
+    def _tangent(self):
+        """Helper function that returns the derivative as an array whose trailing axes match the value,
+        and the number of leading tangent axes.
+
+        :return: The derivative and the number of tangent axes
+        :rtype: tuple
+        """
+        der = np.asarray(self.der)
+        if der.ndim < np.ndim(self.val):
+            der = np.broadcast_to(der, np.shape(self.val))
+        return der, der.ndim - np.ndim(self.val)
+
+    def _lift(self, value):
+        """Helper function that returns the derivative ready to be combined elementwise with ``value``, the result
+        of a broadcasting operation on the current Node. When ``value`` has more dimensions than the value of the
+        current Node, axes of length 1 are inserted after the tangent axes, where numpy inserts them in the value.
+
+        :return: The derivative
+        :rtype: integer or float or numpy array
+        """
+        if isinstance(value, np.ndarray) and value.ndim > np.ndim(self.val):
+            der, t = self._tangent()
+            return _pad(der, t, value.ndim - np.ndim(self.val))
+        return self.der
+
+    def _spread(self, value):
+        """Helper function that returns the derivative broadcast to the shape of ``value``, the result of a
+        broadcasting operation on the current Node, after the tangent axes.
+
+        :return: The derivative
+        :rtype: integer or float or numpy array
+        """
+        if isinstance(value, np.ndarray) and value.shape != np.shape(self.val):
+            der, t = self._tangent()
+            der = _pad(der, t, value.ndim - np.ndim(self.val))
+            return np.broadcast_to(der, der.shape[:t] + value.shape)
+        return self.der
+
+    def _extremum(self, other, compare, ufunc, name):
+        """Helper function for :py:meth:`AutoDiff.node.Node.maximum` and :py:meth:`AutoDiff.node.Node.minimum`.
+        Where ``compare`` holds, the value and derivative of the current Node are kept, elsewhere those of other.
+        ``ufunc`` is the numpy function applied to object arrays and ``name`` the label of the operation.
+        """
+        if isinstance(other, Node):
+            keep = compare(self.val, other.val)
+            value = _select(keep, self.val, other.val)
+            derivative = self._lift(value) * keep + other._lift(value) * (1 - keep)
+            return Node(value, derivative, [self, other], [name])
+        elif _is_object_array(other):
+            return ufunc(_as_object(self), other)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for {name}")
+        else:
+            keep = compare(self.val, other)
+            value = _select(keep, self.val, other)
+            derivative = self._lift(value) * keep
+            return Node(value, derivative, [self], [name, other])
+
+    def maximum(self, other):
+        """Overloads the numpy maximum for handling Dual numbers in the Node class and returns a new Node
+        object with value and derivative updated. Where both values are equal, the derivative of the
+        current Node is used. Taking the maximum with integers or floats is also supported.
+
+        :param other: The item to be compared with the current Node object.
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
+
+        :return: A Node object after taking the elementwise maximum, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(5)
+        >>> x2 = np.maximum(x1 * 2, 3)
+        >>> x2.val, x2.der
+        (10, 2)
+        """
+        return self._extremum(other, operator.ge, np.maximum, 'maximum()')
+
+    def minimum(self, other):
+        """Overloads the numpy minimum for handling Dual numbers in the Node class and returns a new Node
+        object with value and derivative updated. Where both values are equal, the derivative of the
+        current Node is used. Taking the minimum with integers or floats is also supported.
+
+        :param other: The item to be compared with the current Node object.
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
+
+        :return: A Node object after taking the elementwise minimum, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(5)
+        >>> x2 = np.minimum(x1 * 2, 3)
+        >>> x2.val, x2.der
+        (3, 0)
+        """
+        return self._extremum(other, operator.le, np.minimum, 'minimum()')
+
+    def sum(self, axis=None):
+        """Overloads the numpy sum for handling Dual numbers in the Node class and returns a new Node
+        object with value and derivative updated. The derivative is summed over the same axes of the
+        value, the leading tangent axes are kept.
+
+        :param axis: The axis or axes of the value to sum over, defaults to None (all of them)
+        :type axis: integer or tuple of integers
+
+        :return: A Node object after summation, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([1., 2., 3.]), np.array([[1., 1., 1.], [0., 1., 2.]]))
+        >>> x2 = np.sum(x1)
+        >>> x2.val, x2.der
+        (6.0, array([3., 3.]))
+        """
+        value = np.sum(self.val, axis=axis)
+        return Node(value, self._sum_tangent(axis), [self], ['sum()'])
+
+    def _sum_tangent(self, axis):
+        """Helper function for :py:meth:`AutoDiff.node.Node.sum` and :py:meth:`AutoDiff.node.Node.mean`:
+        the derivative summed over the given axes of the value.
+        """
+        ndim = np.ndim(self.val)
+        if ndim == 0:
+            return self.der
+        der, t = self._tangent()
+        axes = range(ndim) if axis is None else np.atleast_1d(axis) % ndim
+        return np.sum(der, axis=tuple(t + int(a) for a in axes))
+
+    def mean(self, axis=None):
+        """Overloads the numpy mean for handling Dual numbers in the Node class and returns a new Node
+        object with value and derivative updated. The derivative is averaged over the same axes of the
+        value, the leading tangent axes are kept.
+
+        :param axis: The axis or axes of the value to average over, defaults to None (all of them)
+        :type axis: integer or tuple of integers
+
+        :return: A Node object after taking the mean, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([[1., 2.], [3., 6.]]), 1.)
+        >>> x2 = np.mean(x1, axis=0)
+        >>> x2.val, x2.der
+        (array([2., 4.]), array([1., 1.]))
+        """
+        value = np.mean(self.val, axis=axis)
+        derivative = self._sum_tangent(axis) * (np.size(value) / np.size(self.val))
+        return Node(value, derivative, [self], ['mean()'])
+
+    def dot(self, other):
+        """Overloads the numpy dot product for handling Dual numbers in the Node class and returns a new
+        Node object with value and derivative updated. The dot product of a Node object with integers,
+        floats or numpy arrays is also supported.
+
+        :param other: The item to be multiplied with the current Node object.
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
+
+        :return: A Node object after the dot product, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([1., 2.]), np.array([[1., 0.], [0., 1.]]))
+        >>> x2 = np.dot(x1, x1)
+        >>> x2.val, x2.der
+        (5.0, array([2., 4.]))
+        """
+        if isinstance(other, Node):
+            der, t = self._tangent()
+            other_der, _ = other._tangent()
+            value = np.dot(self.val, other.val)
+            derivative = _dot_left(der, t, np.ndim(self.val), other.val) \
+                + _dot_right(self.val, other_der, t, np.ndim(other.val))
+            return Node(value, derivative, [self, other], ['dot()'])
+        elif _is_object_array(other):
+            return _object_dot(self, other, False)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for dot product")
+        else:
+            der, t = self._tangent()
+            value = np.dot(self.val, other)
+            derivative = _dot_left(der, t, np.ndim(self.val), other)
+            return Node(value, derivative, [self], ['dot()', 'array' if isinstance(other, np.ndarray) else other])
+
+    def _rdot(self, other):
+        """Helper function for the dot product of a constant ``other`` with the current Node,
+        see :py:meth:`AutoDiff.node.Node.dot`.
+        """
+        if _is_object_array(other):
+            return _object_dot(self, other, True)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for dot product")
+        der, t = self._tangent()
+        value = np.dot(other, self.val)
+        derivative = _dot_right(other, der, t, np.ndim(self.val))
+        return Node(value, derivative, [self], ['rdot()', 'array' if isinstance(other, np.ndarray) else other])
+
+    @staticmethod
+    def where(condition, x, y):
+        """Overloads the numpy where for handling Dual numbers in the Node class and returns a new Node
+        object with value and derivative updated: the value and derivative of ``x`` where ``condition``
+        holds, and those of ``y`` elsewhere. Either of ``x`` and ``y`` may be an integer or float.
+
+        :param condition: Where to take ``x``
+        :type condition: bool or numpy array of bools
+        :param x: The item taken where the condition holds
+        :type x: Node or integer or float
+        :param y: The item taken elsewhere
+        :type y: Node or integer or float
+
+        :return: A Node object with value and derivative selected from ``x`` and ``y``.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([-1., 2.]), np.array([[1., 0.], [0., 1.]]))
+        >>> x2 = np.where(x1.val > 0, x1, 0.)
+        >>> x2.val, x2.der
+        (array([0., 2.]), array([[0., 0.],
+               [0., 1.]]))
+        """
+        if isinstance(condition, list):
+            condition = np.asarray(condition)
+        nodes = [item for item in (x, y) if isinstance(item, Node)]
+        value = _select(condition, x.val if isinstance(x, Node) else x, y.val if isinstance(y, Node) else y)
+        x_der = x._spread(value) if isinstance(x, Node) else 0.
+        y_der = y._spread(value) if isinstance(y, Node) else 0.
+        derivative = x_der * condition + y_der * (1 - condition)
+        return Node(value, derivative, nodes, ['where()'])
+
+    def __matmul__(self, other):
+        """Overloads the built-in matrix multiplication operator for handling Dual numbers in the Node class
+        and returns a new Node object with value and derivative updated. The derivative of each operand is
+        multiplied as a stack of matrices over the leading tangent axes. The matrix multiplication of a Node
+        object with numpy arrays is also supported.
+
+        :param other: The item to multiply the current Node object by.
+        :type other: Node or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not numpy array, or Node type).
+
+        :return: A Node object after matrix multiplication, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([[1., 2.], [3., 4.]]), np.eye(4).reshape(4, 2, 2))
+        >>> x2 = x1 @ np.array([1., -1.])
+        >>> x2.val
+        array([-1., -1.])
+        >>> x2.der
+        array([[ 1.,  0.],
+               [-1.,  0.],
+               [ 0.,  1.],
+               [ 0., -1.]])
+        """
+        if isinstance(other, Node):
+            value = np.matmul(self.val, other.val)
+            derivative = _matmul_tangent(self.val, self._tangent(), other.val, other._tangent())
+            return Node(value, derivative, [self, other], ['@'])
+        elif _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, np.ndarray):
+            raise TypeError(f"Type `{type(other)}` is not supported for matrix multiplication")
+        else:
+            value = np.matmul(self.val, other)
+            derivative = _matmul_tangent(self.val, self._tangent(), other, None)
+            return Node(value, derivative, [self], ['@', 'array'])
+
+    def __rmatmul__(self, other):
+        """Overloads the built-in reflective matrix multiplication operator for handling Dual numbers in the
+        Node class and returns a new Node object with value and derivative updated.
+
+        :param other: The numpy array to be multiplied by the current Node object.
+        :type other: numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not numpy array).
+
+        :return: A Node object after reflective matrix multiplication, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([1., 2.]), np.eye(2))
+        >>> x2 = np.array([[1., 1.], [0., 2.]]) @ x1
+        >>> x2.val, x2.der
+        (array([3., 4.]), array([[1., 0.],
+               [1., 2.]]))
+        """
+        if _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, np.ndarray):
+            raise TypeError(f"Type `{type(other)}` is not supported for matrix multiplication")
+        value = np.matmul(other, self.val)
+        derivative = _matmul_tangent(other, None, self.val, self._tangent())
+        return Node(value, derivative, [self], ['r@', 'array'])
+
+    def reshape(self, *shape):
+        """Overloads the numpy reshape for handling Dual numbers in the Node class and returns a new Node
+        object with value and derivative updated. The axes of the value in the derivative are reshaped,
+        the leading tangent axes are kept.
+
+        :param shape: The new shape of the value, as integers or one tuple
+        :type shape: integers or tuple of integers
+
+        :return: A Node object after reshaping, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([1., 2., 3., 4.]), np.eye(4))
+        >>> x2 = x1.reshape(2, 2)
+        >>> x2.val
+        array([[1., 2.],
+               [3., 4.]])
+        >>> x2.der.shape
+        (4, 2, 2)
+        """
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = tuple(shape[0])
+        value = np.reshape(self.val, shape)
+        der, t = self._tangent()
+        derivative = der.reshape(der.shape[:t] + value.shape)
+        return Node(value, derivative, [self], ['reshape()'])
+
+    def transpose(self):
+        """Overloads the numpy transpose for handling Dual numbers in the Node class and returns a new Node
+        object with value and derivative updated. The axes of the value are reversed, in the derivative
+        the leading tangent axes are kept.
+
+        :return: A Node object after transposing, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([[1., 2.], [3., 4.]]), 1.)
+        >>> x1.T.val
+        array([[1., 3.],
+               [2., 4.]])
+        """
+        value = np.transpose(self.val)
+        der, t = self._tangent()
+        derivative = np.transpose(der, tuple(range(t)) + tuple(range(der.ndim - 1, t - 1, -1)))
+        return Node(value, derivative, [self], ['T'])
+
+    @property
+    def T(self):
+        """The transposed Node, see :py:meth:`AutoDiff.node.Node.transpose`.
+
+        :return: A Node object after transposing, with value and derivative updated.
+        :rtype: Node
+        """
+        return self.transpose()
+
+    def __getitem__(self, key):
+        """Overloads indexing for handling Dual numbers in the Node class and returns a new Node object
+        with value and derivative updated. The value is indexed by ``key`` as a numpy array, and the
+        derivative is indexed in the same way after the leading tangent axes.
+
+        :param key: An index, slice, array of indices or mask, or a tuple of them
+        :type key: integer or slice or numpy array or tuple
+
+        :return: A Node object with the selected elements, with value and derivative updated.
+        :rtype: Node
+
+        >>> x1 = Node(np.array([1., 2., 3.]), np.eye(3))
+        >>> x2 = x1[1:]
+        >>> x2.val, x2.der
+        (array([2., 3.]), array([[0., 0.],
+               [1., 0.],
+               [0., 1.]]))
+        """
+        value = self.val[key]
+        der, t = self._tangent()
+        derivative = der[(slice(None),) * t + (key if isinstance(key, tuple) else (key,))]
+        return Node(value, derivative, [self], ['[]'])
 
     def __radd__(self, other):
         """Overloads the built-in reflective addition operator for handling Dual numbers in the Node class 
         and returns a new Node object with value and derivative updated.
 
         :param other: The integer or float to be added to the current Node object.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
 
         :return: A Node object after reflective addition, with value and derivative updated.
         :rtype: Node
@@ -524,8 +1101,8 @@ class Node:
         and returns a new Node object with value and derivative updated.
 
         :param other: The integer or float to be subtracted by the current Node object.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
 
         :return: A Node object after reflective subtraction, with value and derivative updated.
         :rtype: Node
@@ -543,8 +1120,8 @@ class Node:
         and returns a new Node object with value and derivative updated.
 
         :param other: The integer or float to multiply the current Node object by.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
 
         :return: A Node object after reflective multiplication, with value and derivative updated.
         :rtype: Node
@@ -562,8 +1139,8 @@ class Node:
         and returns a new Node object with value and derivative updated.
 
         :param other: The integer or float to divide the current Node object by.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
 
         :return: A Node object after reflective true division, with value and derivative updated.
         :rtype: Node
@@ -574,12 +1151,14 @@ class Node:
         >>> print(x3)
         Node: vindex=v75, val=0.5, der=-0.1, parent=[A Node object with index of v74, value of 5, derivative of 1, parent of [], and operator of [].], and op=['r/', 2.5].
         """
-        if not isinstance(other, self._supported_types):
+        if _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for division")
         else:
             value = other / self.val
-            derivative =  - self.der * other / self.val ** 2
-            return Node(value, derivative).update_node([self], ['r/', other])
+            derivative = - self._lift(value) * other / self.val ** 2
+            return Node(value, derivative, [self], ['r/', other])
     
     def __rpow__(self, other):
         """Overloads the built-in reflective power operator for handling Nodes in the forward pass
@@ -587,8 +1166,8 @@ class Node:
         to the power of some integer or float is also supported.
 
         :param other: The item to raise the reflective power of the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
 
         :return: An Node object after take the power, with value and parent updated.
         :rtype: Node
@@ -599,20 +1178,22 @@ class Node:
         >>> print(x3)
         Node: vindex=v77, val=97.65625, der=89.48151678458547, parent=[A Node object with index of v76, value of 5, derivative of 1, parent of [], and operator of [].], and op=['rpow', 2.5].
         """
-        if not isinstance(other, self._supported_types):
+        if _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for power")
         else:
             value = other ** self.val
-            derivative = np.log(other) * other ** self.val * self.der
-            return Node(value, derivative).update_node([self], ['rpow', other])
+            derivative = np.log(other) * other ** self.val * self._lift(value)
+            return Node(value, derivative, [self], ['rpow', other])
 
     def __lt__(self, other):
         """Overloads the built-in less than operator for comparisons between Nodes. 
         Comparing the Node object with some integer or float is also supported.
 
         :param other: The item to be compared with the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
 
         :return: A Boolean comparing the current Node object with other
         :rtype: Boolean
@@ -624,6 +1205,8 @@ class Node:
         """
         if isinstance(other, Node):
             return self.val < other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison <")
         else:
@@ -634,8 +1217,8 @@ class Node:
         Comparing the Node object with some integer or float is also supported.
 
         :param other: The item to be compared with the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
 
         :return: A Boolean comparing the current Node object with other
         :rtype: Boolean
@@ -647,6 +1230,8 @@ class Node:
         """
         if isinstance(other, Node):
             return self.val > other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison >")
         else:
@@ -657,8 +1242,8 @@ class Node:
         Comparing the Node object with some integer or float is also supported.
 
         :param other: The item to be compared with the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
 
         :return: A Boolean comparing the current Node object with other
         :rtype: Boolean
@@ -670,6 +1255,8 @@ class Node:
         """
         if isinstance(other, Node):
             return self.val <= other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison <=")
         else:
@@ -680,8 +1267,8 @@ class Node:
         Comparing the Node object with some integer or float is also supported.
 
         :param other: The item to be compared with the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
         
         :return: A Boolean comparing the current Node object with other
         :rtype: Boolean
@@ -693,6 +1280,8 @@ class Node:
         """
         if isinstance(other, Node):
             return self.val >= other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison >=")
         else:
@@ -703,8 +1292,8 @@ class Node:
         with some integer or float is also supported.
 
         :param other: The item to be compared with the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
         
         :return: A Boolean comparing the current Node object with other
         :rtype: Boolean
@@ -716,6 +1305,8 @@ class Node:
         """
         if isinstance(other, Node):
             return self.val == other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison =")
         else:
@@ -726,8 +1317,8 @@ class Node:
         with some integer or float is also supported.
 
         :param other: The item to be compared with the current Node object.
-        :type other: Node or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or Node type).
+        :type other: Node or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or Node type).
         
         :return: A Boolean comparing the current Node object with other
         :rtype: Boolean
@@ -739,7 +1330,142 @@ class Node:
         """
         if isinstance(other, Node):
             return self.val != other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison !=")
         else:
-            return self.val != other
\ No newline at end of file
+            return self.val != other
+
+    def __hash__(self):
+        """Hashes the Node object by identity. The comparison operators compare values, so two
+        distinct Nodes with equal values are equal but still have different hashes; this lets
+        Nodes be used as set members and dictionary keys.
+
+        :return: The hash of the identity of the current Node object
+        :rtype: integer
+
+        >>> x1 = Node(3)
+        >>> x2 = Node(3)
+        >>> x1 == x2
+        True
+        >>> len({x1, x2})
+        2
+        """
+        return object.__hash__(self)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Dispatches numpy ufuncs on Nodes. The ufuncs with a derivative rule (e.g. :code:`np.sin`,
+        :code:`np.add`, :code:`np.maximum`) call the rule directly, without going through numpy's
+        object loops. Other calls behave as on an object array holding the Node.
+
+        :return: The result of the ufunc
+        :rtype: Node or bool or numpy array
+
+        >>> x1 = Node(2)
+        >>> x2 = np.multiply(np.float64(3.), np.sin(x1))
+        >>> x2.val, x2.der
+        (2.727892280477045, -1.2484405096414273)
+        """
+        return _array_ufunc(Node, ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Dispatches numpy functions on Nodes. :code:`np.sum`, :code:`np.mean`, :code:`np.dot`, :code:`np.where`,
+        :code:`np.reshape` and :code:`np.transpose` use the methods of the same name, e.g.
+        :py:meth:`AutoDiff.node.Node.sum`, and :code:`keepdims` of :code:`np.sum` and :code:`np.mean` is supported.
+        Other functions and arguments treat Nodes with scalar values as elements of object arrays.
+
+        :raises TypeError: Another function or argument is applied to a Node with an array value.
+        :return: The result of the function
+
+        >>> x1 = Node(np.array([[1., 2.], [3., 4.]]), np.ones((1, 2, 2)))
+        >>> np.sum(x1, axis=1, keepdims=True).val
+        array([[3.],
+               [7.]])
+        """
+        return _array_function(Node, _NODE_FUNCTIONS, func, args, kwargs)
+
+
+def _dot_left(der, t, ndim, other):
+    """Helper function for the derivative of :code:`np.dot(a, b)` with respect to ``a``, where ``der``
+    is the derivative of ``a`` with ``t`` leading tangent axes, ``ndim`` is the number of dimensions
+    of ``a`` and ``other`` is the value of ``b``.
+    """
+    if ndim == 0:
+        return der.reshape(der.shape + (1,) * np.ndim(other)) * other
+    if np.ndim(other) == 0:
+        return der * other
+    return np.dot(der, other)
+
+def _dot_right(other, der, t, ndim):
+    """Helper function for the derivative of :code:`np.dot(a, b)` with respect to ``b``, where ``other``
+    is the value of ``a``, ``der`` is the derivative of ``b`` with ``t`` leading tangent axes and
+    ``ndim`` is the number of dimensions of ``b``.
+    """
+    if np.ndim(other) == 0:
+        return other * der
+    if ndim == 0:
+        return der.reshape(der.shape + (1,) * np.ndim(other)) * other
+    # contract the last axis of a with the only, or second to last, axis of b
+    axis = t if ndim == 1 else t + ndim - 2
+    product = np.tensordot(other, der, axes=([-1], [axis]))
+    start = np.ndim(other) - 1
+    return np.moveaxis(product, range(start, start + t), range(t))
+
+def _matmul_tangent(a, a_tangent, b, b_tangent):
+    """Helper function for the derivative of :code:`np.matmul(a, b)`, where ``a_tangent`` and ``b_tangent`` are the
+    derivatives of ``a`` and ``b`` with their numbers of leading tangent axes, or None for a constant. As numpy
+    does for the values, a 1D operand is made a matrix, and its added axis is removed from the result.
+    """
+    a2 = a[None, :] if np.ndim(a) == 1 else a
+    b2 = b[:, None] if np.ndim(b) == 1 else b
+    ndim = max(a2.ndim, b2.ndim)
+    derivative = 0.
+    if a_tangent is not None:
+        der, t = a_tangent
+        der = der[..., None, :] if np.ndim(a) == 1 else der
+        derivative = np.matmul(_pad(der, t, ndim - a2.ndim), b2)
+    if b_tangent is not None:
+        der, t = b_tangent
+        der = der[..., None] if np.ndim(b) == 1 else der
+        derivative = derivative + np.matmul(a2, _pad(der, t, ndim - b2.ndim))
+    if np.ndim(b) == 1:
+        derivative = derivative[..., 0]
+    if np.ndim(a) == 1:
+        derivative = derivative[..., 0, :] if np.ndim(b) > 1 else derivative[..., 0]
+    return derivative
+
+def _node_sum(a, axis=None, keepdims=False, **kwargs):
+    if kwargs:
+        return NotImplemented
+    total = a.sum(axis)
+    return total.reshape(_kept_shape(np.shape(a.val), axis)) if keepdims else total
+
+def _node_mean(a, axis=None, keepdims=False, **kwargs):
+    if kwargs:
+        return NotImplemented
+    mean = a.mean(axis)
+    return mean.reshape(_kept_shape(np.shape(a.val), axis)) if keepdims else mean
+
+def _node_reshape(a, shape=None, order='C', **kwargs):
+    if order != 'C' or kwargs:
+        return NotImplemented
+    return a.reshape(shape)
+
+def _node_transpose(a, axes=None):
+    if axes is not None:
+        return NotImplemented
+    return a.transpose()
+
+def _node_dot(a, b, out=None):
+    if out is not None:
+        return NotImplemented
+    return a.dot(b) if isinstance(a, Node) else b._rdot(a)
+
+def _node_where(condition, *args):
+    if len(args) != 2:
+        return NotImplemented
+    return Node.where(condition, *args)
+
+_NODE_FUNCTIONS = {np.sum: _node_sum, np.mean: _node_mean, np.dot: _node_dot, np.where: _node_where,
+                   np.reshape: _node_reshape, np.transpose: _node_transpose}
@@ -1,4 +1,8 @@
 from .newton import Newton
+from .newton_krylov import NewtonKrylov
+from .broyden import Broyden
 from .sgd import SGD
+from .lbfgs import LBFGS
+from .result import OptimizeResult
 
-__all__ = [Newton, SGD]
+__all__ = [Newton, NewtonKrylov, Broyden, SGD, LBFGS, OptimizeResult]
@@ -0,0 +1,203 @@
+import numpy as np
+from .. import Forward, Reverse
+from .newton import _evaluate, _Factorization
+from .result import OptimizeResult
+
+def Broyden(f: callable, *x0, tol=1e-5, max_iter=500, full_output=False, mode='forward', memory=None):
+    r"""
+    Broyden's method
+
+    To find :math:`\mathbf{x}` such that :math:`F(\mathbf{x}) = \mathbf{0}` for :math:`F: \mathbb{R}^m \mapsto \mathbb{R}^m`,
+    the Jacobian :math:`J_0 = J_F(\mathbf{x}_0)` is computed once with automatic differentiation, and each
+    iteration corrects the approximation :math:`B_k` of the Jacobian with the rank-one update of Broyden's
+    (good) method
+
+    .. math::
+                  B_k\Delta \mathbf{x}_{k} &= - F(\mathbf{x}_{k}) \\
+              \mathbf{x}_{k+1} &\gets \mathbf{x}_{k} + \Delta \mathbf{x}_{k} \\
+              B_{k+1} &\gets B_k + \frac{(\Delta F_k - B_k\Delta \mathbf{x}_{k})\Delta \mathbf{x}_{k}^T}{\Delta \mathbf{x}_{k}^T\Delta \mathbf{x}_{k}}
+    where :math:`\Delta F_k = F(\mathbf{x}_{k+1}) - F(\mathbf{x}_{k})`. Every iteration after the first
+    only evaluates ``f``, instead of running a forward pass of :math:`m` directions as in
+    :py:func:`AutoDiff.optim.newton.Newton`. Convergence is superlinear near the solution. Far from it
+    the approximate Jacobian may overshoot, so a step is halved until :math:`\|F(\mathbf{x})\|` decreases,
+    at most 10 times, and the update uses the step taken.
+
+    By default the inverse :math:`B_k^{-1}` is kept as a dense matrix and updated with the Sherman-Morrison
+    formula in :math:`O(m^2)`. With ``memory`` set, :math:`J_0` is kept as its QR factorization and only the
+    last ``memory`` corrections are kept as pairs of vectors, the older ones are dropped, and each iteration
+    solves with the Woodbury formula.
+
+    :param f: A callable function object, the :math:`F: \mathbb{R}^m \mapsto \mathbb{R}^m` function
+    :type f: function object
+    :param x0: The initial guess
+    :type x0: integer or float or numpy array or list of integers or floats
+    :param tol: The algorithm terminates when :math:`\|F(\mathbf{x})\| < \text{tol}` is reached
+    :type tol: float
+    :param max_iter: The maximum number of iterations, defaults to 500
+    :type max_iter: integer
+    :param full_output: If True, return a :py:class:`AutoDiff.optim.result.OptimizeResult` with the solution
+        and the iteration statistics instead of the solution alone, defaults to False
+    :type full_output: bool
+    :param mode: How the initial Jacobian is computed, ``'forward'`` with :py:class:`AutoDiff.forward.Forward`
+        or ``'reverse'`` with :py:class:`AutoDiff.reverse.Reverse`, defaults to ``'forward'``
+    :type mode: string
+    :param memory: The number of rank-one corrections kept by the limited-memory variant, defaults to None
+        for the dense inverse
+    :type memory: integer or None
+    :raises ValueError: ``mode`` is unknown, ``memory`` is not positive, or ``f`` does not have as many outputs as variables.
+    :raises RuntimeError: If the function does not converge in max_iter iterations
+
+    :return: The solution :math:`\mathbf{x}`, or the OptimizeResult if ``full_output`` is True
+    :rtype: float or numpy array or OptimizeResult
+
+    >>> def f(x1, x2):
+    >>>     return [
+    >>>         2 * x1 + x2 - np.exp(-x1),
+    >>>         -x1 + 2 * x2 - np.exp(-x2)
+    >>>     ]
+    >>> Broyden(f, 0, 1)
+    array([0.19759311, 0.42551406])
+    >>> res = Broyden(f, 0, 1, full_output=True)
+    >>> res.n_fev, res.n_jev
+    (5, 1)
+    """
+    if mode not in ('forward', 'reverse'):
+        raise ValueError(f"mode must be 'forward' or 'reverse', got {mode!r}")
+    if memory is not None and memory < 1:
+        raise ValueError(f'memory must be positive, got {memory}')
+    x = np.array(x0, dtype=float)
+    # the exact Jacobian at the initial guess, and the function evaluation from the same pass
+    g = Forward(f, *x) if mode == 'forward' else Reverse(f, *x)
+    val = np.atleast_1d(np.asarray(g.val, dtype=float))
+    if len(val) != len(x):
+        raise ValueError(f'Broyden needs as many outputs as variables, got {len(val)} outputs for {len(x)} variables')
+    der = np.reshape(g.der, (len(x), len(x)))
+    inverse = _DenseInverse(der) if memory is None else _LimitedMemoryInverse(der, val, memory)
+    n_fev = 1
+    norms = [np.linalg.norm(val)]
+    for n_iter in range(max_iter):
+        # if the norm of the function is less than the tolerance, consider the method converged
+        if norms[-1] < tol:
+            sol = x.item() if len(x) == 1 else x
+            if full_output:
+                return OptimizeResult(sol, val if len(val) > 1 else val.item(), n_iter, n_fev, 1, norms)
+            return sol
+        step = inverse.solve(-val)
+        # backtrack until the norm of the function decreases, the approximate Jacobian may overshoot
+        for _ in range(_MAX_BACKTRACK):
+            new_val = np.atleast_1d(np.asarray(_evaluate(f, x + step), dtype=float))
+            n_fev += 1
+            if np.linalg.norm(new_val) <= (1 - 1e-4) * norms[-1]:
+                break
+            step = step / 2
+        x = x + step
+        inverse.update(step, new_val - val)
+        val = new_val
+        norms.append(np.linalg.norm(val))
+    raise RuntimeError(f'The function does not converge in {max_iter} iterations!')
+
+# the number of times a step is halved at most before it is taken anyway
+_MAX_BACKTRACK = 10
+
+class _DenseInverse:
+    r"""The inverse :math:`B_k^{-1}` of the Jacobian approximation of :py:func:`AutoDiff.optim.broyden.Broyden`,
+    kept as a dense matrix. A singular initial Jacobian is replaced by its pseudo-inverse.
+
+    :param der: The initial Jacobian :math:`J_0`
+    :type der: numpy array
+    """
+
+    __slots__ = ('matrix',)
+
+    def __init__(self, der):
+        self.matrix = np.linalg.pinv(der)
+
+    def solve(self, v):
+        r"""Return :math:`B_k^{-1}\mathbf{v}`.
+
+        :param v: The right-hand side
+        :type v: numpy array
+
+        :return: The solution
+        :rtype: numpy array
+        """
+        return self.matrix @ v
+
+    def update(self, s, y):
+        r"""Apply the Sherman-Morrison form of Broyden's update,
+        :math:`B^{-1} \gets B^{-1} + (\mathbf{s} - B^{-1}\mathbf{y})\mathbf{s}^T B^{-1} / (\mathbf{s}^T B^{-1}\mathbf{y})`.
+        The update is skipped when the denominator vanishes.
+
+        :param s: The step :math:`\Delta \mathbf{x}_{k}`
+        :type s: numpy array
+        :param y: The change of the function evaluation :math:`\Delta F_k`
+        :type y: numpy array
+        """
+        h_y = self.matrix @ y
+        denominator = s @ h_y
+        if denominator != 0:
+            self.matrix += np.outer((s - h_y) / denominator, s @ self.matrix)
+
+class _LimitedMemoryInverse:
+    r"""The Jacobian approximation :math:`B_k = J_0 + C D^T` of :py:func:`AutoDiff.optim.broyden.Broyden`
+    with ``memory`` set, where :math:`J_0` is kept as its QR factorization and the columns of :math:`C` and
+    :math:`D` are the last rank-one corrections. Systems are solved with the Woodbury formula
+    :math:`B_k^{-1}\mathbf{v} = \mathbf{w} - E (I + D^T E)^{-1} D^T \mathbf{w}` where :math:`\mathbf{w} = J_0^{-1}\mathbf{v}`
+    and :math:`E = J_0^{-1} C` is kept along with :math:`C`, so each iteration costs two solves with the factors
+    of :math:`J_0` and :math:`O(m \cdot \text{memory})` more.
+
+    :param der: The initial Jacobian :math:`J_0`
+    :type der: numpy array
+    :param val: The function evaluation at the initial guess
+    :type val: numpy array
+    :param memory: The number of corrections kept
+    :type memory: integer
+    """
+
+    __slots__ = ('factorization', 'corrections', 'memory')
+
+    def __init__(self, der, val, memory):
+        self.factorization = _Factorization(der, val)
+        # the triples (c, d, J_0^{-1} c) of the corrections, oldest first
+        self.corrections = []
+        self.memory = memory
+
+    def _solve_initial(self, v):
+        # _Factorization solves J_0 x = -v
+        return self.factorization.solve(-v)
+
+    def solve(self, v):
+        r"""Return :math:`B_k^{-1}\mathbf{v}`.
+
+        :param v: The right-hand side
+        :type v: numpy array
+
+        :return: The solution
+        :rtype: numpy array
+        """
+        w = self._solve_initial(v)
+        if not self.corrections:
+            return w
+        C, D, E = (np.array(vectors).T for vectors in zip(*self.corrections))
+        small = np.eye(len(self.corrections)) + D.T @ E
+        return w - E @ np.linalg.solve(small, D.T @ w)
+
+    def update(self, s, y):
+        r"""Add Broyden's correction :math:`(\mathbf{y} - B_k\mathbf{s})\mathbf{s}^T / (\mathbf{s}^T\mathbf{s})`,
+        and drop the oldest one when there are more than ``memory``.
+
+        :param s: The step :math:`\Delta \mathbf{x}_{k}`
+        :type s: numpy array
+        :param y: The change of the function evaluation :math:`\Delta F_k`
+        :type y: numpy array
+        """
+        norm = s @ s
+        if norm == 0:
+            return
+        b_s = self.factorization.der @ s
+        for c, d, _ in self.corrections:
+            b_s = b_s + c * (d @ s)
+        c = (y - b_s) / norm
+        self.corrections.append((c, s, self._solve_initial(c)))
+        if len(self.corrections) > self.memory:
+            self.corrections.pop(0)
@@ -0,0 +1,192 @@
+from collections import deque
+import numpy as np
+from .result import OptimizeResult
+from .sgd import _gradient
+
+def LBFGS(f: callable, *x0, tol=1e-5, max_iter=1000, full_output=False, memory=10, c1=1e-4, c2=0.9):
+    r"""
+    Limited-memory BFGS
+
+    It minimizes :math:`f: \mathbb{R}^n \mapsto \mathbb{R}` with the iteration
+
+    .. math::
+        \mathbf{x}_{k+1} \gets \mathbf{x}_{k} - \alpha_k H_k \nabla f(\mathbf{x}_{k})
+
+    where :math:`H_k` approximates the inverse Hessian from the last ``memory`` pairs of steps
+    :math:`\mathbf{s}_i = \mathbf{x}_{i+1} - \mathbf{x}_{i}` and gradient changes
+    :math:`\mathbf{y}_i = \nabla f(\mathbf{x}_{i+1}) - \nabla f(\mathbf{x}_{i})`, applied with the two-loop recursion
+    in :math:`O(n \cdot \text{memory})`, and the step :math:`\alpha_k` satisfies the strong Wolfe conditions
+
+    .. math::
+        f(\mathbf{x}_{k} + \alpha_k \mathbf{p}_k) &\le f(\mathbf{x}_{k}) + c_1 \alpha_k \nabla f(\mathbf{x}_{k})^T \mathbf{p}_k \\
+        |\nabla f(\mathbf{x}_{k} + \alpha_k \mathbf{p}_k)^T \mathbf{p}_k| &\le c_2 |\nabla f(\mathbf{x}_{k})^T \mathbf{p}_k|
+
+    As in :py:func:`AutoDiff.optim.sgd.SGD`, ``f`` is traced once with :py:func:`AutoDiff.compiled.compile`, and
+    every evaluation replays the recorded operations and sweeps back over them, so a gradient costs a single
+    reverse pass whatever :math:`n`. When the tracing hits an operation the tape does not support, the
+    evaluations use :py:class:`AutoDiff.reverse.Reverse` instead. The step is picked by the line search instead of a fixed learning rate,
+    so no tuning is needed and far fewer iterations are taken.
+
+    :param f: A callable function object, the :math:`f: \mathbb{R}^n \mapsto \mathbb{R}` function
+    :type f: function object
+    :param x0: An initial guess
+    :type x0: integer or float or numpy array or list of integers or floats
+    :param tol: The algorithm terminates when :math:`\|\nabla f(\mathbf{x})\| < \text{tol}` is reached
+    :type tol: float
+    :param max_iter: The maximum number of iterations, defaults to 1000
+    :type max_iter: integer
+    :param full_output: If True, return a :py:class:`AutoDiff.optim.result.OptimizeResult` with the solution
+        and the iteration statistics instead of the solution alone, where ``norms`` holds the norms of the
+        gradients. Defaults to False
+    :type full_output: bool
+    :param memory: The number of pairs :math:`(\mathbf{s}_i, \mathbf{y}_i)` kept, defaults to 10
+    :type memory: integer
+    :param c1: The constant of the sufficient decrease condition, defaults to 1e-4
+    :type c1: float
+    :param c2: The constant of the curvature condition, defaults to 0.9
+    :type c2: float
+    :raises ValueError: ``memory`` is not positive, or ``c1`` and ``c2`` do not satisfy :math:`0 < c_1 < c_2 < 1`.
+    :raises TypeError: ``f`` returns a list.
+    :raises RuntimeError: If the function does not converge in max_iter iterations, or no step satisfies
+        the line search, e.g. when ``f`` is unbounded below
+
+    :return: The final solution, or the OptimizeResult if ``full_output`` is True
+    :rtype: float or numpy array or OptimizeResult
+
+    >>> def f(x, y):
+    ...     return (1 - x) ** 2 + 100 * (y - x ** 2) ** 2
+    ...
+    >>> LBFGS(f, -1.2, 1)
+    array([0.99999999, 0.99999998])
+    >>> LBFGS(f, -1.2, 1, full_output=True).n_iter
+    35
+    """
+    if memory < 1:
+        raise ValueError(f'memory must be positive, got {memory}')
+    if not 0 < c1 < c2 < 1:
+        raise ValueError(f'The line search needs 0 < c1 < c2 < 1, got c1={c1} and c2={c2}')
+    x = np.array(x0, dtype=float)
+    # trace f once, then replay the recorded operations for the value and gradient of every evaluation
+    gradient = _gradient(f, len(x))
+    n_fev = 0
+
+    def evaluate(x):
+        nonlocal n_fev
+        n_fev += 1
+        val, der = gradient(x)
+        return val, np.atleast_1d(der).astype(float)
+
+    val, der = evaluate(x)
+    if np.ndim(val) > 0:
+        raise TypeError('LBFGS minimizes scalar functions, f returned a list')
+    norms = [np.linalg.norm(der)]
+    history = deque(maxlen=memory)
+    for n_iter in range(max_iter):
+        # if the norm of the gradient is less than tolerance, consider the method converged
+        if norms[-1] < tol:
+            # if result list has length 1, return the number without the bracket
+            sol = x.item() if len(x) == 1 else x
+            if full_output:
+                return OptimizeResult(sol, val, n_iter, n_fev, n_fev, norms)
+            return sol
+        direction = -_two_loop(der, history)
+        # without curvature pairs the direction is the gradient, whose scale is unknown
+        step = 1. if history else min(1., 1. / norms[-1])
+        found = _wolfe_line_search(evaluate, x, val, der, direction, step, c1, c2)
+        if found is None:
+            raise RuntimeError(f'The line search does not find a step after {n_iter} iterations!')
+        new_x, new_val, new_der = found
+        s, y = new_x - x, new_der - der
+        # skip the pair when the curvature s^T y is not positive, it would spoil the inverse Hessian
+        if s @ y > np.finfo(float).eps * (y @ y):
+            history.append((s, y, 1. / (s @ y)))
+        x, val, der = new_x, new_val, new_der
+        norms.append(np.linalg.norm(der))
+    raise RuntimeError(f'The function does not converge in {max_iter} iterations!')
+
+def _two_loop(der, history):
+    r"""Helper function that applies the L-BFGS approximation of the inverse Hessian to the gradient with the
+    two-loop recursion. The initial approximation is the identity scaled by
+    :math:`\mathbf{s}^T\mathbf{y} / \mathbf{y}^T\mathbf{y}` of the last pair.
+
+    :param der: The gradient
+    :type der: numpy array
+    :param history: The pairs :math:`(\mathbf{s}_i, \mathbf{y}_i, 1 / \mathbf{s}_i^T\mathbf{y}_i)`, oldest first
+    :type history: collections.deque
+
+    :return: :math:`H_k \nabla f(\mathbf{x}_{k})`
+    :rtype: numpy array
+    """
+    q = der.copy()
+    alphas = []
+    for s, y, rho in reversed(history):
+        alpha = rho * (s @ q)
+        q -= alpha * y
+        alphas.append(alpha)
+    if history:
+        s, y, rho = history[-1]
+        q *= 1. / (rho * (y @ y))
+    for (s, y, rho), alpha in zip(history, reversed(alphas)):
+        beta = rho * (y @ q)
+        q += (alpha - beta) * s
+    return q
+
+def _wolfe_line_search(evaluate, x, val, der, direction, step, c1, c2, max_evaluations=30):
+    r"""Helper function that finds a step along ``direction`` that satisfies the strong Wolfe conditions, by
+    doubling the step until it brackets one and then zooming into the bracket with safeguarded quadratic
+    interpolation (Nocedal and Wright, algorithms 3.5 and 3.6).
+
+    :param evaluate: The function :math:`\mathbf{x} \mapsto (f(\mathbf{x}), \nabla f(\mathbf{x}))`
+    :type evaluate: function object
+    :param x: The current point
+    :type x: numpy array
+    :param val: The function evaluation at ``x``
+    :type val: float
+    :param der: The gradient at ``x``
+    :type der: numpy array
+    :param direction: The descent direction :math:`\mathbf{p}`
+    :type direction: numpy array
+    :param step: The first step tried
+    :type step: float
+    :param max_evaluations: The maximum number of evaluations, defaults to 30
+    :type max_evaluations: integer
+
+    :return: The new point, its function evaluation and its gradient, or None when no step is found.
+        When the evaluations run out, the best point found that satisfies the sufficient decrease is returned
+    :rtype: tuple or None
+    """
+    slope = der @ direction
+    if slope >= 0:
+        # not a descent direction, e.g. after a poor update; fall back to the gradient
+        direction = -der
+        slope = der @ direction
+    def sample(alpha):
+        new_x = x + alpha * direction
+        new_val, new_der = evaluate(new_x)
+        return new_val, new_der @ direction, (new_x, new_val, new_der)
+
+    # lo is the best step so far that satisfies the sufficient decrease, hi closes the bracket
+    lo, val_lo, slope_lo, found_lo = 0., val, slope, None
+    hi = val_hi = None
+    alpha = step
+    for _ in range(max_evaluations):
+        new_val, new_slope, found = sample(alpha)
+        if not np.isfinite(new_val) or new_val > val + c1 * alpha * slope or new_val >= val_lo:
+            hi, val_hi = alpha, new_val
+        elif abs(new_slope) <= -c2 * slope:
+            return found
+        else:
+            # keep a minimizer between lo and hi: when the slope points away from hi, the old lo closes the bracket
+            if new_slope * ((hi if hi is not None else np.inf) - alpha) >= 0:
+                hi, val_hi = lo, val_lo
+            lo, val_lo, slope_lo, found_lo = alpha, new_val, new_slope, found
+        if hi is None:
+            alpha = 2 * alpha
+            continue
+        # minimize the quadratic through (lo, val_lo) with slope slope_lo and (hi, val_hi), kept inside the bracket
+        width = hi - lo
+        curvature = val_hi - val_lo - slope_lo * width if np.isfinite(val_hi) else np.inf
+        alpha = lo - slope_lo * width ** 2 / (2 * curvature) if curvature > 0 else lo + width / 2
+        low, high = sorted((lo + 0.1 * width, hi - 0.1 * width))
+        alpha = min(max(alpha, low), high)
+    return found_lo
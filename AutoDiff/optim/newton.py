@@ -1,7 +1,8 @@
 import numpy as np
 from .. import Forward
+from .result import OptimizeResult
 
-def Newton(f: callable, *x0, tol=1e-5, max_iter=500, n_iter=1):
+def Newton(f: callable, *x0, tol=1e-5, max_iter=500, full_output=False, max_reuse=0, stall=0.5):
     r"""
     Newton's method
 
@@ -11,17 +12,39 @@ def Newton(f: callable, *x0, tol=1e-5, max_iter=500, n_iter=1):
                   J_F(\mathbf{x}_k)\Delta \mathbf{x}_{k} &= - F(\mathbf{x}_{k}) \\
               \mathbf{x}_{k+1} &\gets \mathbf{x}_{k} + \Delta \mathbf{x}_{k}
     where :math:`J_F(\mathbf{x}_k)` is the Jacobian and :math:`\Delta \mathbf{x}_{k}` is the update.
-    
+
+    Each iteration runs a single :py:class:`AutoDiff.forward.Forward` pass, whose ``val`` is used for the
+    convergence check and whose ``der`` gives the update, so ``f`` is evaluated once per iteration.
+
+    With ``max_reuse`` greater than 0 (Shamanskii's method, or the chord method when ``max_reuse`` is None), the
+    Jacobian :math:`J_F(\mathbf{x}_k)` and its QR factorization are kept for the following iterations, which then
+    only evaluate ``f`` and solve with the factors in :math:`O(m^2)` instead of running a forward pass of
+    :math:`m` directions and factoring anew in :math:`O(m^3)`. The Jacobian is recomputed after ``max_reuse``
+    iterations, with a single forward pass, or as soon as an iteration reduces :math:`\|F(\mathbf{x})\|` by less
+    than the factor ``stall``, which takes an evaluation of ``f`` to detect.
+    Convergence is linear instead of quadratic, but each iteration is much cheaper for large systems.
+
     :param f: A callable function object, the :math:`F: \mathbb{R}^m \mapsto \mathbb{R}^n` function
     :type f: function object
     :param x0: The initial guess, note that Newton is quadratic convergence if initial guess is close to the actual solution
     :type x0: integer or float or numpy array or list of integers or floats
     :param tol: The tolerance, the algorithm terminates when it hits the tolerance i.e. when :math:`\|F(\mathbf{x})\|_F < \text{tol}` is reached, the algorithm terminates
     :type tol: float
+    :param max_iter: The maximum number of iterations, defaults to 500
+    :type max_iter: integer
+    :param full_output: If True, return a :py:class:`AutoDiff.optim.result.OptimizeResult` with the solution
+        and the iteration statistics instead of the solution alone, defaults to False
+    :type full_output: bool
+    :param max_reuse: The number of iterations after the one that computed a Jacobian that reuse it, defaults to 0
+        (Newton's method). None reuses it until convergence stalls (the chord method)
+    :type max_reuse: integer or None
+    :param stall: A reused Jacobian is recomputed when an iteration reduces :math:`\|F(\mathbf{x})\|` by less
+        than this factor, defaults to 0.5
+    :type stall: float
     :raises RuntimeError: If the function does not converge in max_iter iterations
-    
-    :return: The solution :math:`\mathbf{x}`
-    :rtype: float or list of floats
+
+    :return: The solution :math:`\mathbf{x}`, or the OptimizeResult if ``full_output`` is True
+    :rtype: float or list of floats or OptimizeResult
 
     >>> x0 = [0, 1]
     >>> def f(x1, x2):
@@ -31,30 +54,155 @@ def Newton(f: callable, *x0, tol=1e-5, max_iter=500, n_iter=1):
     >>>     ]
     >>> sol = Newton(f, *x0)
     >>> sol
-    array([0.19759433, 0.42551406]) 
+    array([0.19759433, 0.42551406])
     >>> f(*sol)
     [-4.3786574366322384e-10, -3.137059279012533e-09]
+    >>> Newton(f, *x0, full_output=True).n_fev
+    4
+    >>> res = Newton(f, *x0, max_reuse=None, full_output=True)
+    >>> res.n_fev, res.n_jev
+    (7, 1)
+    """
+    x = np.array(x0, dtype=float)
+    norms = []
+    n_fev = n_jev = 0
+    # the factored Jacobian, and the number of iterations that reused it
+    jacobian, age = None, 0
+    for n_iter in range(max_iter):
+        if jacobian is not None:
+            age += 1
+            # recompute the Jacobian when its age runs out, without evaluating f with the old one first
+            if max_reuse is not None and age > max_reuse:
+                jacobian = None
+            else:
+                val = _evaluate(f, x)
+                n_fev += 1
+                # or when the residual does not decrease fast enough
+                if np.linalg.norm(val) > stall * norms[-1]:
+                    jacobian = None
+        if jacobian is None:
+            # use Forward AD for the function evaluation and the derivative in a single pass
+            g = Forward(f, *x)
+            n_fev += 1
+            n_jev += 1
+            val = g.val
+            if max_reuse != 0:
+                jacobian, age = _Factorization(g.der, val), 0
+        norms.append(np.linalg.norm(val))
+        # if the norm of the function is less than the tolerance, consider the method converged
+        if norms[-1] < tol:
+            # if result list has length 1, return the number without the bracket
+            sol = x.item() if len(x) == 1 else x
+            if full_output:
+                return OptimizeResult(sol, val, n_iter, n_fev, n_jev, norms)
+            return sol
+        x = x + (jacobian.solve(val) if jacobian is not None else _newton_step(val, g.der))
+    raise RuntimeError(f'The function does not converge in {max_iter} iterations!')
+
+def _evaluate(f: callable, x):
+    """Helper function that evaluates ``f`` at ``x`` without derivatives, with the output in the layout
+    of :py:attr:`AutoDiff.forward.Forward.val`.
+
+    :param f: A callable function object
+    :type f: function object
+    :param x: The variables
+    :type x: numpy array
+
+    :return: The function evaluation
+    :rtype: float or numpy array
+    """
+    val = f(*x)
+    if isinstance(val, list):
+        return np.array(val, dtype=float)
+    return val
+
+def _newton_step(val, der):
+    r"""Helper function that solves the Newton system :math:`J \Delta \mathbf{x} = -F` in the least-squares sense.
+
+    :param val: The function evaluation :math:`F`
+    :type val: integer or float or numpy array
+    :param der: The Jacobian :math:`J`, in the layout of :py:attr:`AutoDiff.forward.Forward.der`
+    :type der: integer or float or numpy array
+
+    :return: The update :math:`\Delta \mathbf{x}`
+    :rtype: float or numpy array
+    """
+    if isinstance(der, (int, float)):
+        # if the derivative is a number, perform Newton's Method in 1D
+        return -val / der
+    # else perform Newton's Method in nD
+    der = np.asarray(der)
+    val = np.atleast_1d(val)
+    if der.ndim == 1:
+        # a gradient row of a scalar function, or a Jacobian column of a vector function of one variable
+        der = der.reshape(len(val), -1)
+    update, *_ = np.linalg.lstsq(der, -val, rcond=None)
+    return update
+
+class _Factorization:
+    r"""The QR factorization of a Jacobian, kept to solve the Newton system
+    :math:`J \Delta \mathbf{x} = -F` for several residuals :math:`F` in :math:`O(nm)` each.
+    A system with at least as many equations as unknowns is solved in the least-squares sense with
+    :math:`J = QR`, and an underdetermined one with the minimum-norm solution from :math:`J^T = QR`.
+    A rank-deficient Jacobian falls back to :py:func:`numpy.linalg.lstsq`.
+
+    :param der: The Jacobian :math:`J`, in the layout of :py:attr:`AutoDiff.forward.Forward.der`
+    :type der: integer or float or numpy array
+    :param val: The function evaluation the Jacobian was computed with
+    :type val: integer or float or numpy array
+    """
+
+    __slots__ = ('der', 'q', 'r', 'transposed')
+
+    def __init__(self, der, val):
+        self.q = self.r = None
+        if isinstance(der, (int, float)):
+            self.der = der
+            return
+        der = np.asarray(der)
+        if der.ndim == 1:
+            # a gradient row of a scalar function, or a Jacobian column of a vector function of one variable
+            der = der.reshape(len(np.atleast_1d(val)), -1)
+        self.der = der
+        self.transposed = der.shape[0] < der.shape[1]
+        q, r = np.linalg.qr(der.T if self.transposed else der)
+        diagonal = np.abs(np.diag(r))
+        if diagonal.min() > max(der.shape) * np.finfo(float).eps * diagonal.max():
+            self.q, self.r = q, r
+
+    def solve(self, val):
+        r"""Solve the Newton system for the residual ``val``.
+
+        :param val: The function evaluation :math:`F`
+        :type val: integer or float or numpy array
+
+        :return: The update :math:`\Delta \mathbf{x}`
+        :rtype: float or numpy array
+        """
+        if self.r is None:
+            return _newton_step(val, self.der)
+        val = np.atleast_1d(val)
+        if self.transposed:
+            # J = R^T Q^T, the minimum-norm solution is Q R^{-T} (-F)
+            return self.q @ _substitute(self.r.T, -val, lower=True)
+        return _substitute(self.r, self.q.T @ -val, lower=False)
+
+def _substitute(r, b, lower):
+    r"""Helper function that solves a triangular system by substitution, one row at a time.
+
+    :param r: A square triangular matrix with a nonzero diagonal
+    :type r: numpy array
+    :param b: The right-hand side
+    :type b: numpy array
+    :param lower: True if ``r`` is lower triangular, False if it is upper triangular
+    :type lower: bool
+
+    :return: The solution of :math:`r \mathbf{x} = \mathbf{b}`
+    :rtype: numpy array
     """
-    n_iter += 1
-    if n_iter == max_iter:
-        raise RuntimeError(f'The function does not converge in {n_iter} iterations!')
-    x0 = np.array(x0)
-    # if the norm of the function is less than the tolerance, consider the method converged
-    if np.linalg.norm(f(*x0)) < tol:
-        # if result list has length 1, return the number without the bracket
-        if len(x0) == 1:
-            return x0.item()
-        return x0
-    # use Forward AD for derivative calculation
-    g = Forward(f, *x0)
-    if isinstance(g.der, (int, float)):
-        # if the derivative g is a number, perform Newton's Method in 1D
-        new_x = x0 - g.val / g.der
-    else:
-        # else perform Newton's Method in nD
-        if g.der.ndim == 1:
-            g.der = g.der.reshape(1, -1)
-            g.val = np.array(g.val).reshape(1)
-        update, *_ = np.linalg.lstsq(g.der, -g.val, rcond=None)
-        new_x = x0 + update
-    return Newton(f, *new_x, tol=tol, n_iter=n_iter)
\ No newline at end of file
+    m = len(b)
+    x = np.zeros(m)
+    for i in (range(m) if lower else reversed(range(m))):
+        known = slice(0, i) if lower else slice(i + 1, m)
+        x[i] = (b[i] - r[i, known] @ x[known]) / r[i, i]
+    return x
@@ -0,0 +1,237 @@
+import numpy as np
+from .. import Forward
+from .newton import _evaluate, _substitute
+from .result import OptimizeResult
+
+def NewtonKrylov(f: callable, *x0, tol=1e-5, max_iter=100, full_output=False, method='gmres',
+                 preconditioner=None, forcing=None, restart=30, max_inner=200):
+    r"""
+    Jacobian-free Newton-Krylov method
+
+    To find :math:`\mathbf{x}` such that :math:`F(\mathbf{x}) = \mathbf{0}` for :math:`F: \mathbb{R}^m \mapsto \mathbb{R}^m`,
+    each Newton update :math:`\Delta \mathbf{x}_{k}` solves :math:`J_F(\mathbf{x}_k)\Delta \mathbf{x}_{k} = - F(\mathbf{x}_{k})`
+    inexactly with a Krylov method, GMRES or BiCGStab, up to the relative residual :math:`\eta_k`
+
+    .. math::
+            \|F(\mathbf{x}_{k}) + J_F(\mathbf{x}_k)\Delta \mathbf{x}_{k}\| \le \eta_k \|F(\mathbf{x}_{k})\|
+
+    The Krylov method only needs products of the Jacobian with vectors, and each one is a single forward pass
+    with one scalar tangent per variable, see :py:meth:`AutoDiff.forward.Forward.jvp`. The Jacobian is never
+    formed, so the memory is :math:`O(m)` per Krylov vector instead of :math:`O(m^2)`.
+
+    :param f: A callable function object, the :math:`F: \mathbb{R}^m \mapsto \mathbb{R}^m` function
+    :type f: function object
+    :param x0: The initial guess
+    :type x0: integer or float or numpy array or list of integers or floats
+    :param tol: The algorithm terminates when :math:`\|F(\mathbf{x})\| < \text{tol}` is reached
+    :type tol: float
+    :param max_iter: The maximum number of Newton iterations, defaults to 100
+    :type max_iter: integer
+    :param full_output: If True, return a :py:class:`AutoDiff.optim.result.OptimizeResult` with the solution
+        and the iteration statistics instead of the solution alone, where ``n_jev`` counts the Jacobian-vector
+        products. Defaults to False
+    :type full_output: bool
+    :param method: The Krylov method, ``'gmres'`` (restarted GMRES) or ``'bicgstab'``, defaults to ``'gmres'``
+    :type method: string
+    :param preconditioner: A function ``preconditioner(x, v)`` that returns an approximate solution
+        :math:`\mathbf{z}` of :math:`J_F(\mathbf{x})\mathbf{z} = \mathbf{v}`, applied as a right preconditioner.
+        It must be linear in ``v``. Defaults to None, no preconditioning
+    :type preconditioner: function object
+    :param forcing: The forcing term :math:`\eta_k`, a constant in :math:`(0, 1)`. Defaults to None, which picks
+        :math:`\eta_k = 0.9 (\|F(\mathbf{x}_k)\| / \|F(\mathbf{x}_{k-1})\|)^2` (Eisenstat and Walker), so the linear
+        systems are solved loosely far from the solution and accurately close to it
+    :type forcing: float
+    :param restart: The number of GMRES iterations between restarts, defaults to 30
+    :type restart: integer
+    :param max_inner: The maximum number of Jacobian-vector products per Newton iteration, defaults to 200
+    :type max_inner: integer
+    :raises ValueError: ``method`` is unknown, or ``f`` does not have as many outputs as variables.
+    :raises RuntimeError: If the function does not converge in max_iter iterations
+
+    :return: The solution :math:`\mathbf{x}`, or the OptimizeResult if ``full_output`` is True
+    :rtype: float or numpy array or OptimizeResult
+
+    >>> def f(x1, x2):
+    >>>     return [
+    >>>         2 * x1 + x2 - np.exp(-x1),
+    >>>         -x1 + 2 * x2 - np.exp(-x2)
+    >>>     ]
+    >>> NewtonKrylov(f, 0, 1)
+    array([0.19759433, 0.42551406])
+    """
+    if method not in _SOLVERS:
+        raise ValueError(f"method must be one of {list(_SOLVERS)}, got {method!r}")
+    solver = _SOLVERS[method]
+    x = np.array(x0, dtype=float)
+    val = np.atleast_1d(_evaluate(f, x))
+    if len(val) != len(x):
+        raise ValueError(f'NewtonKrylov needs as many outputs as variables, got {len(val)} outputs for {len(x)} variables')
+    n_fev, n_jev = 1, 0
+    norms = [np.linalg.norm(val)]
+    eta = 0.9 if forcing is None else forcing
+    for n_iter in range(max_iter):
+        # if the norm of the function is less than the tolerance, consider the method converged
+        if norms[-1] < tol:
+            sol = x.item() if len(x) == 1 else x
+            if full_output:
+                return OptimizeResult(sol, val if len(val) > 1 else val.item(), n_iter, n_fev, n_jev, norms)
+            return sol
+        if forcing is None and n_iter > 0:
+            eta = _eisenstat_walker(eta, norms[-1], norms[-2])
+
+        def matvec(v, x=x):
+            # a single forward pass seeded with the direction v
+            return np.atleast_1d(Forward.jvp(f, x, v)[1])
+
+        if preconditioner is None:
+            precondition = None
+        else:
+            precondition = lambda v, x=x: np.asarray(preconditioner(x, v), dtype=float)
+        update, n_matvec = solver(matvec, -val, eta * norms[-1], precondition, restart, max_inner)
+        n_fev += n_matvec
+        n_jev += n_matvec
+        x = x + update
+        val = np.atleast_1d(_evaluate(f, x))
+        n_fev += 1
+        norms.append(np.linalg.norm(val))
+    raise RuntimeError(f'The function does not converge in {max_iter} iterations!')
+
+def _eisenstat_walker(eta, norm, previous_norm, gamma=0.9, alpha=2, eta_max=0.9):
+    r"""Helper function that returns the next forcing term, choice 2 of Eisenstat and Walker with the
+    safeguard that keeps :math:`\eta_k` from dropping too fast when the previous one was large.
+
+    :param eta: The previous forcing term :math:`\eta_{k-1}`
+    :type eta: float
+    :param norm: The norm of the current function evaluation :math:`\|F(\mathbf{x}_k)\|`
+    :type norm: float
+    :param previous_norm: The norm of the previous function evaluation :math:`\|F(\mathbf{x}_{k-1})\|`
+    :type previous_norm: float
+
+    :return: The forcing term :math:`\eta_k`
+    :rtype: float
+    """
+    new_eta = gamma * (norm / previous_norm) ** alpha
+    safeguard = gamma * eta ** alpha
+    if safeguard > 0.1:
+        new_eta = max(new_eta, safeguard)
+    return min(new_eta, eta_max)
+
+def _gmres(matvec, b, atol, precondition, restart, max_matvec):
+    r"""Helper function that solves :math:`A\mathbf{x} = \mathbf{b}` with restarted GMRES, from
+    :math:`\mathbf{x} = \mathbf{0}` and with right preconditioning. The Arnoldi basis is built with modified
+    Gram-Schmidt and the least-squares problem is updated with Givens rotations.
+
+    :param matvec: The function :math:`\mathbf{v} \mapsto A\mathbf{v}`
+    :type matvec: function object
+    :param b: The right-hand side
+    :type b: numpy array
+    :param atol: The iterations stop when :math:`\|\mathbf{b} - A\mathbf{x}\| \le \text{atol}`
+    :type atol: float
+    :param precondition: The function :math:`\mathbf{v} \mapsto M^{-1}\mathbf{v}`, or None
+    :type precondition: function object
+    :param restart: The number of iterations between restarts
+    :type restart: integer
+    :param max_matvec: The maximum number of products with :math:`A`
+    :type max_matvec: integer
+
+    :return: The approximate solution and the number of products with :math:`A`
+    :rtype: tuple
+    """
+    n = len(b)
+    x = np.zeros(n)
+    r = b
+    n_matvec = 0
+    while n_matvec < max_matvec:
+        beta = np.linalg.norm(r)
+        if beta <= atol:
+            break
+        size = min(restart, n, max_matvec - n_matvec)
+        V = np.zeros((size + 1, n))
+        H = np.zeros((size + 1, size))
+        cs, sn = np.zeros(size), np.zeros(size)
+        g = np.zeros(size + 1)
+        V[0] = r / beta
+        g[0] = beta
+        k = 0
+        while k < size:
+            w = matvec(V[k] if precondition is None else precondition(V[k]))
+            n_matvec += 1
+            for i in range(k + 1):
+                H[i, k] = w @ V[i]
+                w = w - H[i, k] * V[i]
+            H[k + 1, k] = np.linalg.norm(w)
+            if H[k + 1, k] > 0:
+                V[k + 1] = w / H[k + 1, k]
+            # apply the previous rotations to the new column, then the rotation that zeroes its last entry
+            for i in range(k):
+                H[i, k], H[i + 1, k] = cs[i] * H[i, k] + sn[i] * H[i + 1, k], -sn[i] * H[i, k] + cs[i] * H[i + 1, k]
+            denominator = np.hypot(H[k, k], H[k + 1, k])
+            if denominator == 0:
+                # the new direction adds nothing to the Krylov space, e.g. the Jacobian is singular
+                break
+            cs[k], sn[k] = H[k, k] / denominator, H[k + 1, k] / denominator
+            H[k, k], H[k + 1, k] = denominator, 0.
+            g[k], g[k + 1] = cs[k] * g[k], -sn[k] * g[k]
+            k += 1
+            # |g[k]| is the residual norm of the current iterate
+            if abs(g[k]) <= atol:
+                break
+        if k == 0:
+            break
+        y = _substitute(H[:k, :k], g[:k], lower=False)
+        update = V[:k].T @ y
+        x = x + (update if precondition is None else precondition(update))
+        if abs(g[k]) <= atol or n_matvec >= max_matvec:
+            break
+        # restart from the true residual
+        r = b - matvec(x)
+        n_matvec += 1
+    return x, n_matvec
+
+def _bicgstab(matvec, b, atol, precondition, restart, max_matvec):
+    r"""Helper function that solves :math:`A\mathbf{x} = \mathbf{b}` with BiCGStab, from :math:`\mathbf{x} = \mathbf{0}`
+    and with right preconditioning. It takes two products with :math:`A` per iteration and keeps only a few vectors,
+    whatever the number of iterations. The arguments are those of :py:func:`AutoDiff.optim.newton_krylov._gmres`,
+    ``restart`` is not used.
+
+    :return: The approximate solution and the number of products with :math:`A`
+    :rtype: tuple
+    """
+    if precondition is None:
+        precondition = lambda v: v
+    x = np.zeros(len(b))
+    r = b
+    r_hat = b
+    rho = alpha = omega = 1.
+    v = p = np.zeros(len(b))
+    n_matvec = 0
+    while n_matvec + 2 <= max_matvec and np.linalg.norm(r) > atol:
+        rho, previous_rho = r_hat @ r, rho
+        if rho == 0 or omega == 0:
+            break
+        p = r + (rho / previous_rho) * (alpha / omega) * (p - omega * v)
+        p_hat = precondition(p)
+        v = matvec(p_hat)
+        n_matvec += 1
+        denominator = r_hat @ v
+        if denominator == 0:
+            # breakdown: the shadow residual is orthogonal to the new direction, e.g. the Jacobian is singular
+            break
+        alpha = rho / denominator
+        s = r - alpha * v
+        if np.linalg.norm(s) <= atol:
+            x = x + alpha * p_hat
+            break
+        s_hat = precondition(s)
+        t = matvec(s_hat)
+        n_matvec += 1
+        if t @ t == 0:
+            # the stabilizing step adds nothing, keep the first half of the iteration
+            x = x + alpha * p_hat
+            break
+        omega = (t @ s) / (t @ t)
+        x = x + alpha * p_hat + omega * s_hat
+        r = s - omega * t
+    return x, n_matvec
+
+_SOLVERS = {'gmres': _gmres, 'bicgstab': _bicgstab}
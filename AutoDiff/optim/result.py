@@ -0,0 +1,70 @@
+import numpy as np
+
+class OptimizeResult:
+    r"""
+    The solution found by an optimization method of :py:mod:`AutoDiff.optim`, together with statistics
+    about the iterations. It is returned instead of the solution when the method is called with ``full_output=True``.
+
+    :param x: The solution
+    :type x: float or numpy array
+    :param val: The function evaluation at the solution
+    :type val: float or numpy array
+    :param n_iter: The number of iterations, i.e. of updates of the solution
+    :type n_iter: integer
+    :param n_fev: The number of evaluations of the function
+    :type n_fev: integer
+    :param n_jev: The number of evaluations of the derivative (Jacobian or gradient)
+    :type n_jev: integer
+    :param norms: The norm checked for convergence at the start of every iteration and at the solution, of the
+        function evaluation for the root finders and of the gradient for the minimizers
+    :type norms: list of floats
+
+    :ivar x: The solution
+    :vartype x: float or numpy array
+    :ivar val: The function evaluation at the solution
+    :vartype val: float or numpy array
+    :ivar n_iter: The number of iterations
+    :vartype n_iter: integer
+    :ivar n_fev: The number of evaluations of the function
+    :vartype n_fev: integer
+    :ivar n_jev: The number of evaluations of the derivative
+    :vartype n_jev: integer
+    :ivar norms: The norms checked for convergence, the last one is the norm at the solution
+    :vartype norms: numpy array
+
+    >>> res = Newton(lambda x: x ** 2 - 2, 1, full_output=True)
+    >>> res
+    An OptimizeResult object with solution of 1.4142156862745099, after 3 iteration(s), 4 function evaluation(s) and 4 derivative evaluation(s).
+    >>> res.norms
+    array([1.00000000e+00, 2.50000000e-01, 6.94444444e-03, 6.00730488e-06])
+    """
+
+    __slots__ = ('x', 'val', 'n_iter', 'n_fev', 'n_jev', 'norms')
+
+    def __init__(self, x, val, n_iter, n_fev, n_jev, norms):
+        self.x = x
+        self.val = val
+        self.n_iter = n_iter
+        self.n_fev = n_fev
+        self.n_jev = n_jev
+        self.norms = np.array(norms, dtype=float)
+
+    def __str__(self):
+        """Print useful information for users.
+
+        :return: A string containing useful information of the OptimizeResult object.
+        :rtype: string
+
+        >>> print(Newton(lambda x: x ** 2 - 2, 1, full_output=True))
+        OptimizeResult: x=1.4142156862745099, val=6.007304882871267e-06, n_iter=3, n_fev=4, and n_jev=4.
+        """
+        return f'OptimizeResult: x={self.x}, val={self.val}, n_iter={self.n_iter}, n_fev={self.n_fev}, and n_jev={self.n_jev}.'
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing useful information of the OptimizeResult object.
+        :rtype: string
+        """
+        return (f'An OptimizeResult object with solution of {self.x}, after {self.n_iter} iteration(s), '
+                f'{self.n_fev} function evaluation(s) and {self.n_jev} derivative evaluation(s).')
@@ -1,5 +1,6 @@
 import numpy as np
-from .. import Forward
+from .. import Reverse
+from ..compiled import compile
 
 def SGD(f: callable, *x0, eta=1e-1, n_iter=50000, tol=1e-5):
     r"""
@@ -10,7 +11,11 @@ def SGD(f: callable, *x0, eta=1e-1, n_iter=50000, tol=1e-5):
     .. math::
         \mathbf{x} \gets \mathbf{x} - \eta \nabla f(\mathbf{x})
 
-    where :math:`f: \mathbb{R}^n \mapsto \mathbb{R}`
+    where :math:`f: \mathbb{R}^n \mapsto \mathbb{R}`.
+    ``f`` is traced once with :py:func:`AutoDiff.compiled.compile`, and each iteration replays the
+    recorded operations to get :math:`f(\mathbf{x})` and :math:`\nabla f(\mathbf{x})`. The tape only holds
+    scalars, so when the tracing hits an operation it does not support (e.g. an arithmetic operation with
+    an array constant), the remaining iterations use :py:class:`AutoDiff.reverse.Reverse` instead.
 
     :param f: A callable function object, the :math:`F: \mathbb{R}^n \mapsto \mathbb{R}` function
     :type f: function object
@@ -47,18 +52,49 @@ def SGD(f: callable, *x0, eta=1e-1, n_iter=50000, tol=1e-5):
     >>> f(*sol2)
     6.427752177035966e-06
     """
+    x0 = np.array(x0, dtype=float)
+    # trace f once, then replay the recorded operations for the value and gradient of every iteration
+    gradient = _gradient(f, len(x0))
     i = 0
     while i < n_iter:
+        val, der = gradient(x0)
         # if the norm of the function is less than tolerance, consider the method converged
-        if np.linalg.norm(f(*x0)) < tol:
+        if np.linalg.norm(val) < tol:
             # if result list has length 1, return the number without the bracket
             if len(x0) == 1:
                 return x0.item()
             return x0
         i += 1
-        # use Forward AD for derivative calculation
-        g = Forward(f, *x0)
         # apply stochastic gradient descent
-        x0 -= eta * g.der
+        x0 -= eta * der
     # if the function does not converge in 50000 iterations, we consider the function does not converge, can raise a Runtime error
     raise RuntimeError(f'The function does not converge in {n_iter} iterations!')
+
+def _gradient(f: callable, n_inputs):
+    r"""Helper function that returns the function :math:`\mathbf{x} \mapsto (f(\mathbf{x}), \nabla f(\mathbf{x}))`
+    of :py:func:`AutoDiff.optim.sgd.SGD`. It replays ``f`` compiled with :py:func:`AutoDiff.compiled.compile`,
+    and runs :py:class:`AutoDiff.reverse.Reverse` from the first time the tracing raises a TypeError or an
+    AttributeError, i.e. ``f`` applies an operation to a :py:class:`AutoDiff.tape.TNode` that it does not support.
+
+    :param f: A callable function object
+    :type f: function object
+    :param n_inputs: The number of inputs of ``f``
+    :type n_inputs: integer
+
+    :return: The function that takes the variables as an array
+    :rtype: function object
+    """
+    g = compile(f, n_inputs)
+    compiled = True
+
+    def gradient(x):
+        nonlocal compiled
+        if compiled:
+            try:
+                return g.grad(*x)
+            except (TypeError, AttributeError):
+                compiled = False
+        r = Reverse(f, *x)
+        return r.val, r.der
+
+    return gradient
@@ -1,5 +1,7 @@
 import numpy as np
 from .rnode import RNode
+from .context import trace
+from .tape import Tape, TNode
 
 class Reverse:
     r"""
@@ -12,6 +14,14 @@ class Reverse:
     :param variables: inputs
     :type variables: integer or floats or numpy array or list of integers or floats
 
+    :param flat: If True, record the computation on a flat array-backed :py:class:`AutoDiff.tape.Tape`
+        instead of a graph of RNodes, which needs far less memory per operation. Defaults to False
+    :type flat: bool
+
+    :param batch: If True, each variable is an array of :math:`N` sample points and ``f`` is differentiated
+        at all of them in one pass, as in :py:class:`AutoDiff.forward.Forward`. Defaults to False
+    :type batch: bool
+
     :ivar val: Output of function ``f(*variables)``
     :vartype val: integer or float or numpy array
 
@@ -65,8 +75,8 @@ class Reverse:
             [100.,   0.]])
     """
 
-    def __init__(self, f: callable, *variables):
-        self.val, self.der = self.grad(f, *variables)
+    def __init__(self, f: callable, *variables, flat=False, batch=False):
+        self.val, self.der = self.grad(f, *variables, flat=flat, batch=batch)
 
     def __str__(self):
         """Print useful information for users.
@@ -101,12 +111,16 @@ class Reverse:
         return f'A Reverse object with value of {self.val}, and derivative of {self.der}.'
 
     @staticmethod
-    def grad(f: callable, *variables):
+    def grad(f: callable, *variables, flat=False, batch=False):
         r"""
         Evaluate the full Jacobian in reverse mode. This is the method that is used internally
         by :py:meth:`AutoDiff.reverse.Reverse.__init__`.
-        For each scalar function, use a forward pass and a reverse pass.
-        Stack the partial derivative columns into the full Jacobian.
+        The forward pass records every RNode in topological order on a tape. Then for each
+        scalar function, a single reverse sweep over the tape pushes the adjoints from the output
+        back to all inputs, see :py:meth:`AutoDiff.reverse.Reverse.backward`.
+        With ``flat=True`` the forward pass is recorded on a :py:class:`AutoDiff.tape.Tape`
+        and the sweep runs over its arrays, see :py:meth:`AutoDiff.tape.Tape.backward`.
+        Stack the gradient rows into the full Jacobian.
 
         :param f: A callable function to perform differentaition on
         :type f: function object
@@ -114,67 +128,195 @@ class Reverse:
         :param variables: The input for variables of function ``f``
         :type variables: integer or float or numpy array or list of integers or floats
 
+        :param flat: If True, record the computation on a flat array-backed tape, defaults to False
+        :type flat: bool
+
+        :param batch: If True, each variable is an array of sample points (scalars are broadcast) and
+            the values and adjoints of the RNodes are arrays over the samples. Then ``val`` has the shape
+            :math:`(N,)` and ``der`` the shape :math:`(N, m)` for a scalar function, or :math:`(N, n)`
+            and :math:`(N, n, m)` for a vector function with :math:`n` outputs. Defaults to False
+        :type batch: bool
+        :raises ValueError: ``flat`` and ``batch`` are both True, the flat tape only holds scalars.
+
         :return: Jacobian
             i.e. :math:`\frac{\partial f(\text{variables})}{\partial \text{variables}}`.
-            Stack the partial derivative columns into the full Jacobian.
+            Stack the gradient rows into the full Jacobian.
         :rtype: integer or float or numpy array
         """
         # Helper function when Reverse class is initialized, see usage in init.
         num_variables = len(variables)
-        variables = [RNode(var) for var in variables]
-        output = f(*variables)
-        if isinstance(output, list): # vector function
-            output = [o if isinstance(o, RNode) else RNode(o)for o in output]
-        else: # scalar function
-            if not isinstance(output, RNode):
-                output = RNode(output)
-        ders = []
-
-        for var in variables:
-            output_depend = []
-            var_der = var.grad_vec(output_depend)
-            # var_der: ordered list of derivatives of each parent of var
-            # output_depend: ordered list of output rnode that each parent of var points to
-            var.clear() # clear the paths to prepare for the next iteration of variables
-
-            # sum up the partial derivaties of each scalar function in var_der
-            unique_depend = []
-            unique_grad = []
-            for j, o in enumerate(output_depend):
-                if o not in unique_depend:
-                    unique_depend.append(o)
-                    unique_grad.append(var_der[j])
-                else:
-                    unique_grad[unique_depend.index(o)] += var_der[j]
-            var_der = unique_grad # now var_der is ordered derivatives of each scalar function
-            
+        if batch:
+            if flat:
+                raise ValueError('The flat tape does not support batch evaluation')
+            variables = np.broadcast_arrays(*[np.asarray(var, dtype=float) for var in variables])
+            shape = variables[0].shape
+        if flat:
+            tape = Tape()
+            variables = [tape.variable(var) for var in variables]
+            output = f(*variables)
             if isinstance(output, list): # vector function
-                if len(var_der) < len(output):
-                    for idx, o in enumerate(output):
-                        if o not in output_depend:
-                            if id(o) == id(var): # case: f1(x1) = x1
-                                var_der.insert(idx, 1.)
-                            else: # case: f1(x1) = x2 or f1(x1) = 3
-                                var_der.insert(idx, 0.)
-            elif output not in output_depend: # scalar function
-                if id(output) == id(var): # f(x1) = x1
-                    var_der.append(1.)
-                else: # case: f(x1) = x2 or f(x1) = 3
-                    var_der.append(0.)
-
-            if len(var_der) == 1:
-                var_der = var_der[0]
-                
-            ders.append(var_der)
-
-        ders = np.stack(ders, axis = -1) # stack derivatives of each var
-        if isinstance(output, list): # vector function
-            values = np.array([o.val for o in output])
-            if num_variables == 1: 
-                ders = ders.T # reshape column vector to 1d array
+                output = [o if isinstance(o, TNode) else tape.constant(o) for o in output]
+            elif not isinstance(output, TNode): # scalar function
+                output = tape.constant(output)
+
+            def gradient(o):
+                adjoint = tape.backward(o.index)
+                return [adjoint[var.index] if var.index <= o.index else 0. for var in variables]
+        else:
+            # record every RNode created during the forward pass, in topological order
+            with trace(tape=[]) as context:
+                variables = [RNode(var) for var in variables]
+                output = f(*variables)
+                if isinstance(output, list): # vector function
+                    output = [o if isinstance(o, RNode) else RNode(o) for o in output]
+                else: # scalar function
+                    if not isinstance(output, RNode):
+                        output = RNode(output)
+            tape = context.tape
+
+            def gradient(o):
+                Reverse.backward(tape, o)
+                return [var.der for var in variables]
+
+        outputs = output if isinstance(output, list) else [output]
+        # map each distinct output node, by identity, to the Jacobian rows it fills
+        output_rows = {}
+        for k, o in enumerate(outputs):
+            output_rows.setdefault(id(o), (o, []))[1].append(k)
+        if batch:
+            ders = np.zeros((len(outputs), num_variables) + shape)
+            for o, rows in output_rows.values():
+                for i, der in enumerate(gradient(o)):
+                    ders[rows, i] = der # broadcast adjoints of nodes that do not depend on the samples
+            values = np.stack([np.broadcast_to(o.val, shape) for o in outputs], axis=-1)
+            ders = np.moveaxis(ders, (0, 1), (-2, -1))
+            if isinstance(output, list):
+                return values, ders
+            return values[..., 0], ders[..., 0, :]
+
+        ders = np.zeros((len(outputs), num_variables))
+        for o, rows in output_rows.values():
+            ders[rows] = gradient(o)
+
+        return Reverse._stack([o.val for o in outputs], ders, isinstance(output, list))
+
+    @staticmethod
+    def vjp(f: callable, x):
+        r"""
+        Evaluate ``f`` at ``x`` and return a pullback that computes vector-Jacobian products
+        :math:`\mathbf{u}^T J_f(\mathbf{x})` without forming the Jacobian.
+        The forward pass is recorded once on a tape of RNodes. Each call of the pullback seeds the
+        outputs with the cotangent :math:`\mathbf{u}` and runs one reverse sweep over the tape,
+        so it can be called repeatedly with different cotangents and ``f`` is not run again.
+        A matrix of :math:`k` cotangents, one per row, is pulled back in a single sweep where
+        each adjoint is an array of length :math:`k`.
+
+        :param f: A callable function object, the :math:`f: \mathbb{R}^m \mapsto \mathbb{R}^n` function
+        :type f: function object
+        :param x: The input for variables of function ``f``, i.e. ``f(*x)`` is evaluated
+        :type x: integer or float or numpy array or list of integers or floats
+
+        :return: function evaluation at ``x`` and the pullback. The pullback takes a cotangent
+            of shape :math:`(n,)`, or :math:`(k, n)` for :math:`k` cotangents (a scalar or
+            shape :math:`(k,)` for a scalar function), and returns an array of shape :math:`(m,)`
+            or :math:`(k, m)`. It raises ValueError when the cotangent does not match the outputs.
+        :rtype: tuple
+
+        >>> def f(x1, x2):
+        >>>     return [x1 * x2, x1 + x2]
+        >>> val, pullback = Reverse.vjp(f, [2, 3])
+        >>> val
+        array([6, 5])
+        >>> pullback([1, 0])
+        array([3., 2.])
+        >>> pullback([[1, 0], [1, 1]])
+        array([[3., 2.],
+               [4., 3.]])
+        """
+        x = np.atleast_1d(x)
+        # record every RNode created during the forward pass, in topological order
+        with trace(tape=[]) as context:
+            variables = [RNode(var) for var in x]
+            output = f(*variables)
+            vector = isinstance(output, list)
+            outputs = output if vector else [output]
+            outputs = [o if isinstance(o, RNode) else RNode(o) for o in outputs]
+        tape = context.tape
+
+        def pullback(u):
+            u = np.asarray(u, dtype=float)
+            if vector:
+                if u.ndim not in (1, 2) or u.shape[-1] != len(outputs):
+                    raise ValueError(f'Expected cotangents with {len(outputs)} entries, got shape {u.shape}')
+                cotangents = u.T # one entry, or one array over the k cotangents, per output
+            else:
+                if u.ndim > 1:
+                    raise ValueError(f'Expected a scalar or a vector of cotangents, got shape {u.shape}')
+                cotangents = [u]
+            # an output node may be repeated, its seed is the sum of its cotangents
+            seeds = {}
+            for o, c in zip(outputs, cotangents):
+                seeds[id(o)] = seeds.get(id(o), 0.) + c
+            for node in reversed(tape):
+                node.der = sum(p(child.der) if callable(p) else p * child.der for p, child in node.parent) \
+                    + seeds.get(id(node), 0.)
+            shape = cotangents[0].shape
+            return np.stack([np.broadcast_to(var.der, shape) for var in variables], axis=-1)
+
+        values = np.array([o.val for o in outputs]) if vector else outputs[0].val
+        return values, pullback
+
+    @staticmethod
+    def _stack(values, ders, vector):
+        """Helper function that shapes the output values and the gradient rows the way
+        :py:meth:`AutoDiff.reverse.Reverse.grad` returns them.
+
+        :param values: The values of the outputs
+        :type values: list of integers or floats
+        :param ders: The gradient rows, one row per output
+        :type ders: numpy array
+        :param vector: Whether the function is a vector function (returns a list)
+        :type vector: bool
+
+        :return: function evaluation and Jacobian
+        :rtype: tuple
+        """
+        if vector: # vector function
+            values = np.array(values)
+            if len(values) == 1:
+                ders = ders[0]
+            elif ders.shape[1] == 1:
+                ders = ders.T # one row per variable
         else: # scalar function
-            values = output.val
-            ders = ders.T
+            values = values[0]
+            ders = ders[0]
             if len(ders) == 1:
                 ders = ders[0]
-        return values, ders
\ No newline at end of file
+        return values, ders
+
+    @staticmethod
+    def backward(tape, output):
+        r"""Reverse sweep over a tape of RNodes recorded in topological order. On return, the
+        ``der`` field of every RNode on the tape holds the adjoint
+        :math:`\frac{\partial \text{output}}{\partial \text{node}}`.
+        The nodes are visited from last to first, so all the RNodes that depend on a node
+        have their adjoints ready when the node is visited. The cost is linear in the size of the tape.
+
+        :param tape: The RNodes of a forward pass in topological order
+        :type tape: list of RNode objects
+        :param output: The RNode to differentiate, it must be on the tape
+        :type output: RNode
+
+        >>> from AutoDiff.context import trace
+        >>> with trace(tape=[]) as context:
+        >>>     x1 = RNode(5)
+        >>>     x2 = RNode(3)
+        >>>     f1 = x1 * x2 + x1
+        >>> Reverse.backward(context.tape, f1)
+        >>> x1.der, x2.der
+        (4.0, 5.0)
+        """
+        for node in reversed(tape):
+            node.der = sum(p(child.der) if callable(p) else p * child.der for p, child in node.parent)
+            if node is output:
+                node.der += 1.
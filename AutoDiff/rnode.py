@@ -1,4 +1,8 @@
+import functools
+import operator
 import numpy as np
+from .node import _any, _array_ufunc, _array_function, _as_object, _innermost, _is_object_array, _kept_shape, _object_dot, _select
+from .context import _current, current
 
 class RNode:
     """This is a class that implements the Reverse Nodes for reverse mode calculation of
@@ -19,6 +23,17 @@ class RNode:
     :ivar parent: A list of parent RNodes of the current RNode
     :vartype parent: list
 
+    When the running :py:class:`AutoDiff.context.TraceContext` has a tape, every new RNode is appended
+    to it, so the tape holds the nodes of a forward pass in topological order.
+    See :py:meth:`AutoDiff.reverse.Reverse.grad`.
+
+    Each entry of ``parent`` is a pair of a partial derivative and the RNode computed from the current one.
+    For elementwise operations the partial derivative is a scalar or an array, and the contribution to the
+    adjoint of the current RNode is its product with the adjoint of that RNode. When the value of the current
+    RNode is broadcast, or the operation is not elementwise (e.g. matrix multiplication, summation along an
+    axis, reshaping and indexing), the partial derivative is a function that maps the adjoint of the computed
+    RNode to the contribution, with the shape of the value of the current RNode.
+
     >>> x1 = RNode(5)
     >>> x1.val
     5
@@ -27,12 +42,16 @@ class RNode:
     []
     """
 
-    _supported_types = (int, float)
+    __slots__ = ('val', 'der', 'parent')
+    _supported_types = (int, float, np.ndarray)
 
     def __init__(self, value):
         self.val = value
         self.der = None
         self.parent = []
+        tape = (_current.get() or current()).tape
+        if tape is not None:
+            tape.append(self)
 
     def __str__(self):
         """Print useful information for users.
@@ -73,15 +92,26 @@ class RNode:
         >>> x1.der
         >>> x2.der
         """
-        self.der = None
-        for _, p in self.parent:
-            p.clear()
+        # explicit stack instead of recursion, so deep graphs do not hit the recursion limit
+        stack = [self]
+        visited = {id(self)}
+        while stack:
+            node = stack.pop()
+            node.der = None
+            for _, p in node.parent:
+                if id(p) not in visited:
+                    visited.add(id(p))
+                    stack.append(p)
 
     def grad_vec(self, output_depend):
         """Helper function for Reverse AD, produces all gradient for its parents 
         and any parents defined in the intermediate step. See usage in Reverse class.
+        There is one gradient per entry of ``parent``, i.e. per operation the current RNode takes part in,
+        while each output reached is added to ``output_depend`` only once, the first time it is visited,
+        see :py:meth:`AutoDiff.rnode.RNode.grad`. The outputs visited by an earlier sweep keep their
+        derivatives and are not added again until :py:meth:`AutoDiff.rnode.RNode.clear` is called.
 
-        :param output_depend: A ordered list of output RNode that each parent of var points to
+        :param output_depend: An ordered list the outputs reached by the sweep are appended to
         :type output_depend: list of RNode objects
 
         :return: An ordered list of derivatives of each parent of self
@@ -95,21 +125,28 @@ class RNode:
         >>> x1.grad_vec(output_d)
         [3.0, 75.0]
         >>> output_d
-        [An RNode object with value of 140, and 0 parent(s) with derivatives and locations in []., An RNode object with value of 140, and 0 parent(s) with derivatives and locations in [].]
+        [An RNode object with value of 140, and 0 parent(s) with derivatives and locations in [].]
+        >>> x2.clear()
         >>> output_d2 = []
         >>> x2.grad_vec(output_d2)
         [5.0, 201.17973905426254, -0.3333333333333333, 1.0]
-        >>> output_d2 
-        [An RNode object with value of 140, and 0 parent(s) with derivatives and locations in []., An RNode object with value of 140, and 0 parent(s) with derivatives and locations in []., An RNode object with value of 1.9013877113318902, and 0 parent(s) with derivatives and locations in []., An RNode object with value of 1.9013877113318902, and 0 parent(s) with derivatives and locations in [].]
+        >>> output_d2
+        [An RNode object with value of 140, and 0 parent(s) with derivatives and locations in []., An RNode object with value of 1.9013877113318902, and 0 parent(s) with derivatives and locations in [].]
         """
         gradient = []
         for i in range(len(self.parent)):
             # for all parents, calculate the gradient
-            gradient.append(self.parent[i][0] * self.parent[i][1].grad(output_depend))
+            partial, child = self.parent[i]
+            adjoint = child.grad(output_depend)
+            gradient.append(partial(adjoint) if callable(partial) else partial * adjoint)
         return gradient
 
     def grad(self, output_depend):
         """Helper function for grad_vec(), see usage in grad().
+        The derivative of each RNode is computed once and kept in its ``der`` field, where ``None``
+        marks an RNode that has not been visited yet. Shared intermediate results are therefore not
+        recomputed for every path through them, and each output is added to ``output_depend`` only once.
+        Call :py:meth:`AutoDiff.rnode.RNode.clear` before differentiating again after the graph changes.
 
         :param output_depend: A ordered list of output RNode that each parent of var points to
         :type output_depend: list of RNode objects
@@ -117,14 +154,49 @@ class RNode:
         :return: An ordered list of derivatives of each parent of self
         :rtype: list of integers or floats
         """
-        if self.parent == []:
-            # at the last node, i.e. the node for function, assign derivative to be 1.0
-            self.der = 1.0
-            output_depend.append(self)
-        else:
-            self.der = sum(p[0] * p[1].grad(output_depend) for p in self.parent)
+        if self.der is not None:
+            # already visited in this sweep
+            return self.der
+        # post-order traversal with an explicit stack instead of recursion, so deep graphs
+        # do not hit the recursion limit
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            if node.der is not None:
+                stack.pop()
+                continue
+            pending = [p for _, p in node.parent if p.der is None]
+            if pending:
+                # visit the first parent first, as the recursive traversal would
+                stack.extend(reversed(pending))
+                continue
+            stack.pop()
+            if node.parent == []:
+                # at the last node, i.e. the node for function, assign derivative to be 1.0
+                node.der = 1.0
+                output_depend.append(node)
+            else:
+                node.der = sum(p(child.der) if callable(p) else p * child.der for p, child in node.parent)
         return self.der
-        
+
+    def _broadcast_from(self, *operands):
+        """Helper function called on the result of an elementwise operation whose value is an array, right after the
+        operands recorded their partial derivatives. When the value of an operand is broadcast to a larger shape, its
+        partial derivative becomes a function that sums the contribution back to the shape of that value.
+
+        :param operands: The RNodes the current RNode is computed from
+        :type operands: RNode objects
+        """
+        for operand in set(operands):
+            shape = np.shape(operand.val)
+            if shape != self.val.shape:
+                # the entries of the current RNode are the last ones of the operand
+                i = len(operand.parent) - 1
+                while i >= 0 and operand.parent[i][1] is self:
+                    partial = operand.parent[i][0]
+                    operand.parent[i] = (functools.partial(_broadcast_adjoint, partial, shape, self.val.shape), self)
+                    i -= 1
+
     def __neg__(self):
         """Overloads the built-in negation operator for handling RNodes in the forward pass 
         and returns a new RNode object with value and parent updated.
@@ -147,8 +219,8 @@ class RNode:
         with integers or floats is also supported.
 
         :param other: The item to be added to the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: An RNode object after addition, with value and parent updated.
         :rtype: RNode
@@ -163,12 +235,18 @@ class RNode:
             rnode = RNode(self.val + other.val)
             self.parent.append((1., rnode))
             other.parent.append((1., rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self, other)
             return rnode
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for addition")
         else:
             rnode = RNode(self.val + other)
             self.parent.append((1., rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def __sub__(self, other):
@@ -177,8 +255,8 @@ class RNode:
         with integers or floats is also supported.
 
         :param other: The item to be subtracted from the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: An RNode object after subtraction, with value and parent updated.
         :rtype: RNode
@@ -194,12 +272,18 @@ class RNode:
             rnode = RNode(self.val - other.val)
             self.parent.append((1., rnode))
             other.parent.append((-1., rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self, other)
             return rnode
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for subtraction")
         else:
             rnode = RNode(self.val - other)
             self.parent.append((1., rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def __mul__(self, other):
@@ -208,8 +292,8 @@ class RNode:
         with integers or floats is also supported.
 
         :param other: The item to multiply the current RNode object by.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: An RNode object after multiplication, with value and parent updated.
         :rtype: RNode
@@ -224,12 +308,18 @@ class RNode:
             rnode = RNode(self.val * other.val)
             self.parent.append((other.val, rnode))
             other.parent.append((self.val, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self, other)
             return rnode
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for multiplication")
         else:
             rnode = RNode(self.val * other)
             self.parent.append((other, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def __truediv__(self, other):
@@ -238,8 +328,8 @@ class RNode:
         with integers or floats is also supported.
 
         :param other: The item to divide the current RNode object by.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         :raises ZeroDivisionError: Division by zero.
         
         :return: An RNode object after subtraction, with value and parent updated.
@@ -252,19 +342,25 @@ class RNode:
         RNode: val=1.6666666666666667, with 0 parent(s).
         """
         if isinstance(other, RNode):
-            if other.val == 0:
+            if _any(other.val == 0):
                 raise ZeroDivisionError('Division by zero')
             rnode = RNode(self.val / other.val)
             self.parent.append((1. / other.val, rnode))
             other.parent.append((-self.val / other.val ** 2, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self, other)
             return rnode
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for division")
         else:
-            if other == 0:
+            if _any(other == 0):
                 raise ZeroDivisionError('Division by zero')
             rnode = RNode(self.val / other)
             self.parent.append((1. / other, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def sqrt(self):
@@ -281,7 +377,7 @@ class RNode:
         >>> print(x2)
         RNode: val=2.23606797749979, with 0 parent(s).
         """
-        if self.val < 0:
+        if _any(self.val < 0):
             raise ValueError('Cannot take square root of negative number.')
         rnode = RNode(np.sqrt(self.val))
         self.parent.append((1/2 * self.val ** (-1/2), rnode))
@@ -321,7 +417,7 @@ class RNode:
         >>> print(x3)
         RNode: val=1.4649735207179269, with 0 parent(s).
         """
-        if self.val <= 0:
+        if _any(self.val <= 0):
             raise ValueError('Cannot take logarithm of negative number.')
         rnode = RNode(np.log(self.val) / np.log(base))
         self.parent.append((1. / (self.val * np.log(base)), rnode))
@@ -333,8 +429,8 @@ class RNode:
         to the power of some integer or float is also supported.
 
         :param other: The item to raise the power of the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: An RNode object after take the power, with value and parent updated.
         :rtype: RNode
@@ -349,12 +445,18 @@ class RNode:
             rnode = RNode(self.val ** other.val)
             self.parent.append((other.val * self.val ** (other.val - 1.), rnode))
             other.parent.append((np.log(self.val) * self.val ** other.val, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self, other)
             return rnode
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for power")
         else:
             rnode = RNode(self.val ** other)
             self.parent.append((other * self.val ** (other - 1.), rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def exp(self):
@@ -419,7 +521,7 @@ class RNode:
         >>> print(x2)
         RNode: val=-3.380515006246585, with 0 parent(s).  
         """
-        if np.isclose((self.val - np.pi/2) / np.pi, 0):
+        if _any(np.isclose((_innermost(self.val) - np.pi/2) / np.pi, 0)):
             raise ValueError('Cannot take tangent of pi/2 + n * pi, with n being some integer')
         rnode = RNode(np.tan(self.val))
         self.parent.append((1 / np.cos(self.val) ** 2, rnode))
@@ -439,7 +541,7 @@ class RNode:
         >>> print(x2)
         RNode: val=0.5235987755982988, with 0 parent(s).
         """
-        if self.val < -1 or self.val > 1:
+        if _any((self.val < -1) | (self.val > 1)):
             raise ValueError(f'The value `{self.val}` is not in the domain')
         rnode = RNode(np.arcsin(self.val))
         self.parent.append((1 / np.sqrt(1 - self.val ** 2), rnode))
@@ -459,7 +561,7 @@ class RNode:
         >>> print(x2)
         RNode: val=1.0471975511965976, with 0 parent(s).
         """
-        if self.val < -1 or self.val > 1:
+        if _any((self.val < -1) | (self.val > 1)):
             raise ValueError(f'The value `{self.val}` is not in the domain')
         rnode = RNode(np.arccos(self.val))
         self.parent.append((-1 / np.sqrt(1 - self.val ** 2), rnode))
@@ -531,13 +633,334 @@ class RNode:
         self.parent.append((1 / np.cosh(self.val) ** 2, rnode))
         return rnode
 
+    def _extremum(self, other, compare, ufunc):
+        """Helper function for :py:meth:`AutoDiff.rnode.RNode.maximum` and :py:meth:`AutoDiff.rnode.RNode.minimum`.
+        Where ``compare`` holds, the value of the current RNode is kept and its partial derivative is 1,
+        elsewhere the value of other is taken.
+        """
+        if isinstance(other, RNode):
+            keep = compare(self.val, other.val)
+            rnode = RNode(_select(keep, self.val, other.val))
+            self.parent.append((1. * keep, rnode))
+            other.parent.append((1. - keep, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self, other)
+            return rnode
+        elif _is_object_array(other):
+            return ufunc(_as_object(self), other)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for {ufunc.__name__}")
+        else:
+            keep = compare(self.val, other)
+            rnode = RNode(_select(keep, self.val, other))
+            self.parent.append((1. * keep, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
+            return rnode
+
+    def maximum(self, other):
+        """Overloads the numpy maximum for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated. Where both values are equal, the gradient flows to the
+        current RNode. Taking the maximum with integers or floats is also supported.
+
+        :param other: The item to be compared with the current RNode object.
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
+
+        :return: An RNode object after taking the elementwise maximum, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(5)
+        >>> x2 = np.maximum(x1, 3)
+        >>> print(x2)
+        RNode: val=5, with 0 parent(s).
+        """
+        return self._extremum(other, operator.ge, np.maximum)
+
+    def minimum(self, other):
+        """Overloads the numpy minimum for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated. Where both values are equal, the gradient flows to the
+        current RNode. Taking the minimum with integers or floats is also supported.
+
+        :param other: The item to be compared with the current RNode object.
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
+
+        :return: An RNode object after taking the elementwise minimum, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(5)
+        >>> x2 = np.minimum(x1, 3)
+        >>> print(x2)
+        RNode: val=3, with 0 parent(s).
+        """
+        return self._extremum(other, operator.le, np.minimum)
+
+    def sum(self, axis=None):
+        """Overloads the numpy sum for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated. The partial derivative with respect to each element is 1,
+        so the adjoint of the sum is broadcast back over the summed axes.
+
+        :param axis: The axis or axes of the value to sum over, defaults to None (all of them)
+        :type axis: integer or tuple of integers
+
+        :return: An RNode object after summation, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([1., 2., 3.]))
+        >>> x2 = np.sum(x1)
+        >>> print(x2)
+        RNode: val=6.0, with 0 parent(s).
+        """
+        rnode = RNode(np.sum(self.val, axis=axis))
+        if axis is None:
+            self.parent.append((np.ones_like(self.val) if isinstance(self.val, np.ndarray) else 1., rnode))
+        else:
+            self.parent.append((functools.partial(_sum_adjoint, np.shape(self.val), np.shape(rnode.val), axis, 1.), rnode))
+        return rnode
+
+    def mean(self, axis=None):
+        """Overloads the numpy mean for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated. The partial derivative with respect to each element is one
+        over the number of averaged elements.
+
+        :param axis: The axis or axes of the value to average over, defaults to None (all of them)
+        :type axis: integer or tuple of integers
+
+        :return: An RNode object after taking the mean, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([[1., 2.], [3., 6.]]))
+        >>> x2 = np.mean(x1, axis=0)
+        >>> print(x2)
+        RNode: val=[2. 4.], with 0 parent(s).
+        """
+        rnode = RNode(np.mean(self.val, axis=axis))
+        scale = np.size(rnode.val) / np.size(self.val)
+        if axis is None:
+            self.parent.append((np.full(np.shape(self.val), scale) if isinstance(self.val, np.ndarray) else scale, rnode))
+        else:
+            self.parent.append((functools.partial(_sum_adjoint, np.shape(self.val), np.shape(rnode.val), axis, scale), rnode))
+        return rnode
+
+    def dot(self, other):
+        """Overloads the numpy dot product for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated. For two 1D arrays the partial derivative with respect to each
+        element is the matching element of the other factor. With a scalar, the dot product is a multiplication,
+        and with a 2D array a matrix multiplication, see :py:meth:`AutoDiff.rnode.RNode.__matmul__`.
+        The dot product of an RNode object with integers, floats or numpy arrays is also supported.
+
+        :param other: The item to be multiplied with the current RNode object.
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type),
+            or a value has more than two dimensions.
+
+        :return: An RNode object after the dot product, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([1., 2.]))
+        >>> x2 = np.dot(x1, np.array([3., 4.]))
+        >>> print(x2)
+        RNode: val=11.0, with 0 parent(s).
+        """
+        other_val = other.val if isinstance(other, RNode) else other
+        if _is_object_array(other):
+            return _object_dot(self, other, False)
+        elif not isinstance(other, (RNode,) + self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for dot product")
+        ndim, other_ndim = np.ndim(self.val), np.ndim(other_val)
+        if max(ndim, other_ndim) > 2:
+            raise TypeError('The dot product of RNodes is only supported for arrays with at most two dimensions')
+        if ndim == 0 or other_ndim == 0:
+            return self.__mul__(other)
+        if ndim == 2 or other_ndim == 2:
+            return self.__matmul__(other)
+        rnode = RNode(np.dot(self.val, other_val))
+        self.parent.append((other_val, rnode))
+        if isinstance(other, RNode):
+            other.parent.append((self.val, rnode))
+        return rnode
+
+    def _rdot(self, other):
+        """Helper function for the dot product of a constant ``other`` with the current RNode,
+        see :py:meth:`AutoDiff.rnode.RNode.dot`.
+        """
+        if _is_object_array(other):
+            return _object_dot(self, other, True)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for dot product")
+        ndim, other_ndim = np.ndim(self.val), np.ndim(other)
+        if max(ndim, other_ndim) > 2:
+            raise TypeError('The dot product of RNodes is only supported for arrays with at most two dimensions')
+        if ndim == 2 or other_ndim == 2:
+            return self.__rmatmul__(other)
+        return self.dot(other)
+
+    def __matmul__(self, other):
+        """Overloads the built-in matrix multiplication operator for handling RNodes in the forward pass
+        and returns a new RNode object with value and parent updated. The adjoint of the product is multiplied
+        by the transposed other factor, and summed over the stacked matrices the current RNode is broadcast to.
+        The matrix multiplication of an RNode object with numpy arrays is also supported.
+
+        :param other: The item to multiply the current RNode object by.
+        :type other: RNode or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not numpy array, or RNode type).
+
+        :return: An RNode object after matrix multiplication, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([[1., 2.], [3., 4.]]))
+        >>> x2 = x1 @ np.array([1., -1.])
+        >>> print(x2)
+        RNode: val=[-1. -1.], with 0 parent(s).
+        """
+        if isinstance(other, RNode):
+            rnode = RNode(np.matmul(self.val, other.val))
+            shape = np.shape(rnode.val)
+            self.parent.append((functools.partial(_matmul_adjoint, self.val, other.val, shape, True), rnode))
+            other.parent.append((functools.partial(_matmul_adjoint, self.val, other.val, shape, False), rnode))
+            return rnode
+        elif _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, np.ndarray):
+            raise TypeError(f"Type `{type(other)}` is not supported for matrix multiplication")
+        else:
+            rnode = RNode(np.matmul(self.val, other))
+            self.parent.append((functools.partial(_matmul_adjoint, self.val, other, np.shape(rnode.val), True), rnode))
+            return rnode
+
+    def __rmatmul__(self, other):
+        """Overloads the built-in reflective matrix multiplication operator for handling RNodes in the forward
+        pass and returns a new RNode object with value and parent updated.
+
+        :param other: The numpy array to be multiplied by the current RNode object.
+        :type other: numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not numpy array).
+
+        :return: An RNode object after reflective matrix multiplication, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([1., 2.]))
+        >>> x2 = np.array([[1., 1.], [0., 2.]]) @ x1
+        >>> print(x2)
+        RNode: val=[3. 4.], with 0 parent(s).
+        """
+        if _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, np.ndarray):
+            raise TypeError(f"Type `{type(other)}` is not supported for matrix multiplication")
+        rnode = RNode(np.matmul(other, self.val))
+        self.parent.append((functools.partial(_matmul_adjoint, other, self.val, np.shape(rnode.val), False), rnode))
+        return rnode
+
+    def reshape(self, *shape):
+        """Overloads the numpy reshape for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated. The adjoint is reshaped back to the shape of the current RNode.
+
+        :param shape: The new shape of the value, as integers or one tuple
+        :type shape: integers or tuple of integers
+
+        :return: An RNode object after reshaping, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([1., 2., 3., 4.]))
+        >>> x2 = x1.reshape(2, 2)
+        >>> print(x2)
+        RNode: val=[[1. 2.]
+         [3. 4.]], with 0 parent(s).
+        """
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = tuple(shape[0])
+        rnode = RNode(np.reshape(self.val, shape))
+        self.parent.append((functools.partial(_reshape_adjoint, np.shape(self.val), rnode.val.shape), rnode))
+        return rnode
+
+    def transpose(self):
+        """Overloads the numpy transpose for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated. The axes of the value are reversed, and so are those of the adjoint.
+
+        :return: An RNode object after transposing, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([[1., 2.], [3., 4.]]))
+        >>> print(x1.T)
+        RNode: val=[[1. 3.]
+         [2. 4.]], with 0 parent(s).
+        """
+        rnode = RNode(np.transpose(self.val))
+        self.parent.append((functools.partial(_transpose_adjoint, np.shape(rnode.val)), rnode))
+        return rnode
+
+    @property
+    def T(self):
+        """The transposed RNode, see :py:meth:`AutoDiff.rnode.RNode.transpose`.
+
+        :return: An RNode object after transposing, with value and parent updated.
+        :rtype: RNode
+        """
+        return self.transpose()
+
+    def __getitem__(self, key):
+        """Overloads indexing for handling RNodes in the forward pass and returns a new RNode object
+        with value and parent updated. The value is indexed by ``key`` as a numpy array, and the adjoint
+        is added back at the selected positions, once for each time a position is selected.
+
+        :param key: An index, slice, array of indices or mask, or a tuple of them
+        :type key: integer or slice or numpy array or tuple
+
+        :return: An RNode object with the selected elements, with value and parent updated.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([1., 2., 3.]))
+        >>> x2 = x1[1:]
+        >>> print(x2)
+        RNode: val=[2. 3.], with 0 parent(s).
+        """
+        rnode = RNode(self.val[key])
+        self.parent.append((functools.partial(_getitem_adjoint, np.shape(self.val), key), rnode))
+        return rnode
+
+    @staticmethod
+    def where(condition, x, y):
+        """Overloads the numpy where for handling RNodes in the forward pass and returns a new RNode
+        object with value and parent updated: the value of ``x`` where ``condition`` holds, and the value
+        of ``y`` elsewhere. Either of ``x`` and ``y`` may be an integer or float.
+
+        :param condition: Where to take ``x``
+        :type condition: bool or numpy array of bools
+        :param x: The item taken where the condition holds
+        :type x: RNode or integer or float
+        :param y: The item taken elsewhere
+        :type y: RNode or integer or float
+
+        :return: An RNode object with value selected from ``x`` and ``y``.
+        :rtype: RNode
+
+        >>> x1 = RNode(np.array([-1., 2.]))
+        >>> x2 = np.where(x1.val > 0, x1, 0.)
+        >>> print(x2)
+        RNode: val=[0. 2.], with 0 parent(s).
+        """
+        if isinstance(condition, list):
+            condition = np.asarray(condition)
+        rnode = RNode(_select(condition,
+                              x.val if isinstance(x, RNode) else x,
+                              y.val if isinstance(y, RNode) else y))
+        if isinstance(x, RNode):
+            x.parent.append((1. * condition, rnode))
+        if isinstance(y, RNode):
+            y.parent.append((1. - condition, rnode))
+        if isinstance(rnode.val, np.ndarray):
+            rnode._broadcast_from(*[item for item in (x, y) if isinstance(item, RNode)])
+        return rnode
+
     def __radd__(self, other):
         """Overloads the built-in reflective addition operator for handling RNodes in the forward pass
         and returns a new RNode object with value and parent updated.
 
         :param other: The integer or float to be added to the current RNode object.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
         
         :return: An RNode object after reflective addition, with value and parent updated.
         :rtype: RNode
@@ -554,8 +977,8 @@ class RNode:
         and returns a new RNode object with value and parent updated.
 
         :param other: The integer or float to be subtracted by the current RNode object.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
         
         :return: An RNode object after reflective subtraction, with value and parent updated.
         :rtype: RNode
@@ -565,11 +988,15 @@ class RNode:
         >>> print(x2)
         RNode: val=-2, with 0 parent(s).
         """
-        if not isinstance(other, self._supported_types):
+        if _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for reflective subtraction")
         else:
             rnode = RNode(other - self.val)
             self.parent.append((-1., rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def __rmul__(self, other):
@@ -577,8 +1004,8 @@ class RNode:
         and returns a new RNode object with value and parent updated.
 
         :param other: The integer or float to multiply the current RNode object by.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
         
         :return: An RNode object after reflective multiplication, with value and parent updated.
         :rtype: RNode
@@ -595,8 +1022,8 @@ class RNode:
         and returns a new RNode object with value and parent updated.
 
         :param other: The integer or float to divide the current RNode object by.
-        :type other: integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :type other: integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or numpy array).
         :raises ValueError: Division by zero.
 
         :return: An RNode object after reflective true division, with value and parent updated.
@@ -607,13 +1034,17 @@ class RNode:
         >>> print(x2)
         RNode: val=0.6, with 0 parent(s).
         """
-        if not isinstance(other, self._supported_types):
+        if _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for reflective division")
         else:
-            if self.val == 0:
+            if _any(self.val == 0):
                 raise ZeroDivisionError('Division by zero')
             rnode = RNode(other / self.val)
             self.parent.append((-other / self.val ** 2, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def __rpow__(self, other):
@@ -622,8 +1053,8 @@ class RNode:
         to the power of some integer or float is also supported.
 
         :param other: The item to raise the reflective power of the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: An RNode object after take the power, with value and parent updated.
         :rtype: RNode
@@ -633,11 +1064,15 @@ class RNode:
         >>> print(x2)
         RNode: val=243, with 0 parent(s).
         """
-        if not isinstance(other, self._supported_types):
+        if _is_object_array(other):
+            return NotImplemented
+        elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for power")
         else:
             rnode = RNode(other ** self.val)
             self.parent.append((np.log(other) * other ** self.val, rnode))
+            if isinstance(rnode.val, np.ndarray):
+                rnode._broadcast_from(self)
             return rnode
 
     def __lt__(self, other):
@@ -645,8 +1080,8 @@ class RNode:
         Comparing the RNode object with some integer or float is also supported.
 
         :param other: The item to be compared with the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: A Boolean comparing the current RNode object with other
         :rtype: Boolean
@@ -658,6 +1093,8 @@ class RNode:
         """
         if isinstance(other, RNode):
             return self.val < other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison <")
         else:
@@ -668,8 +1105,8 @@ class RNode:
         Comparing the RNode object with some integer or float is also supported.
 
         :param other: The item to be compared with the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: A Boolean comparing the current RNode object with other
         :rtype: Boolean
@@ -681,6 +1118,8 @@ class RNode:
         """
         if isinstance(other, RNode):
             return self.val > other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison >")
         else:
@@ -691,8 +1130,8 @@ class RNode:
         Comparing the RNode object with some integer or float is also supported.
 
         :param other: The item to be compared with the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: A Boolean comparing the current RNode object with other
         :rtype: Boolean
@@ -704,6 +1143,8 @@ class RNode:
         """
         if isinstance(other, RNode):
             return self.val <= other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison <=")
         else:
@@ -714,8 +1155,8 @@ class RNode:
         Comparing the RNode object with some integer or float is also supported.
 
         :param other: The item to be compared with the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: A Boolean comparing the current RNode object with other
         :rtype: Boolean
@@ -727,6 +1168,8 @@ class RNode:
         """
         if isinstance(other, RNode):
             return self.val >= other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison >=")
         else:
@@ -737,8 +1180,8 @@ class RNode:
         with some integer or float is also supported.
 
         :param other: The item to be compared with the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: A Boolean comparing the current RNode object with other
         :rtype: Boolean
@@ -750,6 +1193,8 @@ class RNode:
         """
         if isinstance(other, RNode):
             return self.val == other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison =")
         else:
@@ -760,8 +1205,8 @@ class RNode:
         with some integer or float is also supported.
 
         :param other: The item to be compared with the current RNode object.
-        :type other: RNode or integer or float
-        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or RNode type).
+        :type other: RNode or integer or float or numpy array
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, numpy array, or RNode type).
         
         :return: A Boolean comparing the current RNode object with other
         :rtype: Boolean
@@ -773,7 +1218,139 @@ class RNode:
         """
         if isinstance(other, RNode):
             return self.val != other.val
+        elif _is_object_array(other):
+            return NotImplemented
         elif not isinstance(other, self._supported_types):
             raise TypeError(f"Type `{type(other)}` is not supported for comparison =")
         else:
-            return self.val != other
\ No newline at end of file
+            return self.val != other
+
+    def __hash__(self):
+        """Hashes the RNode object by identity. The comparison operators compare values, so two
+        distinct RNodes with equal values are equal but still have different hashes; this lets
+        RNodes be used as set members and dictionary keys.
+
+        :return: The hash of the identity of the current RNode object
+        :rtype: integer
+
+        >>> x1 = RNode(3)
+        >>> x2 = RNode(3)
+        >>> x1 == x2
+        True
+        >>> len({x1, x2})
+        2
+        """
+        return object.__hash__(self)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Dispatches numpy ufuncs on RNodes. The ufuncs with a derivative rule (e.g. :code:`np.sin`,
+        :code:`np.add`, :code:`np.maximum`) call the rule directly, without going through numpy's
+        object loops. Other calls behave as on an object array holding the RNode.
+
+        :return: The result of the ufunc
+        :rtype: RNode or bool or numpy array
+        """
+        return _array_ufunc(RNode, ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Dispatches numpy functions on RNodes. :code:`np.sum`, :code:`np.mean`, :code:`np.dot`, :code:`np.where`,
+        :code:`np.reshape` and :code:`np.transpose` use the methods of the same name, e.g.
+        :py:meth:`AutoDiff.rnode.RNode.sum`, and :code:`keepdims` of :code:`np.sum` and :code:`np.mean` is supported.
+        Other functions and arguments treat RNodes with scalar values as elements of object arrays.
+
+        :raises TypeError: Another function or argument is applied to an RNode with an array value.
+        :return: The result of the function
+        """
+        return _array_function(RNode, _RNODE_FUNCTIONS, func, args, kwargs)
+
+
+def _unbroadcast(adjoint, shape):
+    """Helper function that sums an adjoint over the axes a value of ``shape`` was broadcast along.
+    """
+    extra = np.ndim(adjoint) - len(shape)
+    if extra > 0:
+        adjoint = np.sum(adjoint, axis=tuple(range(extra)))
+    axes = tuple(i for i, n in enumerate(shape) if n == 1 and adjoint.shape[i] != 1)
+    if axes:
+        adjoint = np.sum(adjoint, axis=axes, keepdims=True)
+    return adjoint
+
+def _broadcast_adjoint(partial, shape, out_shape, adjoint):
+    """Helper function for the contribution of an elementwise operation whose operand of ``shape`` is
+    broadcast to ``out_shape``, see :py:meth:`AutoDiff.rnode.RNode._broadcast_from`.
+    """
+    return _unbroadcast(np.broadcast_to(partial * adjoint, out_shape), shape)
+
+def _sum_adjoint(shape, out_shape, axis, scale, adjoint):
+    """Helper function for the contribution of a sum, or mean with ``scale``, along ``axis``.
+    """
+    adjoint = np.expand_dims(np.broadcast_to(adjoint, out_shape), axis)
+    return np.broadcast_to(adjoint, shape) * scale
+
+def _matmul_adjoint(a, b, out_shape, left, adjoint):
+    """Helper function for the contribution of :code:`np.matmul(a, b)` to ``a`` (if ``left``) or ``b``.
+    As numpy does for the values, a 1D operand is made a matrix, and the adjoint gets the matching axis.
+    """
+    a2 = a[None, :] if np.ndim(a) == 1 else a
+    b2 = b[:, None] if np.ndim(b) == 1 else b
+    adjoint = np.broadcast_to(adjoint, out_shape)
+    if np.ndim(b) == 1:
+        adjoint = adjoint[..., None]
+    if np.ndim(a) == 1:
+        adjoint = adjoint[..., None, :]
+    if left:
+        return _unbroadcast(np.matmul(adjoint, np.swapaxes(b2, -1, -2)), a2.shape).reshape(np.shape(a))
+    return _unbroadcast(np.matmul(np.swapaxes(a2, -1, -2), adjoint), b2.shape).reshape(np.shape(b))
+
+def _reshape_adjoint(shape, out_shape, adjoint):
+    """Helper function for the contribution of a reshape from ``shape`` to ``out_shape``.
+    """
+    return np.reshape(np.broadcast_to(adjoint, out_shape), shape)
+
+def _transpose_adjoint(out_shape, adjoint):
+    """Helper function for the contribution of a transpose to ``out_shape``.
+    """
+    return np.transpose(np.broadcast_to(adjoint, out_shape))
+
+def _getitem_adjoint(shape, key, adjoint):
+    """Helper function for the contribution of indexing a value of ``shape`` by ``key``. Unbuffered
+    addition accumulates the adjoint of a position selected more than once.
+    """
+    contribution = np.zeros(shape)
+    np.add.at(contribution, key, adjoint)
+    return contribution
+
+def _rnode_sum(a, axis=None, keepdims=False, **kwargs):
+    if kwargs:
+        return NotImplemented
+    total = a.sum(axis)
+    return total.reshape(_kept_shape(np.shape(a.val), axis)) if keepdims else total
+
+def _rnode_mean(a, axis=None, keepdims=False, **kwargs):
+    if kwargs:
+        return NotImplemented
+    mean = a.mean(axis)
+    return mean.reshape(_kept_shape(np.shape(a.val), axis)) if keepdims else mean
+
+def _rnode_dot(a, b, out=None):
+    if out is not None:
+        return NotImplemented
+    return a.dot(b) if isinstance(a, RNode) else b._rdot(a)
+
+def _rnode_reshape(a, shape=None, order='C', **kwargs):
+    if order != 'C' or kwargs:
+        return NotImplemented
+    return a.reshape(shape)
+
+def _rnode_transpose(a, axes=None):
+    if axes is not None:
+        return NotImplemented
+    return a.transpose()
+
+def _rnode_where(condition, *args):
+    if len(args) != 2:
+        return NotImplemented
+    return RNode.where(condition, *args)
+
+_RNODE_FUNCTIONS = {np.sum: _rnode_sum, np.mean: _rnode_mean, np.dot: _rnode_dot, np.where: _rnode_where,
+                    np.reshape: _rnode_reshape, np.transpose: _rnode_transpose}
@@ -0,0 +1,391 @@
+import numpy as np
+from .node import Node
+from .context import trace
+
+class IndexSet:
+    r"""
+    The derivative used by :py:meth:`AutoDiff.sparse.SparseForward.pattern` to detect the sparsity
+    pattern of a Jacobian. Instead of numbers it holds the set of variables a Node depends on, and
+    the arithmetic of :py:class:`AutoDiff.node.Node` on derivatives becomes set arithmetic:
+    the sum or difference of two derivatives is the union of their sets, and multiplying or dividing
+    a derivative by a partial derivative keeps its set. The pattern is structural, a partial derivative
+    that happens to be zero at the evaluation point does not remove an index.
+
+    :param indices: The indices of the variables, defaults to the empty set
+    :type indices: iterable of integers
+
+    :ivar indices: The indices of the variables
+    :vartype indices: frozenset
+
+    >>> x1 = Node(1, IndexSet([0]))
+    >>> x2 = Node(2, IndexSet([1]))
+    >>> (x1 * np.sin(x2) + 3).der
+    IndexSet([0, 1])
+    """
+
+    __slots__ = ('indices',)
+    # let numpy scalars defer to the reflected operators below instead of building object arrays
+    __array_ufunc__ = None
+
+    def __init__(self, indices=()):
+        self.indices = frozenset(indices)
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing the sorted indices of the IndexSet.
+        :rtype: string
+        """
+        return f'IndexSet({sorted(self.indices)})'
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return iter(sorted(self.indices))
+
+    def __eq__(self, other):
+        if isinstance(other, IndexSet):
+            return self.indices == other.indices
+        return NotImplemented
+
+    def __add__(self, other):
+        """Union of the two sets. A constant (e.g. a zero derivative) adds no index.
+
+        :param other: The other derivative
+        :type other: IndexSet or integer or float
+
+        :return: The union
+        :rtype: IndexSet
+        """
+        if isinstance(other, IndexSet):
+            if other.indices <= self.indices:
+                return self
+            if self.indices <= other.indices:
+                return other
+            return IndexSet(self.indices | other.indices)
+        return self
+
+    __radd__ = __add__
+    __sub__ = __add__
+    __rsub__ = __add__
+
+    def __mul__(self, other):
+        """Scaling by a partial derivative keeps the set.
+
+        :param other: The partial derivative
+        :type other: integer or float or numpy array
+
+        :return: The same IndexSet
+        :rtype: IndexSet
+        """
+        return self
+
+    __rmul__ = __mul__
+    __truediv__ = __mul__
+
+    def __neg__(self):
+        return self
+
+
+class SparseTangent:
+    r"""
+    A sparse derivative for :py:class:`AutoDiff.node.Node`, used by :py:meth:`AutoDiff.forward.Forward.grad`
+    with ``sparse=True``. It stores only the entries for the variables a Node depends on, as a sorted index
+    array and a value array, instead of a dense array of length :math:`m`. Sums and differences merge the
+    two index arrays, and scaling by a partial derivative scales the values, so the memory and the cost
+    of each operation follow the number of dependencies of the Node rather than :math:`m`.
+
+    :param indices: The sorted indices of the variables, defaults to none
+    :type indices: list or numpy array of integers
+    :param values: The derivative with respect to each of these variables, defaults to none
+    :type values: list or numpy array of floats
+
+    :ivar indices: The sorted indices of the variables
+    :vartype indices: numpy array
+    :ivar values: The derivative with respect to each of these variables
+    :vartype values: numpy array
+
+    >>> x1 = Node(2, SparseTangent([0], [1.]))
+    >>> x2 = Node(3, SparseTangent([5], [1.]))
+    >>> (x1 * x2).der
+    SparseTangent(indices=[0 5], values=[3. 2.])
+    """
+
+    __slots__ = ('indices', 'values')
+    # let numpy scalars defer to the reflected operators below instead of building object arrays
+    __array_ufunc__ = None
+
+    def __init__(self, indices=(), values=()):
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.values = np.asarray(values, dtype=float)
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing the indices and values of the SparseTangent.
+        :rtype: string
+        """
+        return f'SparseTangent(indices={self.indices}, values={self.values})'
+
+    def __len__(self):
+        return len(self.indices)
+
+    def toarray(self, num_variables):
+        """Return the derivative as a dense array.
+
+        :param num_variables: The number of variables :math:`m`
+        :type num_variables: integer
+
+        :return: The dense derivative of length ``num_variables``
+        :rtype: numpy array
+        """
+        der = np.zeros(num_variables)
+        der[self.indices] = self.values
+        return der
+
+    def _merge(self, other, sign):
+        """Helper function for the sum (``sign=1``) or difference (``sign=-1``) of two SparseTangents.
+
+        :return: The merged SparseTangent
+        :rtype: SparseTangent
+        """
+        if self.indices is other.indices or np.array_equal(self.indices, other.indices):
+            return SparseTangent(self.indices, self.values + sign * other.values)
+        indices = np.union1d(self.indices, other.indices)
+        values = np.zeros(len(indices))
+        values[np.searchsorted(indices, self.indices)] = self.values
+        values[np.searchsorted(indices, other.indices)] += sign * other.values
+        return SparseTangent(indices, values)
+
+    def __add__(self, other):
+        if isinstance(other, SparseTangent):
+            return self._merge(other, 1.)
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, SparseTangent):
+            return self._merge(other, -1.)
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return NotImplemented
+
+    def __rsub__(self, other):
+        return -self - other
+
+    def __mul__(self, other):
+        """Scale the values by a partial derivative.
+
+        :param other: The partial derivative
+        :type other: integer or float
+
+        :return: The scaled SparseTangent, with the same indices
+        :rtype: SparseTangent
+        """
+        if isinstance(other, SparseTangent):
+            return NotImplemented
+        return SparseTangent(self.indices, self.values * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, SparseTangent):
+            return NotImplemented
+        return SparseTangent(self.indices, self.values / other)
+
+    def __neg__(self):
+        return SparseTangent(self.indices, -self.values)
+
+
+class SparseForward:
+    r"""
+    Compute a sparse Jacobian in forward mode with compressed seeding. The sparsity pattern is
+    detected with :py:meth:`AutoDiff.sparse.SparseForward.pattern`, the columns are grouped with
+    :py:meth:`AutoDiff.sparse.SparseForward.color`, and a single forward pass seeds one direction per
+    group (the sum of the unit vectors of its columns) instead of one per variable. Columns in the same
+    group never have a nonzero in the same row, so each nonzero :math:`J_{ij}` is read back from the
+    derivative of output :math:`i` along the direction of the group of column :math:`j`.
+    The Jacobian is stored in coordinate (COO) form.
+
+    :param f: A callable function object, the :math:`f: \mathbb{R}^m \mapsto \mathbb{R}^n` function
+    :type f: function object
+
+    :param variables: The input for variables of function ``f``
+    :type variables: integer or float
+
+    :param pattern: The sparsity pattern as a tuple of row and column indices, for instance the
+        :py:attr:`rows` and :py:attr:`cols` of an earlier SparseForward of the same function. Defaults to
+        None, which detects the pattern at ``variables``
+    :type pattern: tuple of numpy arrays
+    :raises ValueError: The pattern has a row that is not an output of ``f``.
+
+    :ivar val: The output of function ``f(*variables)``
+    :vartype val: integer or float or numpy array
+
+    :ivar rows: The row indices of the nonzeros
+    :vartype rows: numpy array
+
+    :ivar cols: The column indices of the nonzeros
+    :vartype cols: numpy array
+
+    :ivar data: The values of the nonzeros
+    :vartype data: numpy array
+
+    :ivar shape: The shape :math:`(n, m)` of the Jacobian, :math:`n = 1` for a scalar function
+    :vartype shape: tuple
+
+    :ivar colors: The group of each column
+    :vartype colors: numpy array
+
+    :ivar n_colors: The number of groups, i.e. the number of seed directions
+    :vartype n_colors: integer
+
+    >>> from AutoDiff import SparseForward
+    >>> def f(x1, x2, x3):
+    >>>     return [x1 * x2, x2 + x3, np.sin(x3)]
+    >>> g = SparseForward(f, 1, 2, 3)
+    >>> g.n_colors
+    2
+    >>> g.toarray()
+    array([[ 2.        ,  1.        ,  0.        ],
+           [ 0.        ,  1.        ,  1.        ],
+           [ 0.        ,  0.        , -0.9899925 ]])
+    """
+
+    def __init__(self, f: callable, *variables, pattern=None):
+        num_variables = len(variables)
+        if pattern is None:
+            _, rows, cols = self.pattern(f, *variables)
+        else:
+            rows, cols = (np.asarray(index, dtype=np.intp) for index in pattern)
+        self.colors = self.color(rows, cols, num_variables)
+        self.n_colors = int(self.colors.max()) + 1 if num_variables else 0
+
+        # one seed direction per group of structurally orthogonal columns
+        seeds = np.eye(self.n_colors)
+        with trace(counter=-num_variables, record=False):
+            nodes = [Node(var, derivative = seeds[c]) for var, c in zip(variables, self.colors)]
+            output = f(*nodes)
+        outputs = output if isinstance(output, list) else [output]
+        if len(rows) and rows.max() >= len(outputs):
+            raise ValueError(f'The pattern has a nonzero in row {rows.max()} but f has {len(outputs)} outputs')
+        compressed = np.stack([
+            np.broadcast_to(o.der, (self.n_colors,)) if isinstance(o, Node) else np.zeros(self.n_colors)
+            for o in outputs
+        ]) if self.n_colors else np.zeros((len(outputs), 0))
+
+        values = [o.val if isinstance(o, Node) else o for o in outputs]
+        self.val = np.array(values) if isinstance(output, list) else values[0]
+        self.rows = rows
+        self.cols = cols
+        self.data = compressed[rows, self.colors[cols]]
+        self.shape = (len(outputs), num_variables)
+
+    def __str__(self):
+        """Print useful information for users.
+
+        :return: A string containing useful information of the SparseForward object.
+        :rtype: string
+        """
+        return f'SparseForward: val={self.val}, shape={self.shape}, {len(self.data)} nonzeros, and {self.n_colors} colors.'
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing useful information of the SparseForward object.
+        :rtype: string
+        """
+        return f'A SparseForward object with value of {self.val}, Jacobian of shape {self.shape} with {len(self.data)} nonzeros, and {self.n_colors} colors.'
+
+    def toarray(self):
+        """Return the Jacobian as a dense array.
+
+        :return: The Jacobian, of shape :py:attr:`shape`
+        :rtype: numpy array
+        """
+        der = np.zeros(self.shape)
+        der[self.rows, self.cols] = self.data
+        return der
+
+    def tocsr(self):
+        """Return the Jacobian as a :code:`scipy.sparse.csr_matrix`. This needs scipy, which is
+        not a dependency of the package.
+
+        :raises ImportError: scipy is not installed.
+
+        :return: The Jacobian
+        :rtype: scipy.sparse.csr_matrix
+        """
+        from scipy.sparse import coo_matrix
+        return coo_matrix((self.data, (self.rows, self.cols)), shape=self.shape).tocsr()
+
+    @staticmethod
+    def pattern(f: callable, *variables):
+        """Detect the sparsity pattern of the Jacobian of ``f`` at ``variables`` by running ``f``
+        on Nodes whose derivatives are :py:class:`AutoDiff.sparse.IndexSet` objects.
+
+        :param f: A callable function object
+        :type f: function object
+        :param variables: The input for variables of function ``f``
+        :type variables: integer or float
+
+        :return: The number of outputs, and the row and column indices of the nonzeros in row-major order
+        :rtype: tuple
+
+        >>> def f(x1, x2, x3):
+        >>>     return [x1 * x2, x3 ** 2]
+        >>> SparseForward.pattern(f, 1, 2, 3)
+        (2, array([0, 0, 1]), array([0, 1, 2]))
+        """
+        with trace(counter=-len(variables), record=False):
+            nodes = [Node(var, derivative = IndexSet([j])) for j, var in enumerate(variables)]
+            output = f(*nodes)
+        outputs = output if isinstance(output, list) else [output]
+        rows, cols = [], []
+        for i, o in enumerate(outputs):
+            if isinstance(o, Node) and isinstance(o.der, IndexSet):
+                indices = list(o.der)
+                rows.extend([i] * len(indices))
+                cols.extend(indices)
+        return len(outputs), np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)
+
+    @staticmethod
+    def color(rows, cols, num_variables):
+        """Group the columns of a sparsity pattern so that no two columns of a group have a nonzero
+        in the same row (Curtis-Powell-Reid). This is a greedy coloring of the column intersection
+        graph, visiting the columns with the most nonzeros first and giving each the smallest
+        group not used by a column it shares a row with.
+
+        :param rows: The row indices of the nonzeros
+        :type rows: numpy array
+        :param cols: The column indices of the nonzeros
+        :type cols: numpy array
+        :param num_variables: The number of columns
+        :type num_variables: integer
+
+        :return: The group of each column, numbered from 0
+        :rtype: numpy array
+
+        >>> # tridiagonal pattern
+        >>> rows = [0, 0, 1, 1, 1, 2, 2]
+        >>> cols = [0, 1, 0, 1, 2, 1, 2]
+        >>> SparseForward.color(rows, cols, 3)
+        array([1, 0, 2])
+        """
+        row_cols = {}
+        col_rows = [[] for _ in range(num_variables)]
+        for i, j in zip(rows, cols):
+            row_cols.setdefault(i, []).append(j)
+            col_rows[j].append(i)
+        colors = np.full(num_variables, -1, dtype=np.intp)
+        for j in sorted(range(num_variables), key=lambda j: -len(col_rows[j])):
+            forbidden = {colors[k] for i in col_rows[j] for k in row_cols[i]}
+            c = 0
+            while c in forbidden:
+                c += 1
+            colors[j] = c
+        return colors
@@ -0,0 +1,239 @@
+import numpy as np
+
+class SmallTangent:
+    r"""
+    A dense derivative of fixed length :math:`m \le 4` for :py:class:`AutoDiff.node.Node`, used by
+    :py:meth:`AutoDiff.forward.Forward.grad` for functions of two to four variables. The entries are kept
+    in separate slots, and each operation is written out entry by entry, so it costs a few float operations
+    instead of a call into numpy, whose overhead dominates for arrays this short.
+    There is one subclass per length, see :py:meth:`AutoDiff.tangent.SmallTangent.of`.
+    With a single variable, :py:meth:`AutoDiff.forward.Forward.grad` uses a float as the derivative instead.
+
+    Like :py:class:`AutoDiff.sparse.SparseTangent`, a SmallTangent supports the operations the Node rules apply
+    to derivatives: sums and differences of SmallTangents of the same length, and scaling by a partial derivative.
+    Scaling by an array gives a dense array with the tangent axis first, and :code:`np.asarray` gives the entries.
+
+    >>> x1 = Node(2, SmallTangent.of([1., 0.]))
+    >>> x2 = Node(3, SmallTangent.of([0., 1.]))
+    >>> (x1 * x2).der
+    SmallTangent(3.0, 2.0)
+    >>> (x1 * x2).der.toarray()
+    array([3., 2.])
+    """
+
+    __slots__ = ()
+    # let numpy scalars defer to the reflected operators instead of building object arrays
+    __array_ufunc__ = None
+    size = 0
+    max_size = 4
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing the entries of the SmallTangent.
+        :rtype: string
+        """
+        return f'SmallTangent({", ".join(repr(float(d)) for d in self.values)})'
+
+    def __len__(self):
+        return self.size
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.values, dtype=dtype if dtype is not None else float)
+
+    def toarray(self):
+        """Return the derivative as a dense array.
+
+        :return: The entries, an array of length :math:`m`
+        :rtype: numpy array
+        """
+        return np.array(self.values, dtype=float)
+
+    def _add_other(self, other):
+        # a sum with the scalar 0 (e.g. the derivative of a constant) leaves the tangent unchanged, as in
+        # SparseTangent, and one with an array (e.g. the derivative from a rule that works on arrays, like dot)
+        # gives an array
+        if isinstance(other, np.ndarray):
+            return self.toarray() + other
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return NotImplemented
+
+    def _sub_other(self, other):
+        if isinstance(other, np.ndarray):
+            return self.toarray() - other
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, np.ndarray):
+            return other - self.toarray()
+        if isinstance(other, (int, float)) and other == 0:
+            return -self
+        return NotImplemented
+
+    @staticmethod
+    def of(values):
+        """Build the SmallTangent holding ``values``.
+
+        :param values: The entries, between 2 and 4 of them
+        :type values: list or tuple or numpy array of floats
+        :raises ValueError: The number of entries is not between 2 and 4.
+
+        :return: The SmallTangent of the matching length
+        :rtype: SmallTangent
+        """
+        values = [float(d) for d in values]
+        if len(values) not in _CLASSES:
+            raise ValueError(f'A SmallTangent holds 2 to {SmallTangent.max_size} entries, got {len(values)}')
+        return _CLASSES[len(values)](*values)
+
+    @staticmethod
+    def seeds(num_variables):
+        """Return the natural basis vectors as SmallTangents, the seeds of the variables.
+
+        :param num_variables: The number of variables :math:`m`, between 2 and 4
+        :type num_variables: integer
+
+        :return: The :math:`m` seeds, seed :math:`i` has a 1 at index :math:`i`
+        :rtype: list of SmallTangent objects
+
+        >>> SmallTangent.seeds(2)
+        [SmallTangent(1.0, 0.0), SmallTangent(0.0, 1.0)]
+        """
+        return [SmallTangent.of(row) for row in np.eye(num_variables)]
+
+
+# The subclasses write out every operation on two tangents of their length, or with a scalar, entry by entry.
+# Sums and differences with anything else go to the helpers of SmallTangent.
+class SmallTangent2(SmallTangent):
+    """A :py:class:`AutoDiff.tangent.SmallTangent` of length 2."""
+
+    __slots__ = ('d0', 'd1')
+    size = 2
+
+    def __init__(self, d0, d1):
+        self.d0 = d0
+        self.d1 = d1
+
+    @property
+    def values(self):
+        return (self.d0, self.d1)
+
+    def __add__(self, other):
+        if type(other) is SmallTangent2:
+            return SmallTangent2(self.d0 + other.d0, self.d1 + other.d1)
+        return self._add_other(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is SmallTangent2:
+            return SmallTangent2(self.d0 - other.d0, self.d1 - other.d1)
+        return self._sub_other(other)
+
+    def __mul__(self, other):
+        if isinstance(other, np.ndarray):
+            return np.multiply.outer(self.toarray(), other)
+        return SmallTangent2(self.d0 * other, self.d1 * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, np.ndarray):
+            return np.multiply.outer(self.toarray(), 1. / other)
+        return SmallTangent2(self.d0 / other, self.d1 / other)
+
+    def __neg__(self):
+        return SmallTangent2(-self.d0, -self.d1)
+
+
+class SmallTangent3(SmallTangent):
+    """A :py:class:`AutoDiff.tangent.SmallTangent` of length 3."""
+
+    __slots__ = ('d0', 'd1', 'd2')
+    size = 3
+
+    def __init__(self, d0, d1, d2):
+        self.d0 = d0
+        self.d1 = d1
+        self.d2 = d2
+
+    @property
+    def values(self):
+        return (self.d0, self.d1, self.d2)
+
+    def __add__(self, other):
+        if type(other) is SmallTangent3:
+            return SmallTangent3(self.d0 + other.d0, self.d1 + other.d1, self.d2 + other.d2)
+        return self._add_other(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is SmallTangent3:
+            return SmallTangent3(self.d0 - other.d0, self.d1 - other.d1, self.d2 - other.d2)
+        return self._sub_other(other)
+
+    def __mul__(self, other):
+        if isinstance(other, np.ndarray):
+            return np.multiply.outer(self.toarray(), other)
+        return SmallTangent3(self.d0 * other, self.d1 * other, self.d2 * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, np.ndarray):
+            return np.multiply.outer(self.toarray(), 1. / other)
+        return SmallTangent3(self.d0 / other, self.d1 / other, self.d2 / other)
+
+    def __neg__(self):
+        return SmallTangent3(-self.d0, -self.d1, -self.d2)
+
+
+class SmallTangent4(SmallTangent):
+    """A :py:class:`AutoDiff.tangent.SmallTangent` of length 4."""
+
+    __slots__ = ('d0', 'd1', 'd2', 'd3')
+    size = 4
+
+    def __init__(self, d0, d1, d2, d3):
+        self.d0 = d0
+        self.d1 = d1
+        self.d2 = d2
+        self.d3 = d3
+
+    @property
+    def values(self):
+        return (self.d0, self.d1, self.d2, self.d3)
+
+    def __add__(self, other):
+        if type(other) is SmallTangent4:
+            return SmallTangent4(self.d0 + other.d0, self.d1 + other.d1, self.d2 + other.d2, self.d3 + other.d3)
+        return self._add_other(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is SmallTangent4:
+            return SmallTangent4(self.d0 - other.d0, self.d1 - other.d1, self.d2 - other.d2, self.d3 - other.d3)
+        return self._sub_other(other)
+
+    def __mul__(self, other):
+        if isinstance(other, np.ndarray):
+            return np.multiply.outer(self.toarray(), other)
+        return SmallTangent4(self.d0 * other, self.d1 * other, self.d2 * other, self.d3 * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, np.ndarray):
+            return np.multiply.outer(self.toarray(), 1. / other)
+        return SmallTangent4(self.d0 / other, self.d1 / other, self.d2 / other, self.d3 / other)
+
+    def __neg__(self):
+        return SmallTangent4(-self.d0, -self.d1, -self.d2, -self.d3)
+
+
+_CLASSES = {2: SmallTangent2, 3: SmallTangent3, 4: SmallTangent4}
@@ -0,0 +1,760 @@
+import operator
+import numpy as np
+
+# opcodes of the operations recorded on a Tape
+(VAR, CONST, NEG, ADD, ADD_CONST, SUB, RSUB_CONST, MUL, MUL_CONST, DIV, DIV_CONST, RDIV_CONST,
+ POW, POW_CONST, RPOW_CONST, SQRT, LOGISTIC, LOG, EXP, SIN, COS, TAN, ARCSIN, ARCCOS, ARCTAN,
+ SINH, COSH, TANH) = range(28)
+
+
+def _sqrt(a, b, c):
+    if a < 0:
+        raise ValueError('Cannot take square root of negative number.')
+    value = np.sqrt(a)
+    return value, 1/2 * a ** (-1/2), 0.
+
+def _div(a, b, c):
+    if b == 0:
+        raise ZeroDivisionError('Division by zero')
+    return a / b, 1. / b, -a / b ** 2
+
+def _div_const(a, b, c):
+    if c == 0:
+        raise ZeroDivisionError('Division by zero')
+    return a / c, 1. / c, 0.
+
+def _rdiv_const(a, b, c):
+    if a == 0:
+        raise ZeroDivisionError('Division by zero')
+    return c / a, -c / a ** 2, 0.
+
+def _log(a, b, c):
+    if a <= 0:
+        raise ValueError('Cannot take logarithm of negative number.')
+    return np.log(a) / np.log(c), 1. / (a * np.log(c)), 0.
+
+def _tan(a, b, c):
+    if np.isclose((a - np.pi/2) / np.pi, 0):
+        raise ValueError('Cannot take tangent of pi/2 + n * pi, with n being some integer')
+    return np.tan(a), 1 / np.cos(a) ** 2, 0.
+
+def _arcsin(a, b, c):
+    if a < -1 or a > 1:
+        raise ValueError(f'The value `{a}` is not in the domain')
+    return np.arcsin(a), 1 / np.sqrt(1 - a ** 2), 0.
+
+def _arccos(a, b, c):
+    if a < -1 or a > 1:
+        raise ValueError(f'The value `{a}` is not in the domain')
+    return np.arccos(a), -1 / np.sqrt(1 - a ** 2), 0.
+
+# for each opcode, a rule mapping the value ``a`` of the first operand, the value ``b`` of the
+# second operand and the constant ``c`` to the value and the local partials wrt. both operands
+_RULES = {
+    VAR: lambda a, b, c: (c, 0., 0.),
+    CONST: lambda a, b, c: (c, 0., 0.),
+    NEG: lambda a, b, c: (-a, -1., 0.),
+    ADD: lambda a, b, c: (a + b, 1., 1.),
+    ADD_CONST: lambda a, b, c: (a + c, 1., 0.),
+    SUB: lambda a, b, c: (a - b, 1., -1.),
+    RSUB_CONST: lambda a, b, c: (c - a, -1., 0.),
+    MUL: lambda a, b, c: (a * b, b, a),
+    MUL_CONST: lambda a, b, c: (a * c, c, 0.),
+    DIV: _div,
+    DIV_CONST: _div_const,
+    RDIV_CONST: _rdiv_const,
+    POW: lambda a, b, c: (a ** b, b * a ** (b - 1.), np.log(a) * a ** b),
+    POW_CONST: lambda a, b, c: (a ** c, c * a ** (c - 1.), 0.),
+    RPOW_CONST: lambda a, b, c: (c ** a, np.log(c) * c ** a, 0.),
+    SQRT: _sqrt,
+    LOGISTIC: lambda a, b, c: (1 / (1 + np.exp(-a)), np.exp(a) / ((np.exp(a) + 1) ** 2), 0.),
+    LOG: _log,
+    EXP: lambda a, b, c: (np.exp(a), np.exp(a), 0.),
+    SIN: lambda a, b, c: (np.sin(a), np.cos(a), 0.),
+    COS: lambda a, b, c: (np.cos(a), -np.sin(a), 0.),
+    TAN: _tan,
+    ARCSIN: _arcsin,
+    ARCCOS: _arccos,
+    ARCTAN: lambda a, b, c: (np.arctan(a), 1 / (1 + a ** 2), 0.),
+    SINH: lambda a, b, c: (np.sinh(a), np.cosh(a), 0.),
+    COSH: lambda a, b, c: (np.cosh(a), np.sinh(a), 0.),
+    TANH: lambda a, b, c: (np.tanh(a), 1 / np.cosh(a) ** 2, 0.),
+}
+
+
+class Tape:
+    """This is a class that implements a flat, array-backed tape (Wengert list) for reverse mode
+    automatic differentiation. Instead of a graph of :py:class:`AutoDiff.rnode.RNode` objects, each
+    operation is recorded as one entry in a set of growable numpy arrays (struct of arrays): an
+    integer opcode, the tape indices of up to two operands, a constant operand and the local partial
+    derivatives wrt. both operands. Values are only held by the light-weight
+    :py:class:`AutoDiff.tape.TNode` handles, and the reverse sweep runs over the arrays.
+
+    :param capacity: The initial number of entries, the arrays double in size when they are full
+    :type capacity: integer
+
+    :ivar size: The number of recorded entries
+    :vartype size: integer
+
+    :ivar guards: The comparisons made on TNodes while recording, see :py:meth:`AutoDiff.tape.Tape.replay`
+    :vartype guards: list
+
+    >>> tape = Tape()
+    >>> x1 = tape.variable(5)
+    >>> x2 = tape.variable(3)
+    >>> f1 = x1 * x2 + x1
+    >>> tape.size
+    4
+    >>> tape.backward(f1.index)
+    [4.0, 5.0, 1.0, 1.0]
+    """
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.op = np.zeros(capacity, dtype=np.int8)
+        self.arg0 = np.zeros(capacity, dtype=np.int32)
+        self.arg1 = np.zeros(capacity, dtype=np.int32)
+        self.const = np.zeros(capacity)
+        self.d0 = np.zeros(capacity)
+        self.d1 = np.zeros(capacity)
+        self.guards = []
+
+    def __len__(self):
+        """Number of recorded entries.
+
+        :return: The number of entries on the tape
+        :rtype: integer
+        """
+        return self.size
+
+    def __str__(self):
+        """Print useful information for users.
+
+        :return: A string containing useful information of the Tape object.
+        :rtype: string
+
+        >>> tape = Tape()
+        >>> print(tape)
+        Tape: 0 entries, capacity 1024.
+        """
+        return f'Tape: {self.size} entries, capacity {len(self.op)}.'
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing useful information of the Tape object.
+        :rtype: string
+
+        >>> tape = Tape()
+        >>> tape
+        A Tape object with 0 entries and capacity of 1024.
+        """
+        return f'A Tape object with {self.size} entries and capacity of {len(self.op)}.'
+
+    def _grow(self):
+        """Double the capacity of all the arrays of the tape."""
+        for name in ('op', 'arg0', 'arg1', 'const', 'd0', 'd1'):
+            old = getattr(self, name)
+            new = np.zeros(2 * len(old), dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def record(self, op, arg0, arg1, const, d0, d1):
+        """Append an entry to the tape.
+
+        :param op: The opcode of the operation
+        :type op: integer
+        :param arg0: The tape index of the first operand, -1 if there is none
+        :type arg0: integer
+        :param arg1: The tape index of the second operand, -1 if there is none
+        :type arg1: integer
+        :param const: The constant operand of the operation
+        :type const: integer or float
+        :param d0: The partial derivative of the operation wrt. the first operand
+        :type d0: integer or float
+        :param d1: The partial derivative of the operation wrt. the second operand
+        :type d1: integer or float
+
+        :return: The tape index of the new entry
+        :rtype: integer
+        """
+        i = self.size
+        if i == len(self.op):
+            self._grow()
+        self.op[i] = op
+        self.arg0[i] = arg0
+        self.arg1[i] = arg1
+        self.const[i] = const
+        self.d0[i] = d0
+        self.d1[i] = d1
+        self.size = i + 1
+        return i
+
+    def apply(self, op, a, b=None, c=0.):
+        """Evaluate an operation on TNodes, record it on the tape and return its result.
+
+        :param op: The opcode of the operation
+        :type op: integer
+        :param a: The first operand
+        :type a: TNode
+        :param b: The second operand, defaults to None
+        :type b: TNode
+        :param c: The constant operand, defaults to 0
+        :type c: integer or float
+
+        :return: A TNode holding the result of the operation
+        :rtype: TNode
+
+        >>> tape = Tape()
+        >>> x1 = tape.variable(5)
+        >>> x2 = tape.apply(MUL_CONST, x1, c=3)
+        >>> print(x2)
+        TNode: index=1, val=15.
+        """
+        if b is None:
+            value, d0, d1 = _RULES[op](a.val, 0., c)
+            index = self.record(op, a.index, -1, c, d0, d1)
+        else:
+            value, d0, d1 = _RULES[op](a.val, b.val, c)
+            index = self.record(op, a.index, b.index, c, d0, d1)
+        return TNode(self, index, value)
+
+    def variable(self, value):
+        """Record an input variable on the tape.
+
+        :param value: The value of the variable
+        :type value: integer or float
+
+        :return: A TNode for the variable
+        :rtype: TNode
+        """
+        return TNode(self, self.record(VAR, -1, -1, value, 0., 0.), value)
+
+    def constant(self, value):
+        """Record a constant on the tape.
+
+        :param value: The value of the constant
+        :type value: integer or float
+
+        :return: A TNode for the constant
+        :rtype: TNode
+        """
+        return TNode(self, self.record(CONST, -1, -1, value, 0., 0.), value)
+
+    def guard(self, compare, arg0, arg1, const, result):
+        """Record the result of a comparison between TNodes, so that a replay can detect that the
+        recorded sequence of operations no longer matches the function.
+
+        :param compare: The comparison, e.g. :code:`operator.lt`
+        :type compare: function object
+        :param arg0: The tape index of the left-hand side
+        :type arg0: integer
+        :param arg1: The tape index of the right-hand side, -1 if it is the constant
+        :type arg1: integer
+        :param const: The constant right-hand side
+        :type const: integer or float
+        :param result: The result of the comparison
+        :type result: bool
+        """
+        self.guards.append((self.size, compare, arg0, arg1, const, result))
+
+    def replay(self, inputs):
+        """Re-evaluate the recorded operations at new input values, without running the recorded
+        function again. The local partial derivatives on the tape are overwritten, so
+        :py:meth:`AutoDiff.tape.Tape.backward` afterwards differentiates at the new inputs.
+        Before the operations that follow a recorded comparison are evaluated, the comparison is
+        repeated; if its result changes, the function would have taken another branch and the
+        replay stops.
+
+        :param inputs: The new values of the variables, in the order they were recorded
+        :type inputs: list of integers or floats
+        :raises ValueError: The number of inputs does not match the number of variables on the tape.
+
+        :return: The values of all the entries, or None if a comparison changed its result
+        :rtype: list of floats or None
+
+        >>> tape = Tape()
+        >>> x1 = tape.variable(2)
+        >>> f1 = x1 * x1 if x1 > 0 else -x1
+        >>> tape.replay([3])
+        [3, 9]
+        >>> tape.replay([-3]) is None
+        True
+        """
+        n = self.size
+        op = self.op[:n].tolist()
+        arg0 = self.arg0[:n].tolist()
+        arg1 = self.arg1[:n].tolist()
+        const = self.const[:n].tolist()
+        if op.count(VAR) != len(inputs):
+            raise ValueError(f'Expected {op.count(VAR)} inputs, got {len(inputs)}')
+        inputs = iter(inputs)
+        val = [0.] * n
+        d0 = [0.] * n
+        d1 = [0.] * n
+        guards = iter(self.guards)
+        position, compare, g0, g1, c, result = next(guards, (n, None, -1, -1, 0., None))
+        for i in range(n + 1):
+            while position == i and compare is not None:
+                if compare(val[g0], val[g1] if g1 >= 0 else c) != result:
+                    return None
+                position, compare, g0, g1, c, result = next(guards, (n, None, -1, -1, 0., None))
+            if i == n:
+                break
+            if op[i] == VAR:
+                val[i] = next(inputs)
+            else:
+                a = val[arg0[i]] if arg0[i] >= 0 else 0.
+                b = val[arg1[i]] if arg1[i] >= 0 else 0.
+                val[i], d0[i], d1[i] = _RULES[op[i]](a, b, const[i])
+        self.d0[:n] = d0
+        self.d1[:n] = d1
+        return val
+
+    def backward(self, output):
+        """Reverse sweep over the tape arrays. Entries after ``output`` cannot contribute to it,
+        so the sweep starts at ``output`` and runs down to the first entry.
+
+        :param output: The tape index of the entry to differentiate
+        :type output: integer
+
+        :return: The adjoints :math:`\\frac{\\partial \\text{output}}{\\partial v_i}` of the entries up to ``output``
+        :rtype: list of floats
+        """
+        n = output + 1
+        arg0 = self.arg0[:n].tolist()
+        arg1 = self.arg1[:n].tolist()
+        d0 = self.d0[:n].tolist()
+        d1 = self.d1[:n].tolist()
+        adjoint = [0.] * n
+        adjoint[output] = 1.
+        for i in range(output, -1, -1):
+            g = adjoint[i]
+            if g == 0.:
+                continue
+            j = arg0[i]
+            if j >= 0:
+                adjoint[j] += d0[i] * g
+            j = arg1[i]
+            if j >= 0:
+                adjoint[j] += d1[i] * g
+        return adjoint
+
+
+class TNode:
+    """This is a class that implements the handles of values recorded on a
+    :py:class:`AutoDiff.tape.Tape`. It overloads the same operators as
+    :py:class:`AutoDiff.rnode.RNode`, but a TNode only stores its tape, its index on the tape
+    and its value; everything needed for the reverse sweep is kept in the arrays of the tape.
+
+    :param tape: The tape the value is recorded on
+    :type tape: Tape
+    :param index: The index of the value on the tape
+    :type index: integer
+    :param value: The value
+    :type value: integer or float
+
+    >>> tape = Tape()
+    >>> x1 = tape.variable(5)
+    >>> x1.val
+    5
+    >>> x1.index
+    0
+    """
+
+    __slots__ = ('tape', 'index', 'val')
+    _supported_types = (int, float)
+
+    def __init__(self, tape, index, value):
+        self.tape = tape
+        self.index = index
+        self.val = value
+
+    def __str__(self):
+        """Print useful information for users.
+
+        :return: A string containing useful information of the TNode object.
+        :rtype: string
+
+        >>> tape = Tape()
+        >>> print(tape.variable(5))
+        TNode: index=0, val=5.
+        """
+        return f'TNode: index={self.index}, val={self.val}.'
+
+    def __repr__(self):
+        """Print useful information for developers.
+
+        :return: A string containing useful information of the TNode object.
+        :rtype: string
+
+        >>> tape = Tape()
+        >>> tape.variable(5)
+        A TNode object with value of 5 at index 0 of the tape.
+        """
+        return f'A TNode object with value of {self.val} at index {self.index} of the tape.'
+
+    def _binary(self, other, op, op_const, name):
+        """Helper function for the binary operators with a TNode or a constant as other operand."""
+        if isinstance(other, TNode):
+            return self.tape.apply(op, self, other)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for {name}")
+        else:
+            return self.tape.apply(op_const, self, c=other)
+
+    def __neg__(self):
+        """Overloads the built-in negation operator and records it on the tape.
+
+        :return: A TNode after negating of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(NEG, self)
+
+    def __add__(self, other):
+        """Overloads the built-in addition operator and records it on the tape.
+
+        :param other: The item to be added to the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A TNode after addition
+        :rtype: TNode
+
+        >>> tape = Tape()
+        >>> x1 = tape.variable(5)
+        >>> print(x1 + 3)
+        TNode: index=1, val=8.
+        """
+        return self._binary(other, ADD, ADD_CONST, 'addition')
+
+    def __sub__(self, other):
+        """Overloads the built-in subtraction operator and records it on the tape.
+
+        :param other: The item to be subtracted from the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A TNode after subtraction
+        :rtype: TNode
+        """
+        if isinstance(other, TNode):
+            return self.tape.apply(SUB, self, other)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for subtraction")
+        else:
+            return self.tape.apply(ADD_CONST, self, c=-other)
+
+    def __mul__(self, other):
+        """Overloads the built-in multiplication operator and records it on the tape.
+
+        :param other: The item to multiply the current TNode object by.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A TNode after multiplication
+        :rtype: TNode
+        """
+        return self._binary(other, MUL, MUL_CONST, 'multiplication')
+
+    def __truediv__(self, other):
+        """Overloads the built-in division operator and records it on the tape.
+
+        :param other: The item to divide the current TNode object by.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+        :raises ZeroDivisionError: Division by zero.
+
+        :return: A TNode after division
+        :rtype: TNode
+        """
+        return self._binary(other, DIV, DIV_CONST, 'division')
+
+    def __pow__(self, other):
+        """Overloads the built-in power operator and records it on the tape.
+
+        :param other: The item to raise the power of the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A TNode after taking the power
+        :rtype: TNode
+        """
+        return self._binary(other, POW, POW_CONST, 'power')
+
+    def __radd__(self, other):
+        """Overloads the built-in reflective addition operator and records it on the tape.
+
+        :param other: The integer or float to be added to the current TNode object.
+        :type other: integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+
+        :return: A TNode after reflective addition
+        :rtype: TNode
+        """
+        return self.__add__(other)
+
+    def __rsub__(self, other):
+        """Overloads the built-in reflective subtraction operator and records it on the tape.
+
+        :param other: The integer or float to be subtracted by the current TNode object.
+        :type other: integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+
+        :return: A TNode after reflective subtraction
+        :rtype: TNode
+        """
+        if not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for reflective subtraction")
+        return self.tape.apply(RSUB_CONST, self, c=other)
+
+    def __rmul__(self, other):
+        """Overloads the built-in reflective multiplication operator and records it on the tape.
+
+        :param other: The integer or float to multiply the current TNode object by.
+        :type other: integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+
+        :return: A TNode after reflective multiplication
+        :rtype: TNode
+        """
+        return self.__mul__(other)
+
+    def __rtruediv__(self, other):
+        """Overloads the built-in reflective true division operator and records it on the tape.
+
+        :param other: The integer or float to divide by the current TNode object.
+        :type other: integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+        :raises ZeroDivisionError: Division by zero.
+
+        :return: A TNode after reflective true division
+        :rtype: TNode
+        """
+        if not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for reflective division")
+        return self.tape.apply(RDIV_CONST, self, c=other)
+
+    def __rpow__(self, other):
+        """Overloads the built-in reflective power operator and records it on the tape.
+
+        :param other: The integer or float to raise to the power of the current TNode object.
+        :type other: integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer or float).
+
+        :return: A TNode after taking the power
+        :rtype: TNode
+        """
+        if not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for power")
+        return self.tape.apply(RPOW_CONST, self, c=other)
+
+    def sqrt(self):
+        """Overloads the numpy square root operator and records it on the tape.
+
+        :raises: ValueError: Cannot take square root of negative number.
+
+        :return: A TNode after taking the square root of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(SQRT, self)
+
+    def logistic(self):
+        """Implements the standard logistic operator and records it on the tape.
+
+        :return: A TNode after taking the standard logistic of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(LOGISTIC, self)
+
+    def log(self, base=np.e):
+        """Overloads the numpy logarithm operator and records it on the tape.
+
+        :param base: The base of the logarithm, defaults to :math:`e`
+        :type base: integer or float
+        :raises: ValueError: Cannot take logarithm of non positive number.
+
+        :return: A TNode after taking the logarithm of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(LOG, self, c=base)
+
+    def exp(self):
+        """Overloads the numpy exponential operator and records it on the tape.
+
+        :return: A TNode after taking the exponential of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(EXP, self)
+
+    def sin(self):
+        """Overloads the numpy sine operator and records it on the tape.
+
+        :return: A TNode after taking the sine of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(SIN, self)
+
+    def cos(self):
+        """Overloads the numpy cosine operator and records it on the tape.
+
+        :return: A TNode after taking the cosine of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(COS, self)
+
+    def tan(self):
+        """Overloads the numpy tangent operator and records it on the tape.
+
+        :raises ValueError: Cannot take tangent of pi/2 + n * pi, with n being some integer
+
+        :return: A TNode after taking the tangent of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(TAN, self)
+
+    def arcsin(self):
+        """Overloads the numpy arcsine operator and records it on the tape.
+
+        :raises ValueError: The value of self is not in the function domain.
+
+        :return: A TNode after taking the arcsine of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(ARCSIN, self)
+
+    def arccos(self):
+        """Overloads the numpy arccosine operator and records it on the tape.
+
+        :raises ValueError: The value of self is not in the function domain.
+
+        :return: A TNode after taking the arccosine of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(ARCCOS, self)
+
+    def arctan(self):
+        """Overloads the numpy arctangent operator and records it on the tape.
+
+        :return: A TNode after taking the arctangent of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(ARCTAN, self)
+
+    def sinh(self):
+        """Overloads the numpy hyperbolic sine operator and records it on the tape.
+
+        :return: A TNode after taking the hyperbolic sine of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(SINH, self)
+
+    def cosh(self):
+        """Overloads the numpy hyperbolic cosine operator and records it on the tape.
+
+        :return: A TNode after taking the hyperbolic cosine of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(COSH, self)
+
+    def tanh(self):
+        """Overloads the numpy hyperbolic tangent operator and records it on the tape.
+
+        :return: A TNode after taking the hyperbolic tangent of the current TNode
+        :rtype: TNode
+        """
+        return self.tape.apply(TANH, self)
+
+    def _compare(self, other, compare, name):
+        """Helper function for the comparison operators. The comparison and its result are
+        recorded on the tape as a guard, see :py:meth:`AutoDiff.tape.Tape.replay`."""
+        if isinstance(other, TNode):
+            result = compare(self.val, other.val)
+            self.tape.guard(compare, self.index, other.index, 0., result)
+        elif not isinstance(other, self._supported_types):
+            raise TypeError(f"Type `{type(other)}` is not supported for comparison {name}")
+        else:
+            result = compare(self.val, other)
+            self.tape.guard(compare, self.index, -1, other, result)
+        return result
+
+    def __lt__(self, other):
+        """Overloads the built-in less than operator for comparisons between TNodes.
+        Comparing the TNode object with some integer or float is also supported.
+
+        :param other: The item to be compared with the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A Boolean comparing the current TNode object with other
+        :rtype: Boolean
+        """
+        return self._compare(other, operator.lt, '<')
+
+    def __gt__(self, other):
+        """Overloads the built-in greater than operator for comparisons between TNodes.
+
+        :param other: The item to be compared with the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A Boolean comparing the current TNode object with other
+        :rtype: Boolean
+        """
+        return self._compare(other, operator.gt, '>')
+
+    def __le__(self, other):
+        """Overloads the built-in less than or equal to operator for comparisons between TNodes.
+
+        :param other: The item to be compared with the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A Boolean comparing the current TNode object with other
+        :rtype: Boolean
+        """
+        return self._compare(other, operator.le, '<=')
+
+    def __ge__(self, other):
+        """Overloads the built-in greater than or equal to operator for comparisons between TNodes.
+
+        :param other: The item to be compared with the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A Boolean comparing the current TNode object with other
+        :rtype: Boolean
+        """
+        return self._compare(other, operator.ge, '>=')
+
+    def __eq__(self, other):
+        """Overloads the built-in equal operator for comparisons between TNodes.
+
+        :param other: The item to be compared with the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A Boolean comparing the current TNode object with other
+        :rtype: Boolean
+        """
+        return self._compare(other, operator.eq, '=')
+
+    def __ne__(self, other):
+        """Overloads the built-in not equal operator for comparisons between TNodes.
+
+        :param other: The item to be compared with the current TNode object.
+        :type other: TNode or integer or float
+        :raises TypeError: The type of other is unsupported (i.e., not integer, float, or TNode type).
+
+        :return: A Boolean comparing the current TNode object with other
+        :rtype: Boolean
+        """
+        return self._compare(other, operator.ne, '!=')
+
+    def __hash__(self):
+        """Hashes the TNode object by identity, see :py:meth:`AutoDiff.rnode.RNode.__hash__`.
+
+        :return: The hash of the identity of the current TNode object
+        :rtype: integer
+        """
+        return object.__hash__(self)
@@ -0,0 +1,52 @@
+"""Memory held per recorded operation on a long chain of Nodes and of RNodes, measured with tracemalloc.
+
+"after" is the current classes, which use slots and format the visualization labels of Nodes only when
+they are read. "before" emulates the previous ones with subclasses that have an instance dictionary and,
+for Node, format the label on creation. The operations build their results from the class found in
+their module, so the subclasses are put there for the measurement.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/memory_per_operation.py
+"""
+import tracemalloc
+from contextlib import contextmanager
+from AutoDiff import node, rnode
+
+class DictNode(node.Node):
+    """A Node with an instance dictionary and its label formatted on creation."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.label = self.v_index
+
+class DictRNode(rnode.RNode):
+    """An RNode with an instance dictionary."""
+
+@contextmanager
+def replaced(module, name, cls):
+    original = getattr(module, name)
+    setattr(module, name, cls)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
+def bytes_per_operation(cls, n=20000):
+    """Return the memory held per operation by a chain of ``2 n`` operations that starts from ``cls(0.5)``."""
+    tracemalloc.start()
+    # an RNode holds the nodes computed from it, a Node the ones it is computed from: keep both ends
+    x = y = cls(0.5)
+    for _ in range(n):
+        y = y * 1.0001 + 0.1
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del x, y
+    return size / (2 * n)
+
+if __name__ == '__main__':
+    for module, name, before in [(node, 'Node', DictNode), (rnode, 'RNode', DictRNode)]:
+        with replaced(module, name, before):
+            old = bytes_per_operation(before)
+        new = bytes_per_operation(getattr(module, name))
+        print(f'{name}: {old:.0f} bytes per operation before, {new:.0f} after')
@@ -16,4 +16,6 @@ def f(x1, x2):
 tol = 1e-6 # default tol=1e-5
 sol_newton = optim.Newton(f, *x0, tol=tol)
 assert f(*sol_newton) - 0 < tol # f(*sol_newton) should be 0
-print(f'The solution is {sol_newton}.')
\ No newline at end of file
+print(f'The solution is {sol_newton}.')
+res = optim.Newton(f, *x0, tol=tol, full_output=True)
+print(f'Newton converged in {res.n_iter} iterations with {res.n_fev} function evaluations.')
@@ -0,0 +1,22 @@
+import tracemalloc
+import pytest
+
+@pytest.fixture
+def bytes_per_operation():
+    """Return the function that measures the memory held per recorded operation, the shared harness of
+    the memory tests.
+
+    The returned function takes ``build``, a function that records ``n_operations`` operations and returns
+    what it recorded, and returns the bytes still allocated by ``build`` when it returns, divided by
+    ``n_operations``. What ``build`` returns is kept alive until the measurement is taken.
+    """
+    def measure(build, n_operations):
+        tracemalloc.start()
+        try:
+            recorded = build()
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del recorded
+        return size / n_operations
+    return measure
@@ -1,10 +1,16 @@
 #!/usr/bin/env bash
 
 tests=(
+    test_context.py # unit test
     test_node.py # unit test
     test_rnode.py # unit test
+    test_tape.py # unit test
+    test_tangent.py # unit test
     test_forward.py # integration test
     test_reverse.py # integration test
+    test_hessian.py # integration test
+    test_compiled.py # integration test
+    test_sparse.py # integration test
     test_optimization.py # integration test
     test_plot_computation_graph.py # integration test
     test_forward.py # regression test
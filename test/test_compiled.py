@@ -0,0 +1,71 @@
+import pytest
+import numpy as np
+from AutoDiff import Reverse, compile, Compiled
+
+class TestCompiled:
+    """This is a class that tests tracing a function once and replaying it at new inputs.
+    """
+
+    def test_str(self):
+        g = compile(lambda x: x * 2, 1)
+        assert isinstance(g, Compiled)
+        assert str(g) == 'Compiled: 1 input(s), traced 0 time(s).'
+        assert repr(g) == 'A Compiled object with 1 input(s), traced 0 time(s), and tape of (None).'
+
+    def test_replay_matches_reverse(self):
+        """Test that replaying the tape gives the same value and Jacobian as Reverse"""
+        def f(x1, x2, x3):
+            return [np.exp(x3 / 5), x2 ** 3 + x1 * x2, 2 * np.sqrt(x1) - np.log(x3), 4, x2]
+        g = compile(f, 3)
+        for x in ([3, 4, 5], [1, 2, 3], [0.5, -1., 2.]):
+            val, der = g.grad(*x)
+            r = Reverse(f, *x)
+            assert np.allclose(val, r.val) and np.allclose(g(*x), r.val)
+            assert np.allclose(der, r.der)
+        assert g.n_traces == 1
+
+    def test_scalar(self):
+        """Test that the shapes match Reverse for scalar functions"""
+        g = compile(lambda x: np.sin(x) * x, 1)
+        for x in (1., 2., 3.):
+            val, der = g.grad(x)
+            assert np.isclose(val, np.sin(x) * x)
+            assert np.isclose(der, np.cos(x) * x + np.sin(x))
+            assert np.shape(der) == ()
+        g = compile(lambda x, y: x * y, 2)
+        val, der = g.grad(3, 4)
+        assert val == 12 and np.allclose(der, [4, 3])
+
+    def test_retrace(self):
+        """Test that the function is traced again when a comparison changes its result"""
+        def f(x, y):
+            if x > y:
+                return x * x
+            return y * 3
+        g = compile(f, 2)
+        assert np.allclose(g.grad(3, 1)[1], [6, 0])
+        assert np.allclose(g.grad(4, 1)[1], [8, 0])
+        assert g.n_traces == 1
+        assert np.allclose(g.grad(1, 4)[1], [0, 3])
+        assert g.n_traces == 2
+        assert np.allclose(g.grad(1, 5)[1], [0, 3])
+        assert g.n_traces == 2
+
+    def test_retrace_before_domain_error(self):
+        """Test that a changed branch is detected before the operations guarded by it"""
+        def f(x):
+            if x > 0:
+                return np.sqrt(x)
+            return -x
+        g = compile(f, 1)
+        assert np.isclose(g(4), 2)
+        assert g(-4) == 4
+        assert g.n_traces == 2
+
+    def test_wrong_number_of_inputs(self):
+        g = compile(lambda x, y: x * y, 2)
+        with pytest.raises(ValueError):
+            g(1)
+        g(1, 2)
+        with pytest.raises(ValueError):
+            g.grad(1, 2, 3)
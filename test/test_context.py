@@ -0,0 +1,106 @@
+import sys
+import threading
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from AutoDiff import Forward, Reverse, Node, RNode
+from AutoDiff.context import trace, current, TraceContext
+
+class TestContext:
+    """This is a class that tests the per-trace state used by Forward and Reverse.
+    """
+
+    def test_trace(self):
+        """Test that a trace holds its own state and restores the outer one on exit"""
+        outer = current()
+        with trace(counter=10, record=False, tape=[]) as context:
+            assert current() is context
+            x = Node(1)
+            y = x * 2
+            r = RNode(3)
+            s = r + 1
+            assert x.v_index == 'v11' and y.parent == ()
+            assert len(context.tape) == 2 and context.tape[0] is r and context.tape[1] is s
+            with trace() as inner:
+                assert Node(1).v_index == 'v1' and (Node(1) * 2).parent != ()
+                assert inner.tape is None
+            assert current() is context
+        assert current() is outer
+        assert repr(TraceContext(tape=[1])) == 'A TraceContext object with counter of 0, record of True, and tape of 1 RNode(s).'
+
+    def test_trace_exception(self):
+        """Test that the outer state is restored when the traced function raises"""
+        outer = current()
+        with pytest.raises(ZeroDivisionError):
+            Forward(lambda x: x / 0, 1.)
+        with pytest.raises(ZeroDivisionError):
+            Reverse(lambda x: x / 0, 1.)
+        assert current() is outer and outer.tape is None
+
+    def test_nested(self):
+        """Test a Forward call inside the function differentiated by another Forward"""
+        def f(x, y):
+            inner = Forward(lambda a: a ** 2, 3., keep_graph=True)
+            assert inner.output.parent[0].v_index == 'v0'
+            return x * y * inner.val
+        g = Forward(f, 2., 5., keep_graph=True)
+        assert np.allclose(g.der, [45., 18.])
+        assert [p.v_index for p in g.output.parent[0].parent] == ['v-1', 'v0']
+
+    def test_threads(self):
+        """Test Forward and Reverse from a thread pool, switching threads as often as possible"""
+        def f(x1, x2, x3):
+            y = x1
+            for _ in range(200):
+                y = np.sin(y) * x2 + x3
+            return [y, x1 * x3]
+
+        def task(k):
+            x = [0.1 * k, 0.5, 0.2]
+            g = Forward(f, *x, keep_graph=True)
+            labels = [p.v_index for p in g.output[1].parent]
+            r = Reverse(f, *x)
+            return g.der, labels, r.der
+
+        expected = [task(k) for k in range(16)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(task, range(16)))
+        finally:
+            sys.setswitchinterval(interval)
+        for (der, labels, rder), (der0, labels0, rder0) in zip(results, expected):
+            assert labels == ['v-2', 'v0'] == labels0
+            assert np.allclose(der, der0) and np.allclose(rder, rder0)
+
+    def test_threads_outside_trace(self):
+        """Test that each thread gets its own default state for Nodes created outside of any trace"""
+        main = current()
+        barrier = threading.Barrier(4)
+        results = [None] * 4
+
+        def task(k):
+            barrier.wait()
+            labels = []
+            for _ in range(200):
+                labels.append(Node(1.).v_index)
+                RNode(2.) * 3
+            results[k] = current(), labels
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=task, args=(k,)) for k in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        contexts = [context for context, _ in results]
+        assert len({id(context) for context in contexts + [main]}) == 5
+        for context, labels in results:
+            assert labels == [f'v{i}' for i in range(1, 201)]
+            assert context.counter == 200 and context.tape is None
+        assert current() is main
@@ -1,5 +1,6 @@
 import numpy as np
-from AutoDiff import Forward
+import pytest
+from AutoDiff import Forward, Node
 
 class TestForward:
     """This is a class for testing the Forward class
@@ -241,3 +242,207 @@ class TestForward:
             return newton2(f, new_x0)
         our_sol = newton2(f, x0)
         assert np.allclose(ground_truth, our_sol)
+
+    def test_deep_recurrence(self):
+        """
+        test Forward on a 1,000,000-step recurrence without raising the recursion limit
+        """
+        def f(x):
+            for _ in range(1000000):
+                x = x * 0.999999
+            return x
+        g = Forward(f, 2.0)
+        assert np.isclose(g.val, 2.0 * 0.999999 ** 1000000)
+        assert np.isclose(g.der, 0.999999 ** 1000000)
+
+    def test_batch(self):
+        """
+        test Forward over a batch of sample points against one Forward per point
+        """
+        x1 = np.linspace(0.5, 1.5, 7)
+        x2 = np.linspace(1, 2, 7)
+        def f(x1, x2):
+            return [x1 * x2 + np.sin(x1) / x2, np.sqrt(x1) - x2 ** x1, 3]
+        g = Forward(f, x1, x2, batch=True)
+        assert g.val.shape == (7, 3) and g.der.shape == (7, 3, 2)
+        for k in range(7):
+            h = Forward(f, x1[k], x2[k])
+            assert np.allclose(g.val[k], h.val)
+            assert np.allclose(g.der[k], h.der)
+
+        # scalar function, with a scalar variable broadcast over the samples
+        g = Forward(lambda x, y: np.exp(x) * y, x1, 2., batch=True)
+        assert g.val.shape == (7,) and g.der.shape == (7, 2)
+        assert np.allclose(g.der[:, 0], 2 * np.exp(x1))
+        assert np.allclose(g.der[:, 1], np.exp(x1))
+
+    def test_batch_many_points(self):
+        """
+        test Forward over 10^5 sample points in one pass
+        """
+        x = np.linspace(-1, 1, 100000)
+        g = Forward(lambda x, y: np.sin(x * y) + x, x, 0.5, batch=True)
+        assert np.allclose(g.der[:, 0], 0.5 * np.cos(0.5 * x) + 1)
+        assert np.allclose(g.der[:, 1], x * np.cos(0.5 * x))
+
+    def test_jvp(self):
+        """
+        test Forward.jvp against the full Jacobian times the direction
+        """
+        def f(x1, x2, x3):
+            return [x1 * x2 + np.sin(x3), np.exp(x1) / x2, 3]
+        x = [0.5, 2., 1.]
+        v = [1., -2., 0.5]
+        g = Forward(f, *x)
+        val, jv = Forward.jvp(f, x, v)
+        assert np.allclose(val, g.val)
+        assert np.allclose(jv, g.der @ v)
+
+        # scalar function
+        val, jv = Forward.jvp(lambda x, y: x ** y, [2, 3], [0, 1])
+        assert val == 8 and np.isclose(jv, 8 * np.log(2))
+        assert Forward.jvp(lambda x: 5, 1, 1) == (5, 0.)
+        with pytest.raises(ValueError):
+            Forward.jvp(f, x, [1., 2.])
+
+    def test_jvp_many_variables(self):
+        """
+        test that Forward.jvp carries a scalar tangent for a function of many variables
+        """
+        m = 5000
+        def f(*x):
+            s = 0
+            for xi in x:
+                s = s + xi * xi
+            return s
+        x = np.linspace(0, 1, m)
+        v = np.ones(m)
+        val, jv = Forward.jvp(f, x, v)
+        assert np.isclose(val, np.sum(x ** 2))
+        assert np.isclose(jv, np.sum(2 * x))
+        assert isinstance(jv, float)
+
+    def test_chunk_size(self):
+        """
+        test Forward with chunked seeding against a single pass over all the directions
+        """
+        def f(x1, x2, x3, x4, x5):
+            y = x1 * x2 + np.exp(x3)
+            return [y / x4, np.sin(x5) * y, x2 ** 2, 7]
+        x = [0.5, 1., 1.5, 2., 2.5]
+        g = Forward(f, *x)
+        for chunk_size in [1, 2, 3, 5, 10]:
+            h = Forward(f, *x, chunk_size=chunk_size)
+            assert np.allclose(h.val, g.val)
+            assert h.der.shape == g.der.shape
+            assert np.allclose(h.der, g.der)
+            assert np.allclose([o.der for o in h.output], g.der)
+
+        # scalar function
+        g = Forward(lambda x, y, z: x * y * z, 2, 3, 4, chunk_size=2)
+        assert g.val == 24
+        assert np.allclose(g.der, [12., 8., 6.])
+
+        with pytest.raises(ValueError):
+            Forward(f, *x, chunk_size=0)
+        with pytest.raises(ValueError):
+            Forward(f, *x, batch=True, chunk_size=2)
+
+    def test_chunk_size_many_variables(self):
+        """
+        test that chunked seeding bounds the length of the derivatives for many variables
+        """
+        m = 2000
+        lengths = set()
+        def f(*x):
+            s = 0
+            for xi in x:
+                s = s + xi * xi
+            lengths.add(len(s.der))
+            return s
+        x = np.linspace(0, 1, m)
+        g = Forward(f, *x, chunk_size=256)
+        assert lengths == {256, m % 256}
+        assert np.allclose(g.der, 2 * x)
+
+    def test_seeds(self):
+        """
+        test that the seeds are the natural basis vectors, shared read-only views of one buffer
+        """
+        seeds = Forward._seeds(4)
+        assert np.array_equal(np.stack(seeds), np.eye(4))
+        assert all(seed.base is seeds[0].base for seed in seeds)
+        with pytest.raises(ValueError):
+            seeds[0][1] = 1.
+        assert Forward._seeds(0) == []
+
+    def test_setup_many_variables(self):
+        """
+        test that the 5000 seeds are views of a single buffer of 2m - 1 floats,
+        the identity matrix alone would take 200 MB
+        """
+        m = 5000
+        seeds = Forward._seeds(m)
+        assert len(seeds) == m
+        buffer = seeds[0].base
+        assert buffer.shape == (2 * m - 1,)
+        assert all(seed.base is buffer for seed in seeds)
+        x = np.linspace(0, 1, m)
+        g = Forward(lambda *x: x[0] * x[-1], *x)
+        assert g.der[0] == 1. and g.der[-1] == 0. and g.der.shape == (m,)
+
+    def test_keep_graph(self):
+        """
+        test that the Nodes only keep their parents and operations when the graph is kept
+        """
+        def f(x1, x2):
+            return [np.sin(x1) * x2, x1 + 3]
+        g = Forward(f, 1, 2)
+        assert not g.keep_graph and g.f is f
+        assert g.output[0].parent == () and g.output[1].op == ()
+        h = Forward(f, 1, 2, keep_graph=True)
+        assert np.allclose(g.der, h.der)
+        assert h.output[0].op == ['*'] and h.output[0].parent[1].v_index == 'v0'
+        assert h.output[1].op == ['+', 3]
+        # Nodes created outside of Forward still record their parents
+        x = Node(2)
+        assert (x * 3).parent == [x]
+
+    def test_keep_graph_memory(self):
+        """
+        test that the intermediate Nodes of a long loop are freed when the graph is not kept
+        """
+        import tracemalloc
+        def f(x):
+            for _ in range(20000):
+                x = x * 0.9999 + 0.1
+            return x
+        peaks = []
+        for keep_graph in (False, True):
+            tracemalloc.start()
+            g = Forward(f, 1., keep_graph=keep_graph)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        assert peaks[0] < 100 * 1024
+        assert peaks[1] > 10 * peaks[0]
+
+    def test_few_variables(self):
+        """
+        test that the float and fixed-length derivatives used for up to 4 variables
+        match the array derivatives of chunked seeding, and that the outputs hold arrays
+        """
+        def f(*x):
+            y = x[0] * np.sin(x[-1]) + x[0] ** x[-1] - np.sum(x)
+            return [y / (1 + x[-1] ** 2), np.dot(x[0], x[-1]), np.maximum(y, x[0]), 3]
+        for m in range(1, 6):
+            x = np.linspace(0.5, 1.5, m)
+            g = Forward(f, *x)
+            h = Forward(f, *x, chunk_size=m + 1)
+            assert np.allclose(g.val, h.val)
+            assert g.der.shape == h.der.shape
+            assert np.allclose(g.der, h.der)
+            for o in g.output:
+                assert isinstance(o.der, np.ndarray) and o.der.shape == (m,)
+        g = Forward(lambda x: np.exp(x) * x, 1.)
+        assert isinstance(g.output.der, np.ndarray)
+        assert g.der == pytest.approx(2 * np.e)
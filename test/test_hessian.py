@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from AutoDiff import Forward, Hessian
+
+def rosenbrock(*x):
+    s = 0
+    for a, b in zip(x[:-1], x[1:]):
+        s = s + 100 * (b - a * a) ** 2 + (1 - a) ** 2
+    return s
+
+def finite_difference_hessian(f, x, eps=1e-6):
+    """Central differences of the forward mode gradient"""
+    x = np.array(x, dtype=float)
+    rows = []
+    for e in np.eye(len(x)):
+        rows.append((Forward(f, *(x + eps * e)).der - Forward(f, *(x - eps * e)).der) / (2 * eps))
+    return np.array(rows)
+
+class TestHessian:
+    """This is a class for testing the Hessian class
+    """
+    def test_str(self):
+        """Test for str and repr functions"""
+        h = Hessian(lambda x: x ** 3, 2)
+        assert str(h) == 'Hessian: val=8, der=12.0, and hess=12.0.'
+        assert repr(h) == 'A Hessian object with value of 8, derivative of 12.0, and Hessian of 12.0.'
+
+    @pytest.mark.parametrize('mode', ['reverse', 'forward'])
+    def test_hessian(self, mode):
+        """Test the Hessian of elementary functions against finite differences"""
+        def f(x, y, z):
+            a = x * y ** 2 + np.sin(z) / x - np.exp(x * z) + np.sqrt(y) * np.log(z) + x ** z + 2 ** y - 1 / y
+            return np.tanh(a) + np.arctan(x) + np.tan(x * z) + np.maximum(x, y) * np.cosh(z) + x.logistic()
+        x = [0.7, 1.3, 0.9]
+        h = Hessian(f, *x, mode=mode)
+        assert h.val == pytest.approx(Forward(f, *x).val)
+        assert np.allclose(h.der, Forward(f, *x).der)
+        assert h.hess.shape == (3, 3)
+        assert np.allclose(h.hess, h.hess.T)
+        assert np.allclose(h.hess, finite_difference_hessian(f, x), atol=1e-6)
+
+    @pytest.mark.parametrize('m', [1, 2, 4, 5, 8])
+    def test_modes_agree(self, m):
+        """Test that forward-over-reverse and forward-over-forward agree for any number of variables"""
+        x = np.linspace(-0.5, 1.5, m)
+        f = rosenbrock if m > 1 else (lambda x: np.exp(x) * x ** 2)
+        h1 = Hessian(f, *x)
+        h2 = Hessian(f, *x, mode='forward')
+        assert h1.val == pytest.approx(h2.val)
+        assert np.allclose(h1.der, h2.der)
+        assert np.allclose(h1.hess, h2.hess)
+        if m == 1:
+            assert np.ndim(h1.der) == 0 and np.ndim(h1.hess) == 0
+            assert h1.hess == pytest.approx(np.exp(x[0]) * (x[0] ** 2 + 4 * x[0] + 2))
+
+    @pytest.mark.parametrize('mode', ['reverse', 'forward'])
+    def test_independent_variables(self, mode):
+        """Test the Hessian of constants and of functions that ignore some variables"""
+        h = Hessian(lambda x, y: 5., 1, 2, mode=mode)
+        assert h.val == 5. and np.array_equal(h.der, [0., 0.]) and np.array_equal(h.hess, np.zeros((2, 2)))
+        h = Hessian(lambda x, y: y * y, 1, 2, mode=mode)
+        assert np.array_equal(h.der, [0., 4.])
+        assert np.array_equal(h.hess, [[0., 0.], [0., 2.]])
+
+    def test_hvp(self):
+        """Test Hessian-vector products against the full Hessian"""
+        x = np.linspace(-1, 1, 30)
+        h = Hessian(rosenbrock, *x)
+        for v in [np.ones(30), np.arange(30.), np.eye(30)[3]]:
+            val, der, hvp = Hessian.hvp(rosenbrock, x, v)
+            assert val == pytest.approx(h.val)
+            assert np.allclose(der, h.der)
+            assert np.allclose(hvp, h.hess @ v)
+        val, der, hvp = Hessian.hvp(lambda x1, x2: x1 ** 2 * x2, [1, 3], [1, 0])
+        assert val == 3 and np.array_equal(der, [6., 1.]) and np.array_equal(hvp, [6., 2.])
+        with pytest.raises(ValueError):
+            Hessian.hvp(rosenbrock, x, np.ones(29))
+
+    def test_errors(self):
+        """Test that vector functions and unknown modes are rejected"""
+        with pytest.raises(TypeError):
+            Hessian(lambda x, y: [x, y], 1, 2)
+        with pytest.raises(TypeError):
+            Hessian(lambda x, y: [x, y], 1, 2, mode='forward')
+        with pytest.raises(TypeError):
+            Hessian.hvp(lambda x, y: [x, y], [1, 2], [1, 0])
+        with pytest.raises(ValueError):
+            Hessian(rosenbrock, 1, 2, mode='central')
@@ -1,5 +1,6 @@
 import pytest
 from AutoDiff import Node
+from AutoDiff.context import trace
 import numpy as np
 
 class TestNode:
@@ -447,4 +448,132 @@ class TestNode:
             x1 != '1'
 
         with pytest.raises(TypeError):
-            '1' != x1
\ No newline at end of file
+            '1' != x1
+
+    def test_hash(self):
+        """Test for hash function"""
+        x1 = Node(5)
+        x2 = Node(5)
+        assert x1 == x2
+        assert hash(x1) != hash(x2)
+        assert len({x1, x2, x1}) == 2
+        assert {x1: 1, x2: 2}[x1] == 1
+
+    def test_array_values(self):
+        """Test that Nodes with array values broadcast against derivatives with the seed axis first"""
+        x1 = Node(np.array([1., 4., 9.]), np.array([[1., 1., 1.], [0., 0., 0.]]))
+        x2 = np.sqrt(x1) * x1
+        assert np.allclose(x2.val, [1, 8, 27])
+        assert np.allclose(x2.der, [[1.5, 3, 4.5], [0, 0, 0]])
+        with pytest.raises(ValueError):
+            np.sqrt(x1 - 2)
+        with pytest.raises(ValueError):
+            np.log(x1 - 1)
+        with pytest.raises(ValueError):
+            np.arcsin(x1)
+        with pytest.raises(ZeroDivisionError):
+            x1 / (x1 - 1)
+
+    def test_slots_and_labels(self):
+        """Test that Nodes have no instance dictionary and their labels follow the creation order"""
+        with trace():
+            x1 = Node(5)
+            x2 = np.sin(x1) + 1
+        assert not hasattr(x1, '__dict__')
+        assert x1.v_index == 'v1' and x2.parent[0].v_index == 'v2' and x2.v_index == 'v3'
+        assert x2.op == ['+', 1] and x1.parent == [] and x1.op == []
+
+    def test_memory_per_operation(self):
+        """Test that a Node holds no instance dictionary and no label until it is read,
+        see benchmarks/memory_per_operation.py for the memory per operation"""
+        x = Node(0.5, 1.)
+        y = x * 1.0001 + 0.1
+        assert not hasattr(y, '__dict__')
+        assert set(Node.__slots__) == {'val', 'der', 'parent', 'op', '_index'}
+        # only the creation index is stored, the label is formatted when read
+        assert type(y._index) is int
+        assert y.v_index == f'v{y._index}' and y.parent[0].v_index == f'v{y._index - 1}'
+
+    def test_array_ufunc(self):
+        """Test that numpy ufuncs dispatch to the derivative rules, also with numpy scalars"""
+        x1 = Node(2., 1.)
+        for ufunc, der in [(np.sin, np.cos(2.)), (np.exp, np.exp(2.)), (np.log2, 1 / (2. * np.log(2))),
+                           (np.negative, -1.), (np.sqrt, 0.5 / np.sqrt(2.))]:
+            assert np.isclose(ufunc(x1).der, der)
+        x2 = np.subtract(np.float64(3.) * x1, np.int64(1))
+        assert isinstance(x2, Node) and x2.val == 5. and x2.der == 3.
+        x3 = np.power(np.float64(2.), x1)
+        assert x3.val == 4. and np.isclose(x3.der, 4. * np.log(2.))
+        assert np.less(x1, 3.) and np.greater_equal(np.float64(3.), x1)
+        # an array of constants gives one Node with an array value
+        x4 = np.array([1., 2.]) * x1
+        assert isinstance(x4, Node) and np.allclose(x4.val, [2., 4.]) and np.allclose(x4.der, [1., 2.])
+        with pytest.raises(TypeError):
+            np.floor(x1)
+
+    def test_maximum_minimum(self):
+        """Test np.maximum and np.minimum, with the derivative of the first operand at ties"""
+        x1 = Node(2., np.array([1., 0.]))
+        x2 = Node(3., np.array([0., 1.]))
+        assert np.maximum(x1, x2).val == 3. and np.allclose(np.maximum(x1, x2).der, [0., 1.])
+        assert np.minimum(x1, x2).val == 2. and np.allclose(np.minimum(x1, x2).der, [1., 0.])
+        assert np.allclose(np.maximum(x1, 2.).der, [1., 0.])
+        assert np.allclose(np.maximum(2., x1).der, [1., 0.])
+        assert np.allclose(np.maximum(x1, 5).der, [0., 0.]) and np.maximum(x1, 5).val == 5
+        x3 = Node(np.array([1., 4.]), np.array([[1., 1.], [0., 2.]]))
+        x4 = np.maximum(x3, 2.)
+        assert np.allclose(x4.val, [2., 4.]) and np.allclose(x4.der, [[0., 1.], [0., 2.]])
+        with pytest.raises(TypeError):
+            x1.maximum('a')
+
+    def test_sum_dot_where(self):
+        """Test np.sum, np.dot and np.where on Nodes with array values"""
+        seeds = np.eye(3)
+        x = Node(np.array([1., 2., 3.]), seeds)
+        s = np.sum(x * x)
+        assert s.val == 14. and np.allclose(s.der, [2., 4., 6.])
+        assert np.sum(Node(2., 3.)).der == 3.
+        d = np.dot(x, np.array([1., -1., 2.]))
+        assert d.val == 5. and np.allclose(d.der, [1., -1., 2.])
+        d = np.dot(np.array([[1., 0., 0.], [1., 1., 1.]]), x)
+        assert np.allclose(d.val, [1., 6.]) and np.allclose(d.der, [[1., 1.], [0., 1.], [0., 1.]])
+        d = np.dot(x, np.sin(x))
+        assert np.isclose(d.der[1], np.sin(2.) + 2. * np.cos(2.))
+        w = np.where(x.val > 1.5, x * 2, 7.)
+        assert np.allclose(w.val, [7., 4., 6.]) and np.allclose(w.der, [[0., 0., 0.], [0., 2., 0.], [0., 0., 2.]])
+        w = np.where(True, Node(1., 2.), Node(3., 4.))
+        assert w.val == 1. and w.der == 2.
+
+    def test_tensor_operations(self):
+        """Test Nodes with matrix values: matmul, broadcasting, mean, reshape, indexing and transpose,
+        against finite differences"""
+        rng = np.random.default_rng(0)
+        W, x, b = rng.normal(size=(2, 3)), rng.normal(size=3), rng.normal(size=2)
+        def loss(W):
+            return np.mean(np.tanh(W @ x + b) ** 2)
+        # the derivative with respect to all six entries of W, one tangent axis
+        Wn = Node(W, np.eye(6).reshape(6, 2, 3))
+        y = np.mean(np.tanh(Wn @ x + b) ** 2)
+        step = 1e-6
+        fd = [(loss(W + step * e.reshape(2, 3)) - loss(W - step * e.reshape(2, 3))) / (2 * step) for e in np.eye(6)]
+        assert np.isclose(y.val, loss(W)) and np.allclose(y.der, fd)
+        # matrix times vector Node, 1D @ 1D and stacked matrices
+        xn = Node(x, np.eye(3))
+        assert np.allclose((W @ xn).der, W.T)
+        assert np.allclose((xn @ xn).der, 2 * x)
+        A = rng.normal(size=(4, 2, 3))
+        z = np.sum(np.sin(Node(A, 1.) @ x))
+        assert np.isclose(z.der, np.sum(np.cos(A @ x) * (np.ones_like(A) @ x)))
+        # a scalar Node broadcast against arrays keeps its tangent axis first
+        s = Node(2., np.array([1., 0.]))
+        v = Node(np.array([1., 2., 3.]), np.zeros((2, 3)))
+        assert np.allclose((s * v).der, [[1., 2., 3.], [0., 0., 0.]])
+        assert np.allclose((s + np.array([1., 2.])).der, [[1., 1.], [0., 0.]])
+        assert np.allclose(np.maximum(s, np.array([1., 3.])).der, [[1., 0.], [0., 0.]])
+        m = Node(np.array([[1., 2.], [3., 6.]]), np.eye(4).reshape(4, 2, 2))
+        assert np.allclose(np.mean(m, axis=0).der, [[.5, 0.], [0., .5], [.5, 0.], [0., .5]])
+        assert np.allclose(m.reshape(4).der, np.eye(4))
+        assert np.allclose(m[:, 1].der, [[0., 0.], [1., 0.], [0., 0.], [0., 1.]])
+        assert np.allclose(m.T.der, np.transpose(np.eye(4).reshape(4, 2, 2), (0, 2, 1)))
+        with pytest.raises(TypeError):
+            m @ 2.
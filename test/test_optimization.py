@@ -1,7 +1,33 @@
 import numpy as np
-from AutoDiff.optim import Newton, SGD
+from AutoDiff.optim import Newton, NewtonKrylov, Broyden, SGD, LBFGS, OptimizeResult
+from AutoDiff.optim.newton_krylov import _gmres, _bicgstab
+from AutoDiff.optim.broyden import _DenseInverse, _LimitedMemoryInverse
+from AutoDiff.optim.lbfgs import _two_loop, _wolfe_line_search
+from AutoDiff.compiled import compile
+from collections import deque
 import pytest
 
+def array_constant_objective(x, y):
+    # arithmetic with an array constant is not supported by the scalar tape of compile
+    d = x + np.array([-1., 1.])
+    e = y - np.array([2., 2.])
+    return np.sum(np.maximum(d, 0.) ** 2) + np.dot(e, e)
+
+def array_constant_objective_univariate(x):
+    return (x - np.array([2.])) @ (x - np.array([2.]))
+
+def boundary_value_problem(m, diagonal):
+    # discretized nonlinear boundary value problem, with m unknowns
+    b = np.linspace(1, 2, m)
+    def f(*x):
+        out = []
+        for i in range(m):
+            left = x[i - 1] if i > 0 else 0.
+            right = x[i + 1] if i < m - 1 else 0.
+            out.append(diagonal * x[i] - left - right + 0.1 * x[i] ** 3 - b[i])
+        return out
+    return f
+
 class TestOptimization:
     def test_multivariate_newton(self):
         """
@@ -53,6 +79,210 @@ class TestOptimization:
         with pytest.raises(RuntimeError):
             sol = Newton(f, *x0)
 
+    def test_newton_full_output(self):
+        """
+        test the iteration statistics of Newton, f is evaluated once per iteration
+        """
+        calls = []
+        def f(x1, x2):
+            calls.append(None)
+            return [
+                2 * x1 + x2 - np.exp(-x1),
+                -x1 + 2 * x2 - np.exp(-x2)
+            ]
+        res = Newton(f, 0, 1, full_output=True)
+        assert isinstance(res, OptimizeResult)
+        assert np.allclose(res.val, np.zeros(2), atol=1e-5)
+        assert np.allclose(res.x, Newton(f, 0, 1))
+        assert res.n_fev == res.n_jev == res.n_iter + 1 == len(res.norms)
+        assert len(calls) == 2 * res.n_fev
+        assert res.norms[-1] < 1e-5 <= res.norms[-2]
+        assert 'n_iter=' in str(res) and 'OptimizeResult' in repr(res)
+
+        res = Newton(lambda x: x ** 2 - 2, 1, full_output=True)
+        assert isinstance(res.x, float) and res.x == pytest.approx(np.sqrt(2), abs=1e-5)
+        # quadratic convergence
+        assert res.norms[2] < res.norms[1] ** 2
+
+    def test_newton_max_iter(self):
+        """
+        test that Newton runs many iterations without recursion and respects max_iter
+        """
+        # the update scales x by 0.9 at every step, it takes more iterations than the recursion limit
+        f = lambda x: x ** 10
+        res = Newton(f, 1e30, tol=1e-300, max_iter=2000, full_output=True)
+        assert res.n_iter > 1000
+        with pytest.raises(RuntimeError, match='3 iterations'):
+            Newton(lambda x: x ** 2 + 1, 0.5, max_iter=3)
+
+    def test_newton_vector_univariate(self):
+        """
+        test Newton on a vector function of a single variable, in the least-squares sense
+        """
+        sol = Newton(lambda x: [x ** 2 - 2, x ** 3 - 2 ** 1.5], 1.)
+        assert sol == pytest.approx(np.sqrt(2), abs=1e-5)
+
+    def test_newton_jacobian_reuse(self):
+        """
+        test the chord and Shamanskii variants of Newton, which reuse the Jacobian and its factorization
+        """
+        m = 40
+        f = boundary_value_problem(m, 4)
+        x0 = np.zeros(m)
+        newton = Newton(f, *x0, tol=1e-10, full_output=True)
+        for max_reuse in [1, 3, None]:
+            res = Newton(f, *x0, tol=1e-10, max_reuse=max_reuse, full_output=True)
+            assert np.allclose(res.x, newton.x)
+            assert np.linalg.norm(res.val) < 1e-10
+            assert res.n_jev < newton.n_jev
+            # a Jacobian is recomputed with a forward pass alone, f is evaluated once per iteration
+            assert res.n_fev == res.n_iter + 1
+        # the chord method computes a single Jacobian, then evaluates f once per iteration
+        res = Newton(f, *x0, tol=1e-10, max_reuse=None, full_output=True)
+        assert res.n_jev == 1 and res.n_fev == res.n_iter + 1
+        assert all(n_new <= 0.5 * n_old for n_old, n_new in zip(res.norms, res.norms[1:]))
+
+    def test_newton_jacobian_reuse_shapes(self):
+        """
+        test Jacobian reuse for scalar, underdetermined, overdetermined and singular problems
+        """
+        res = Newton(lambda x: x ** 2 - 2, 1., max_reuse=3, full_output=True)
+        assert res.x == pytest.approx(np.sqrt(2), abs=1e-5)
+        assert res.n_jev < res.n_fev
+        # the minimum-norm update of an underdetermined system, as lstsq gives it
+        def f(x, y):
+            return x ** 2 + y ** 2
+        sol = Newton(f, 4, 3, max_reuse=None)
+        assert abs(f(*sol)) < 1e-5
+        assert sol[0] / sol[1] == pytest.approx(4 / 3)
+        sol = Newton(lambda x: [x ** 2 - 2, x ** 3 - 2 ** 1.5], 1., max_reuse=2)
+        assert sol == pytest.approx(np.sqrt(2), abs=1e-5)
+        with pytest.raises(RuntimeError):
+            Newton(lambda x, y: 5, 4, 3, max_reuse=2)
+
+    def test_krylov_solvers(self):
+        """
+        test GMRES and BiCGStab on linear systems, with and without preconditioning
+        """
+        rng = np.random.default_rng(0)
+        A = np.eye(50) * 5 + rng.normal(size=(50, 50)) / 5
+        b = rng.normal(size=50)
+        exact = np.linalg.solve(A, b)
+        jacobi = lambda v: v / np.diag(A)
+        for solver in [_gmres, _bicgstab]:
+            for precondition in [None, jacobi]:
+                x, n_matvec = solver(lambda v: A @ v, b, 1e-10, precondition, 10, 500)
+                assert np.allclose(x, exact)
+                assert np.linalg.norm(A @ x - b) <= 1e-10
+                assert 0 < n_matvec < 500
+        # the budget of products bounds the work
+        x, n_matvec = _gmres(lambda v: A @ v, b, 1e-14, None, 10, 7)
+        assert n_matvec == 7
+        # a singular system stops without dividing by zero
+        x, n_matvec = _gmres(lambda v: np.zeros(2), np.ones(2), 1e-10, None, 10, 20)
+        assert np.array_equal(x, np.zeros(2))
+        # BiCGStab breaks down without dividing by zero, when the shadow residual is orthogonal to A p
+        with np.errstate(all='raise'):
+            A = np.array([[0., 1.], [0., 0.]])
+            x, n_matvec = _bicgstab(lambda v: A @ v, np.array([0., 1.]), 1e-10, None, 10, 20)
+            assert np.array_equal(x, np.zeros(2)) and n_matvec == 1
+            # or when A s vanishes, after the first half of the iteration
+            A = np.array([[1., 1.], [0., 0.]])
+            x, n_matvec = _bicgstab(lambda v: A @ v, np.ones(2), 1e-10, None, 10, 20)
+            assert np.allclose(x, [1., 1.]) and n_matvec == 2
+
+    @pytest.mark.parametrize('method', ['gmres', 'bicgstab'])
+    def test_newton_krylov(self, method):
+        """
+        test Newton-Krylov against Newton, with forcing terms and preconditioners
+        """
+        m = 50
+        f = boundary_value_problem(m, 2.2)
+        x0 = np.zeros(m)
+        sol = Newton(f, *x0, tol=1e-10)
+        calls = []
+        preconditioner = lambda x, v: calls.append(None) or v / (2.2 + 0.3 * x ** 2)
+        for forcing in [None, 0.1]:
+            for pre in [None, preconditioner]:
+                res = NewtonKrylov(f, *x0, tol=1e-10, method=method, forcing=forcing,
+                                   preconditioner=pre, full_output=True)
+                assert np.allclose(res.x, sol, atol=1e-9)
+                assert res.norms[-1] < 1e-10
+                assert res.n_fev == res.n_jev + res.n_iter + 1
+        assert calls
+        assert np.allclose(NewtonKrylov(lambda x: x ** 2 - 2, 1., method=method), np.sqrt(2))
+
+    def test_newton_krylov_errors(self):
+        """
+        test that Newton-Krylov rejects non-square systems and unknown methods, and reports divergence
+        """
+        with pytest.raises(ValueError):
+            NewtonKrylov(lambda x, y: x + y, 1, 2)
+        with pytest.raises(ValueError):
+            NewtonKrylov(lambda x, y: [x, y], 1, 2, method='cg')
+        with pytest.raises(RuntimeError):
+            NewtonKrylov(lambda x, y: [5., 5.], 1, 2, max_iter=3)
+
+    def test_broyden_updates(self):
+        """
+        test that the dense and limited-memory inverses apply the same rank-one updates
+        """
+        rng = np.random.default_rng(1)
+        J = np.eye(6) * 3 + rng.normal(size=(6, 6)) / 3
+        dense = _DenseInverse(J)
+        limited = _LimitedMemoryInverse(J, np.zeros(6), 3)
+        B = J.copy()
+        for _ in range(3):
+            s, y = rng.normal(size=6), rng.normal(size=6)
+            B += np.outer(y - B @ s, s) / (s @ s)
+            dense.update(s, y)
+            limited.update(s, y)
+            # the secant condition B s = y
+            assert np.allclose(dense.solve(y), s) and np.allclose(limited.solve(y), s)
+        v = rng.normal(size=6)
+        assert np.allclose(dense.solve(v), np.linalg.solve(B, v))
+        assert np.allclose(limited.solve(v), np.linalg.solve(B, v))
+        # the oldest correction is dropped
+        limited.update(rng.normal(size=6), rng.normal(size=6))
+        assert len(limited.corrections) == 3
+
+    @pytest.mark.parametrize('memory', [None, 3])
+    @pytest.mark.parametrize('mode', ['forward', 'reverse'])
+    def test_broyden(self, mode, memory):
+        """
+        test Broyden against Newton, with a single Jacobian evaluation
+        """
+        m = 30
+        f = boundary_value_problem(m, 2.2)
+        x0 = np.zeros(m)
+        res = Broyden(f, *x0, tol=1e-10, mode=mode, memory=memory, full_output=True)
+        assert np.allclose(res.x, Newton(f, *x0, tol=1e-10), atol=1e-9)
+        assert res.norms[-1] < 1e-10
+        assert res.n_jev == 1 and res.n_fev >= res.n_iter + 1
+        # the norm decreases at every step thanks to the backtracking
+        assert all(np.diff(res.norms) < 0)
+
+        def g(x1, x2):
+            return [
+                2 * x1 + x2 - np.exp(-x1),
+                -x1 + 2 * x2 - np.exp(-x2)
+            ]
+        assert np.allclose(g(*Broyden(g, 0, 1, mode=mode, memory=memory)), 0, atol=1e-5)
+        assert Broyden(lambda x: x ** 2 - 2, 1., mode=mode, memory=memory) == pytest.approx(np.sqrt(2), abs=1e-5)
+
+    def test_broyden_errors(self):
+        """
+        test that Broyden rejects non-square systems and invalid arguments, and reports divergence
+        """
+        with pytest.raises(ValueError):
+            Broyden(lambda x, y: x + y, 1, 2)
+        with pytest.raises(ValueError):
+            Broyden(lambda x, y: [x, y], 1, 2, mode='central')
+        with pytest.raises(ValueError):
+            Broyden(lambda x, y: [x, y], 1, 2, memory=0)
+        with pytest.raises(RuntimeError):
+            Broyden(lambda x, y: [x * 0 + 5, y * 0 + 5], 1, 2, max_iter=3)
+
     def test_univariate_sgd(self):
         """
         test univariate SGD
@@ -74,4 +304,91 @@ class TestOptimization:
         def f(x, y):
             return x ** 2 - y ** 2
         with pytest.raises(RuntimeError):
-            sol = SGD(f, *x0)
\ No newline at end of file
+            sol = SGD(f, *x0)
+
+    def test_sgd_numpy_functions(self):
+        """
+        test SGD on functions the tape cannot trace, which fall back to Reverse
+        """
+        with pytest.raises(TypeError):
+            compile(array_constant_objective, 2).grad(3., 4.)
+        sol = SGD(array_constant_objective, 3, 4)
+        assert abs(array_constant_objective(*sol)) < 1e-5
+        assert sol[0] < -1 + 1e-2 and abs(sol[1] - 2) < 1e-2
+        sol = SGD(array_constant_objective_univariate, 5)
+        assert isinstance(sol, float) and abs(sol - 2) < 1e-2
+
+    def test_two_loop(self):
+        """
+        test that the two-loop recursion applies the BFGS inverse Hessian built from the stored pairs
+        """
+        rng = np.random.default_rng(2)
+        A = rng.normal(size=(5, 5))
+        A = A @ A.T + np.eye(5)
+        history = deque(maxlen=3)
+        for _ in range(4):
+            s = rng.normal(size=5)
+            y = A @ s
+            history.append((s, y, 1. / (s @ y)))
+        s, y, rho = history[-1]
+        H = np.eye(5) / (rho * (y @ y))
+        for s, y, rho in history:
+            V = np.eye(5) - rho * np.outer(y, s)
+            H = V.T @ H @ V + rho * np.outer(s, s)
+        g = rng.normal(size=5)
+        assert np.allclose(_two_loop(g, history), H @ g)
+        assert np.array_equal(_two_loop(g, deque()), g)
+
+    def test_wolfe_line_search(self):
+        """
+        test that the line search returns a step that satisfies the strong Wolfe conditions
+        """
+        f = lambda x: (np.sum(x ** 4) - np.sum(x), 4 * x ** 3 - 1)
+        x = np.array([2., -1.])
+        val, der = f(x)
+        for step in [1e-3, 1., 100.]:
+            new_x, new_val, new_der = _wolfe_line_search(f, x, val, der, -der, step, 1e-4, 0.9)
+            alpha = (new_x - x) @ -der / (der @ der)
+            assert new_val <= val + 1e-4 * alpha * (der @ -der)
+            assert abs(new_der @ -der) <= 0.9 * abs(der @ -der)
+
+    def test_lbfgs(self):
+        """
+        test LBFGS on quadratics and Rosenbrock functions
+        """
+        res = LBFGS(lambda x, y: x ** 2 + y ** 2, 4, 3, full_output=True)
+        assert np.allclose(res.x, 0)
+        assert res.n_iter < 5 and res.n_fev == res.n_jev
+        assert isinstance(LBFGS(lambda x: (x - 3) ** 2, 1), float)
+
+        def rosenbrock(*x):
+            s = 0
+            for a, b in zip(x[:-1], x[1:]):
+                s = s + 100 * (b - a * a) ** 2 + (1 - a) ** 2
+            return s
+        res = LBFGS(rosenbrock, -1.2, 1, tol=1e-8, full_output=True)
+        assert np.allclose(res.x, [1, 1])
+        assert res.n_iter < 100 and res.norms[-1] < 1e-8
+        res = LBFGS(rosenbrock, *np.zeros(10), memory=5, full_output=True)
+        assert np.allclose(res.x, np.ones(10), atol=1e-4)
+        # a minimum that is not a root, which SGD cannot detect
+        assert LBFGS(lambda x: np.cos(x), 0.5) == pytest.approx(np.pi, abs=1e-5)
+        # functions the tape cannot trace fall back to Reverse, as in SGD
+        sol = LBFGS(array_constant_objective, 3, 4)
+        assert abs(array_constant_objective(*sol)) < 1e-5
+        assert sol[0] < -1 + 1e-2 and abs(sol[1] - 2) < 1e-5
+        sol = LBFGS(array_constant_objective_univariate, 5)
+        assert isinstance(sol, float) and sol == pytest.approx(2)
+
+    def test_lbfgs_errors(self):
+        """
+        test that LBFGS rejects invalid arguments and vector functions, and reports divergence
+        """
+        with pytest.raises(ValueError):
+            LBFGS(lambda x: x ** 2, 1., memory=0)
+        with pytest.raises(ValueError):
+            LBFGS(lambda x: x ** 2, 1., c1=0.9, c2=0.1)
+        with pytest.raises(TypeError):
+            LBFGS(lambda x, y: [x, y], 1., 2.)
+        with pytest.raises(RuntimeError):
+            LBFGS(lambda x: x, 1., max_iter=20)
@@ -1,6 +1,7 @@
 import numpy as np
 from AutoDiff import Forward
-from AutoDiff.graphvis.plot_computation_graph import generate_graph
+import graphviz as gv
+from AutoDiff.graphvis.plot_computation_graph import generate_graph, build_graph
 from pathlib import Path
 
 class TestComputationGraph:
@@ -17,3 +18,16 @@ class TestComputationGraph:
         generate_graph(x, g2)
         my_file = Path("./computationGraph")
         assert my_file.exists()
+
+
+    def test_build_graph_deep(self):
+        """Test that building the graph of a deep computation does not hit the recursion limit
+        """
+        def f(x):
+            for _ in range(5000):
+                x = x + 1
+            return x
+        g = Forward(f, 0, keep_graph=True)
+        graph = gv.Graph()
+        build_graph(graph, g.output)
+        assert len(graph.body) == 5 * 5000
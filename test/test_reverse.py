@@ -1,5 +1,7 @@
 import numpy as np
-from AutoDiff import Reverse
+import pytest
+from AutoDiff import Forward, Reverse, RNode
+from AutoDiff.context import trace
 
 class TestReverse:
     """This is a class for testing the Reverse class
@@ -219,4 +221,217 @@ class TestReverse:
             new_x0 = x0 - g.val / g.der
             return newton2(f, new_x0)
         our_sol = newton2(f, x0)
-        assert np.allclose(ground_truth, our_sol)
\ No newline at end of file
+        assert np.allclose(ground_truth, our_sol)
+    def test_grad_many_inputs(self):
+        """ Testing Reverse class with a scalar function of many inputs
+        """
+        x = np.linspace(0.1, 2, 1000)
+        def f(*x):
+            return sum(xi ** 2 for xi in x)
+        g = Reverse(f, *x)
+        assert np.allclose(g.val, np.sum(x ** 2))
+        assert np.allclose(g.der, 2 * x)
+
+    def test_grad_output_reused(self):
+        """ Testing Reverse class when an output is also used to compute another output
+        """
+        x = [2, 3]
+        def f(x1, x2):
+            y = x1 * x2
+            return [y, y * x1, x1]
+        g = Reverse(f, *x)
+        assert np.allclose(g.val, [6, 12, 2])
+        assert np.allclose(g.der, [[3, 2], [12, 4], [1, 0]])
+
+    def test_grad_shared_subexpressions(self):
+        """ Testing Reverse class on a 30-level doubling chain, which takes exponential time
+        without memoized adjoints
+        """
+        def f(x):
+            for _ in range(30):
+                x = x * x
+            return x
+        g = Reverse(f, 1.0)
+        assert g.val == 1.0 and g.der == 2. ** 30
+        # the sweep applies each partial derivative once, 2 ** 31 - 2 times without memoized adjoints
+        with trace(tape=[]) as context:
+            x = RNode(1.0)
+            y = f(x)
+        calls = []
+        def counted(partial):
+            def apply(adjoint):
+                calls.append(1)
+                return partial * adjoint
+            return apply
+        for node in context.tape:
+            node.parent = [(counted(partial), child) for partial, child in node.parent]
+        Reverse.backward(context.tape, y)
+        assert len(calls) == 60
+        assert x.der == 2. ** 30
+
+    def test_backward(self):
+        """ Testing the reverse sweep over a tape
+        """
+        with trace(tape=[]) as context:
+            x1 = RNode(5)
+            x2 = RNode(3)
+            f1 = x1 * x2 + x1
+            f2 = np.sin(x2)
+        tape = context.tape
+        RNode(1) * 2 # not recorded outside of the trace
+        assert len(tape) == 5
+        Reverse.backward(tape, f1)
+        assert x1.der == 4 and x2.der == 5 and f2.der == 0
+        Reverse.backward(tape, f2)
+        assert x1.der == 0 and np.isclose(x2.der, np.cos(3))
+
+    def test_deep_recurrence(self):
+        """ Testing Reverse class on a 1,000,000-step recurrence without raising the recursion limit
+        """
+        def f(x):
+            for _ in range(1000000):
+                x = x * 0.999999
+            return x
+        g = Reverse(f, 2.0)
+        assert np.isclose(g.val, 2.0 * 0.999999 ** 1000000)
+        assert np.isclose(g.der, 0.999999 ** 1000000)
+
+    def test_grad_repeated_outputs(self):
+        """ Testing Reverse class when outputs repeat or have equal values
+        """
+        x = [2, 3]
+        def f(x1, x2):
+            y = x1 * x2
+            return [y, x2 * x1, y, 6 * x1 / x1, x2]
+        g = Reverse(f, *x)
+        assert np.allclose(g.val, [6, 6, 6, 6, 3])
+        assert np.allclose(g.der, [[3, 2], [3, 2], [3, 2], [0, 0], [0, 1]])
+
+    def test_grad_many_outputs(self):
+        """ Testing Reverse class with a vector function of many outputs
+        """
+        x = [2., 3.]
+        def f(x1, x2):
+            return [k * x1 + x2 for k in range(500)]
+        g = Reverse(f, *x)
+        assert np.allclose(g.der[:, 0], np.arange(500))
+        assert np.allclose(g.der[:, 1], 1)
+
+    def test_batch(self):
+        """ Testing Reverse class over a batch of sample points against Forward
+        """
+        x1 = np.linspace(0.5, 1.5, 7)
+        x2 = np.linspace(1, 2, 7)
+        def f(x1, x2):
+            return [x1 * x2 + np.sin(x1) / x2, np.sqrt(x1) - x2 ** x1, 3, x2]
+        g = Reverse(f, x1, x2, batch=True)
+        h = Forward(f, x1, x2, batch=True)
+        assert g.val.shape == (7, 4) and g.der.shape == (7, 4, 2)
+        assert np.allclose(g.val, h.val)
+        assert np.allclose(g.der, h.der)
+
+        g = Reverse(lambda x, y: np.exp(x) * y, x1, 2., batch=True)
+        assert g.val.shape == (7,) and g.der.shape == (7, 2)
+        assert np.allclose(g.der[:, 0], 2 * np.exp(x1))
+        assert np.allclose(g.der[:, 1], np.exp(x1))
+
+        with pytest.raises(ValueError):
+            Reverse(lambda x: x, x1, flat=True, batch=True)
+
+    def test_vjp(self):
+        """
+        test Reverse.vjp against the full Jacobian, for single and batched cotangents
+        """
+        calls = []
+        def f(x1, x2, x3):
+            calls.append(1)
+            y = x1 * x2
+            return [y + np.sin(x3), np.exp(x1) / x2, y, 3]
+        x = [0.5, 2., 1.]
+        g = Reverse(f, *x)
+        calls.clear()
+        val, pullback = Reverse.vjp(f, x)
+        assert np.allclose(val, g.val)
+        u = np.array([1., -2., 0.5, 4.])
+        assert np.allclose(pullback(u), u @ g.der)
+        U = np.arange(12.).reshape(3, 4)
+        assert pullback(U).shape == (3, 3)
+        assert np.allclose(pullback(U), U @ g.der)
+        assert len(calls) == 1
+        with pytest.raises(ValueError):
+            pullback([1., 2.])
+
+        # scalar function, and an output that does not depend on all the variables
+        val, pullback = Reverse.vjp(lambda x, y: x ** 2, [3, 4])
+        assert val == 9
+        assert np.allclose(pullback(2.), [12., 0.])
+        assert np.allclose(pullback([1., 2.]), [[6., 0.], [12., 0.]])
+
+        # repeated output node
+        def f(x, y):
+            z = x * y
+            return [z, z]
+        val, pullback = Reverse.vjp(f, [2, 3])
+        assert np.allclose(pullback([1., 1.]), [6., 4.])
+
+    def test_numpy_functions(self):
+        """ Testing Reverse and Forward on functions written with numpy ufuncs and functions
+        """
+        def f(x, y):
+            return [np.maximum(x, y) ** 2, np.where(x > y, x, np.float64(2.) * y), np.add(np.tanh(x), y)]
+        for point in ([1., 2.], [3., -1.]):
+            r = Reverse(f, *point)
+            g = Forward(f, *point)
+            assert np.allclose(r.val, g.val) and np.allclose(r.der, g.der)
+        x = np.linspace(-1., 1., 5)
+        r = Reverse(lambda x, y: np.maximum(x * y, 0.), x, 2., batch=True)
+        g = Forward(lambda x, y: np.maximum(x * y, 0.), x, 2., batch=True)
+        assert np.allclose(r.der, g.der)
+        assert np.allclose(r.der[:, 0], np.where(x >= 0, 2., 0.))
+
+    def test_object_arrays(self):
+        """ Testing Reverse and Forward on numpy arrays that hold nodes, which are not constants
+        """
+        def f(x, y):
+            v = x * np.array([x, y])
+            return v[0] + v[1]
+        for g in (Reverse(f, 2, 3), Forward(f, 2, 3)):
+            assert g.val == 10
+            assert np.allclose(g.der, [7., 2.])
+
+        def h(x, y):
+            v = np.dot(x, np.array([x, y])) - np.maximum(y, np.array([x, 4.]))
+            return v[0] + v[1]
+        r = Reverse(h, 2, 3)
+        g = Forward(h, 2, 3)
+        assert r.val == g.val == 3
+        assert np.allclose(r.der, [7., 1.]) and np.allclose(g.der, [7., 1.])
+
+        # the methods take object arrays too
+        def m(x, y):
+            v = x.maximum(np.array([y, 1.], dtype=object)) + y.minimum(np.array([x, 4.], dtype=object))
+            return v[0] + v[1]
+        r = Reverse(m, 2, 3)
+        g = Forward(m, 2, 3)
+        assert r.val == g.val == 10
+        assert np.allclose(r.der, [2., 2.]) and np.allclose(g.der, [2., 2.])
+
+    def test_numpy_function_arguments(self):
+        """ Testing Reverse and Forward on numpy functions with arguments the derivative rules do not take
+        """
+        def f(x, y):
+            v = x * np.array([[1., 2.], [3., 4.]]) + y
+            return np.sum(np.sum(v, axis=1, keepdims=True) * np.mean(v, axis=0, keepdims=True))
+        r = Reverse(f, 2., 3.)
+        g = Forward(f, 2., 3.)
+        assert r.val == pytest.approx(g.val) and np.allclose(r.der, g.der)
+        assert np.sum(RNode(np.ones((2, 3))), keepdims=True).val.shape == (1, 1)
+        # other functions treat the nodes with scalar values as elements of object arrays
+        def h(x, y):
+            return np.sum(np.cumsum(np.stack([x, y, x * y]))) + np.prod([x, y])
+        for g in (Reverse(h, 2., 3.), Forward(h, 2., 3.)):
+            assert g.val == 24 and np.allclose(g.der, [9., 6.])
+        with pytest.raises(TypeError):
+            Forward(lambda x: np.cumsum(x * np.ones(3)), 1.)
+        with pytest.raises(TypeError):
+            Reverse(lambda x: np.reshape(x * np.ones((2, 2)), 4, order='F'), 1.)
@@ -49,7 +49,42 @@ class TestRNode:
         x5 = RNode(3)
         x6 = x4 * x5
         assert x4.grad([]) == 3.0 and x5.grad([]) == 5.0
+
+    def test_grad_shared_subexpressions(self):
+        """Test that grad visits each node once on a 30-level doubling chain"""
+        x = RNode(1.0)
+        y = x
+        nodes = [x]
+        for _ in range(30):
+            y = y * y
+            nodes.append(y)
+        # count the partial derivatives applied, 2 ** 31 - 2 without memoized adjoints
+        calls = []
+        def counted(partial):
+            def apply(adjoint):
+                calls.append(1)
+                return partial * adjoint
+            return apply
+        for node in nodes:
+            node.parent = [(counted(partial), child) for partial, child in node.parent]
+        output_depend = []
+        der = x.grad(output_depend)
+        assert len(calls) == 60
+        assert der == 2. ** 30
+        assert output_depend == [y] and len(output_depend) == 1
     
+    def test_grad_deep_graph(self):
+        """Test grad and clear on a graph deeper than the recursion limit"""
+        x = RNode(2.0)
+        y = x
+        for _ in range(100000):
+            y = y * 0.99999
+        output_depend = []
+        assert np.isclose(x.grad(output_depend), 0.99999 ** 100000)
+        assert output_depend == [y]
+        x.clear()
+        assert x.der is None and y.der is None
+
     def test_neg(self):
         """Test for overloading negation operator"""
         x1 = RNode(5)
@@ -501,4 +536,66 @@ class TestRNode:
 
     def test_repr(self):
         x1 = RNode(5)
-        assert repr(x1) == f'An RNode object with value of {x1.val}, and {len(x1.parent)} parent(s) with derivatives and locations in {x1.parent}.'
\ No newline at end of file
+        assert repr(x1) == f'An RNode object with value of {x1.val}, and {len(x1.parent)} parent(s) with derivatives and locations in {x1.parent}.'
+
+    def test_hash(self):
+        x1 = RNode(5)
+        x2 = RNode(5)
+        assert x1 == x2
+        assert hash(x1) != hash(x2)
+        assert len({x1, x2, x1}) == 2
+        assert {x1: 1, x2: 2}[x1] == 1
+
+    def test_memory_per_operation(self):
+        """Test that an RNode holds no instance dictionary,
+        see benchmarks/memory_per_operation.py for the memory per operation"""
+        x = RNode(0.5)
+        y = x * 1.0001 + 0.1
+        assert not hasattr(x, '__dict__') and not hasattr(y, '__dict__')
+        assert set(RNode.__slots__) == {'val', 'der', 'parent'}
+
+    def test_array_ufunc(self):
+        """Test that numpy ufuncs and functions dispatch to the RNode rules"""
+        x1 = RNode(2.)
+        x2 = RNode(3.)
+        f = np.maximum(x1, x2) * np.float64(2.) + np.minimum(x1, 1.) + np.sin(x1)
+        assert isinstance(f, RNode)
+        assert np.isclose(x1.grad([f]), np.cos(2.)) and x2.grad([f]) == 2.
+
+        x = RNode(np.array([1., 2., 3.]))
+        f = np.sum(x * x) + np.dot(x, np.array([1., 0., 1.])) + np.sum(np.where(x.val > 1.5, x, 0.))
+        f.der = 1.
+        assert np.allclose(x.grad([]), [3., 5., 8.])
+        with pytest.raises(TypeError):
+            np.dot(RNode(np.ones((2, 2, 2))), x)
+
+    def test_tensor_operations(self):
+        """Test RNodes with matrix values: the adjoints of matmul, sum and mean along an axis, reshape,
+        indexing and transpose, and the sum over broadcast axes"""
+        from AutoDiff import Node, Reverse
+        from AutoDiff.context import trace
+        rng = np.random.default_rng(0)
+        W, x, b = rng.normal(size=(2, 3)), rng.normal(size=3), rng.normal(size=2)
+        with trace(tape=[]) as context:
+            Wr, xr, br = RNode(W), RNode(x), RNode(b)
+            h = np.tanh(Wr @ xr + br)
+            f = np.mean(h * h) + np.sum((Wr.T @ h)[1:]) + np.sum(np.sum(Wr, axis=1) * 2.) \
+                + np.sum(Wr.reshape(6)[np.array([0, 0, 5])])
+        Reverse.backward(context.tape, f)
+        # the same function in forward mode, one tangent per entry of W, x and b
+        seeds = np.eye(11)
+        Wn, xn, bn = Node(W, seeds[:, :6].reshape(11, 2, 3)), Node(x, seeds[:, 6:9]), Node(b, seeds[:, 9:])
+        h = np.tanh(Wn @ xn + bn)
+        g = np.mean(h * h) + np.sum((Wn.T @ h)[1:]) + np.sum(np.sum(Wn, axis=1) * 2.) \
+            + np.sum(Wn.reshape(6)[np.array([0, 0, 5])])
+        assert np.isclose(f.val, g.val)
+        assert np.allclose(Wr.der, g.der[:6].reshape(2, 3))
+        assert np.allclose(xr.der, g.der[6:9]) and np.allclose(br.der, g.der[9:])
+        # broadcast operands get their adjoints summed back to their shapes
+        with trace(tape=[]) as context:
+            s, v, r = RNode(2.), RNode(np.array([1., 2., 3.])), RNode(np.ones((1, 3)))
+            f = np.sum(s * v + s) + np.sum(np.mean(r * np.ones((2, 3)), axis=0)) + np.sum(np.where(v.val > 1., s, 0.))
+        Reverse.backward(context.tape, f)
+        assert s.der == 11. and np.allclose(v.der, 2.) and np.allclose(r.der, [[1., 1., 1.]])
+        with pytest.raises(TypeError):
+            RNode(np.ones(2)) @ 2.
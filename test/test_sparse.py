@@ -0,0 +1,123 @@
+import pytest
+import numpy as np
+from AutoDiff import Forward, Node, SparseForward, IndexSet, SparseTangent
+
+class TestSparse:
+    """This is a class that tests sparse Jacobians with sparsity detection and column coloring.
+    """
+
+    def test_index_set(self):
+        """Test that the derivative arithmetic of Nodes takes the union of the dependencies"""
+        x1 = Node(2., IndexSet([0]))
+        x2 = Node(3., IndexSet([1]))
+        x3 = Node(0.5, IndexSet([2]))
+        assert (x1 * x2).der == IndexSet([0, 1])
+        assert (np.sin(x1) / x2 - 4).der == IndexSet([0, 1])
+        assert (2 ** x3 + x1 ** 2).der == IndexSet([0, 2])
+        assert (-np.exp(x3) * np.float64(2.)).der == IndexSet([2])
+        assert list((x3 - x1).der) == [0, 2]
+        assert repr(IndexSet([3, 1])) == 'IndexSet([1, 3])'
+
+    def test_pattern(self):
+        """Test the detected sparsity pattern, including outputs that are constants"""
+        def f(x1, x2, x3):
+            return [x1 * x2, 5, x3 ** 2, x1 - x1]
+        n, rows, cols = SparseForward.pattern(f, 1., 2., 3.)
+        assert n == 4
+        assert rows.tolist() == [0, 0, 2, 3]
+        assert cols.tolist() == [0, 1, 2, 0]
+
+    def test_color(self):
+        """Test that no two columns of a group share a row"""
+        rng = np.random.default_rng(0)
+        mask = rng.random((30, 40)) < 0.1
+        rows, cols = np.nonzero(mask)
+        colors = SparseForward.color(rows, cols, 40)
+        for i in range(30):
+            groups = colors[mask[i]]
+            assert len(groups) == len(set(groups))
+
+    def test_matches_forward(self):
+        """Test the sparse Jacobian against the dense forward mode"""
+        def f(x1, x2, x3, x4):
+            return [x1 * x2, np.sin(x3) + x4, 7, x4 ** 2 / x1, np.exp(x2)]
+        x = [0.5, 1., 1.5, 2.]
+        g = SparseForward(f, *x)
+        h = Forward(f, *x)
+        assert np.allclose(g.val, h.val)
+        assert g.shape == (5, 4)
+        assert np.allclose(g.toarray(), h.der)
+        assert g.n_colors < 4
+
+        # scalar function
+        g = SparseForward(lambda x, y, z: x * y + z, 1, 2, 3)
+        assert g.val == 5 and g.shape == (1, 3)
+        assert np.allclose(g.toarray(), [[2., 1., 1.]])
+
+    def test_banded(self):
+        """Test that a tridiagonal Jacobian of 1000 variables needs 3 seed directions"""
+        m = 1000
+        def f(*x):
+            return [x[i - 1] - 2 * x[i] * x[i] + x[i + 1] if 0 < i < m - 1 else x[i] for i in range(m)]
+        x = np.linspace(0, 1, m)
+        g = SparseForward(f, *x)
+        assert g.n_colors == 3
+        assert len(g.data) == 3 * m - 4
+        der = g.toarray()
+        assert np.allclose(np.diag(der), [1.] + list(-4 * x[1:-1]) + [1.])
+        assert np.allclose(np.diag(der, 1)[1:], 1.) and np.allclose(np.diag(der, -1)[:-1], 1.)
+
+        # reuse the pattern at another point
+        h = SparseForward(f, *(x + 1), pattern=(g.rows, g.cols))
+        assert np.allclose(np.diag(h.toarray())[1:-1], -4 * (x[1:-1] + 1))
+        with pytest.raises(ValueError):
+            SparseForward(lambda *x: [x[0]], *x, pattern=SparseForward.pattern(f, *x)[1:])
+
+    def test_sparse_tangent(self):
+        """Test the arithmetic of SparseTangent against dense derivatives"""
+        a = SparseTangent([0, 3], [1., 2.])
+        b = SparseTangent([1, 3], [4., 5.])
+        assert np.allclose((a + b).toarray(5), [1., 4., 0., 7., 0.])
+        assert np.allclose((a - b).toarray(5), [1., -4., 0., -3., 0.])
+        assert np.allclose((np.float64(2.) * a / 4 - a * 3).toarray(4), [-2.5, 0., 0., -5.])
+        assert np.allclose((-a).values, [-1., -2.])
+        assert (a + 0) is a and len(a + b) == 3
+
+    def test_forward_sparse(self):
+        """Test that forward mode with sparse tangents matches the dense derivatives"""
+        def f(x1, x2, x3, x4):
+            y = x1 * x2 - np.log(x3)
+            return [y / x4, np.sin(x4) ** 2, 3, 1 - x2, 2 ** x1]
+        x = [0.5, 1., 1.5, 2.]
+        g = Forward(f, *x)
+        h = Forward(f, *x, sparse=True)
+        assert np.allclose(h.val, g.val)
+        assert np.allclose(h.der, g.der)
+        assert isinstance(h.output[0].der, SparseTangent)
+        assert h.output[0].der.indices.tolist() == [0, 1, 2, 3]
+
+        h = Forward(lambda x, y: x * y, 2, 3, sparse=True)
+        assert h.val == 6 and np.allclose(h.der, [3., 2.])
+        h = Forward(lambda x: np.exp(x), 0, sparse=True)
+        assert h.val == 1 and np.isclose(h.der, 1.)
+
+        with pytest.raises(ValueError):
+            Forward(f, *x, sparse=True, chunk_size=2)
+        with pytest.raises(ValueError):
+            Forward(f, *x, sparse=True, batch=True)
+
+    def test_forward_sparse_separable(self):
+        """Test that the terms of a partially separable function of 2000 variables carry two entries"""
+        m = 2000
+        sizes = []
+        def f(*x):
+            terms = [(x[i] - x[i + 1]) ** 2 for i in range(m - 1)]
+            sizes.extend(len(t.der) for t in terms)
+            return terms[:3] + [x[0] * x[-1]]
+        x = np.linspace(0, 1, m)
+        g = Forward(f, *x, sparse=True)
+        assert max(sizes) == 2
+        assert g.der.shape == (4, m)
+        assert np.allclose(g.der[0, :2], [2 * (x[0] - x[1]), -2 * (x[0] - x[1])])
+        assert np.allclose(g.der[3, [0, -1]], [x[-1], x[0]])
+        assert np.count_nonzero(g.der[3]) == 1 # x[0] = 0
@@ -0,0 +1,54 @@
+import pytest
+import numpy as np
+from AutoDiff import Node, SmallTangent
+
+class TestSmallTangent:
+    """This is a class that tests the unrolled derivatives of fixed length used by forward mode.
+    """
+
+    def test_of(self):
+        """Test building SmallTangents of every supported length"""
+        for m in range(2, SmallTangent.max_size + 1):
+            t = SmallTangent.of(np.arange(m))
+            assert len(t) == m
+            assert np.array_equal(t.toarray(), np.arange(m))
+            assert np.array_equal(np.asarray(t), np.arange(m))
+        assert repr(SmallTangent.of([1, 0])) == 'SmallTangent(1.0, 0.0)'
+        assert np.array_equal(np.stack(SmallTangent.seeds(3)), np.eye(3))
+        with pytest.raises(ValueError):
+            SmallTangent.of([1.])
+        with pytest.raises(ValueError):
+            SmallTangent.of([1.] * 5)
+
+    def test_arithmetic(self):
+        """Test the operations the Node rules apply to derivatives against dense arrays"""
+        a, b = [1., -2., 3.], [0.5, 4., -1.]
+        s, t = SmallTangent.of(a), SmallTangent.of(b)
+        a, b = np.array(a), np.array(b)
+        assert np.allclose(s + t, a + b)
+        assert np.allclose(s - t, a - b)
+        assert np.allclose(-s, -a)
+        assert np.allclose(s * 2, a * 2) and np.allclose(2 * s, a * 2)
+        assert np.allclose(s * np.float64(1.5), a * 1.5) and np.allclose(np.float64(1.5) * s, a * 1.5)
+        assert np.allclose(s / 4, a / 4)
+        assert type(s * 2) is type(s)
+        # the derivative of a constant is 0
+        assert s + 0 is s and 0 + s is s and s - 0 is s
+        assert np.allclose(0 - s, -a)
+        # arrays give dense arrays with the tangent axis first
+        assert np.allclose(s + a, 2 * a) and np.allclose(a - s, 0.)
+        assert np.allclose(s * np.array([1., 2.]), np.multiply.outer(a, [1., 2.]))
+        assert np.allclose(s / np.array([1., 2.]), np.multiply.outer(a, [1., 0.5]))
+        with pytest.raises(TypeError):
+            s + SmallTangent.of([1., 2.])
+
+    def test_node(self):
+        """Test Nodes with SmallTangent derivatives against Nodes with array derivatives"""
+        def f(x, y):
+            z = np.sin(x) * y ** 2 / (1 + np.exp(-x)) - 3 * y
+            return np.sqrt(z * z + 1) - x ** 0.5 + 2 ** y
+        small = f(*(Node(v, d) for v, d in zip((0.7, 1.3), SmallTangent.seeds(2))))
+        dense = f(*(Node(v, d) for v, d in zip((0.7, 1.3), np.eye(2))))
+        assert isinstance(small.der, SmallTangent)
+        assert small.val == pytest.approx(dense.val)
+        assert np.allclose(small.der, dense.der)
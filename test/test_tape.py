@@ -0,0 +1,150 @@
+import pytest
+import numpy as np
+from AutoDiff import Reverse, RNode, Tape, TNode
+from AutoDiff.context import trace
+
+class TestTape:
+    """This is a class that tests the flat array-backed tape for reverse mode calculation of
+    automatic differentiation and the TNode handles recorded on it.
+    """
+
+    def test_init(self):
+        """Test for constructor method"""
+        tape = Tape(capacity=4)
+        assert len(tape) == 0 and tape.size == 0
+        x1 = tape.variable(5)
+        assert isinstance(x1, TNode)
+        assert x1.val == 5 and x1.index == 0 and x1.tape is tape
+        assert len(tape) == 1
+
+    def test_str(self):
+        tape = Tape()
+        x1 = tape.variable(5)
+        assert str(tape) == 'Tape: 1 entries, capacity 1024.'
+        assert repr(tape) == 'A Tape object with 1 entries and capacity of 1024.'
+        assert str(x1) == 'TNode: index=0, val=5.'
+        assert repr(x1) == 'A TNode object with value of 5 at index 0 of the tape.'
+
+    def test_grow(self):
+        """Test that the arrays of the tape grow when full"""
+        tape = Tape(capacity=2)
+        x = tape.variable(1.0)
+        for _ in range(100):
+            x = x + 1
+        assert len(tape) == 101 and len(tape.op) >= 101
+        assert x.val == 101
+        assert tape.backward(x.index)[0] == 1
+
+    def test_backward(self):
+        """Test for the reverse sweep over the tape arrays"""
+        tape = Tape()
+        x1 = tape.variable(5)
+        x2 = tape.variable(3)
+        f1 = x1 * x2 + x1
+        f2 = np.sin(x2)
+        assert tape.backward(f1.index) == [4, 5, 1, 1]
+        adjoint = tape.backward(f2.index)
+        assert adjoint[0] == 0 and np.isclose(adjoint[1], np.cos(3))
+
+    def test_operators(self):
+        """Test that every operator matches the RNode graph"""
+        x = [0.3, 4, 5]
+        def f(a, b, c):
+            return [np.exp(5 * c), b ** 3, 2 * np.sqrt(a), a / b, 2 / c, 3 - a, b - 1, 2 ** b,
+                a ** b, np.log(a), a.log(2), np.tan(a), np.arcsin(a), np.arccos(a), np.arctan(c),
+                np.sinh(a), np.cosh(a), np.tanh(b), a.logistic(), -a, a - b, a + b, 1 + a, a * 2]
+        g1 = Reverse(f, *x)
+        g2 = Reverse(f, *x, flat=True)
+        assert np.allclose(g1.val, g2.val)
+        assert np.allclose(g1.der, g2.der)
+
+    def test_reverse_flat(self):
+        """Test Reverse with the flat tape keeps the shapes of the RNode graph"""
+        cases = [
+            (lambda x: x ** 2, [2.]),
+            (lambda x, y: x * y, [2., 3.]),
+            (lambda x: [x * x], [2.]),
+            (lambda x, y: [x * y], [2., 3.]),
+            (lambda x: [x * x, x + 1, 3], [2.]),
+            (lambda x, y: [x * y, 4, y, x], [2., 3.]),
+            (lambda x, y: x, [2., 3.]),
+        ]
+        for f, x in cases:
+            g1 = Reverse(f, *x)
+            g2 = Reverse(f, *x, flat=True)
+            assert np.shape(g1.der) == np.shape(g2.der)
+            assert np.allclose(g1.der, g2.der)
+            assert np.allclose(g1.val, g2.val)
+
+    def test_exceptions(self):
+        tape = Tape()
+        x1 = tape.variable(-1)
+        x2 = tape.variable(0)
+        with pytest.raises(ValueError):
+            np.sqrt(x1)
+        with pytest.raises(ValueError):
+            np.log(x1)
+        with pytest.raises(ValueError):
+            np.arcsin(x1 * 2)
+        with pytest.raises(ValueError):
+            np.arccos(x1 * 2)
+        with pytest.raises(ValueError):
+            np.tan(tape.variable(np.pi / 2))
+        with pytest.raises(ZeroDivisionError):
+            x1 / x2
+        with pytest.raises(ZeroDivisionError):
+            x1 / 0
+        with pytest.raises(ZeroDivisionError):
+            1 / x2
+        for op in ['__add__', '__sub__', '__mul__', '__truediv__', '__pow__', '__rsub__',
+                   '__rtruediv__', '__rpow__', '__lt__', '__gt__', '__le__', '__ge__', '__eq__', '__ne__']:
+            with pytest.raises(TypeError):
+                getattr(x1, op)('1')
+
+    def test_comparisons(self):
+        tape = Tape()
+        x1 = tape.variable(3)
+        x2 = tape.variable(5)
+        assert x1 < x2 and x2 > x1 and x1 <= 3 and x2 >= 5 and x1 == 3 and x1 != x2
+        assert len({x1, x2, x1}) == 2
+
+    def test_memory_per_operation(self, bytes_per_operation):
+        """Benchmark the memory of a recorded operation against the RNode graph"""
+        n = 20000
+
+        def record_rnodes():
+            with trace(tape=[]) as context:
+                x = RNode(2.0)
+                for _ in range(n):
+                    x = x * 0.999
+            return context.tape
+
+        def record_tape():
+            tape = Tape(capacity=n + 1)
+            x = tape.variable(2.0)
+            for _ in range(n):
+                x = x * 0.999
+            return tape
+
+        assert bytes_per_operation(record_tape, n) * 5 < bytes_per_operation(record_rnodes, n)
+
+    def test_replay(self):
+        """Test replaying the recorded operations at new inputs"""
+        tape = Tape()
+        x1 = tape.variable(2)
+        x2 = tape.variable(3)
+        f1 = x1 * x2 + np.sin(x1)
+        assert np.allclose(tape.replay([1, 5]), [1, 5, 5, np.sin(1), 5 + np.sin(1)])
+        adjoint = tape.backward(f1.index)
+        assert np.allclose(adjoint[:2], [5 + np.cos(1), 1])
+        with pytest.raises(ValueError):
+            tape.replay([1])
+
+    def test_replay_guards(self):
+        """Test that replay stops when a recorded comparison changes its result"""
+        tape = Tape()
+        x1 = tape.variable(2)
+        f1 = x1 * x1 if x1 > 0 else -x1
+        assert len(tape.guards) == 1
+        assert tape.replay([3]) == [3, 9]
+        assert tape.replay([-3]) is None